@@ -0,0 +1,193 @@
+"""
+FFT/FF16 번역 도구 명령줄 실행 파일 (GUI 없이 언팩→CSV→검증→적용→팩 파이프라인 실행)
+
+사용법:
+    python cli.py unpack <pac_file> <output_folder> [--no-nxd] [--no-pzd]
+    python cli.py csv <source_folder> <output_folder> [--no-recursive] [--deduplicate] [--reference FOLDER ...]
+    python cli.py validate <csv_folder> [--consistency] [--glossary FILE] [--output FILE]
+    python cli.py replace <csv_folder> <find_text> <replace_text> [--translated-only]
+    python cli.py apply <csv_folder> <source_folder> <output_pac> [--skip-packing] ...
+
+PyQt6를 가져오지 않으며, 각 명령에 필요한 모듈은 명령 실행 시점에만 가져옵니다.
+"""
+import sys
+import argparse
+import multiprocessing
+
+
+def print_message(message):
+    """진행 상황 콜백 (표준 출력)"""
+    print(message, flush=True)
+
+
+def cmd_unpack(args):
+    """PAC 언팩 및 NXD/PZD 변환"""
+    from core.pac_handler import PACHandler
+
+    success = PACHandler().unpack_and_convert(
+        args.pac_file,
+        args.output_folder,
+        convert_nxd=not args.no_nxd,
+        convert_pzd=not args.no_pzd,
+        game=args.game,
+        callback=print_message
+    )
+    return 0 if success else 1
+
+
+def cmd_csv(args):
+    """JSON/YAML → CSV 생성"""
+    from core.csv_handler import CSVHandler
+
+    csv_handler = CSVHandler()
+    if args.regenerate:
+        stats = csv_handler.regenerate_csvs(args.source_folder, args.output_folder, args.recursive,
+                                            args.deduplicate, args.reference)
+        print_message(", ".join(f"{key}={value}" for key, value in stats.items()))
+        csv_count = stats['csv_count']
+    else:
+        csv_count = csv_handler.generate_csvs(args.source_folder, args.output_folder, args.recursive,
+                                              args.deduplicate, args.reference)
+    print_message(f"Generated {csv_count} CSV files: {args.output_folder}")
+    return 0 if csv_count else 1
+
+
+def cmd_validate(args):
+    """번역 검증 (문제가 있으면 종료 코드 2)"""
+    from core.validator import CSVValidator
+
+    validator = CSVValidator()
+    results = validator.validate_csv(args.csv_folder)
+
+    if args.consistency:
+        results.extend(validator.find_inconsistent_translations(args.csv_folder))
+
+    if args.glossary:
+        from core.glossary import GlossaryChecker
+        checker = GlossaryChecker()
+        checker.load(args.glossary)
+        results.extend(checker.check_folder(args.csv_folder))
+
+    # iter_detailed_lines는 줄바꿈이 포함된 묶음을 반환
+    for chunk in validator.iter_detailed_lines(results):
+        sys.stdout.write(chunk)
+
+    if args.output:
+        validator.export_validation_result(results, args.output)
+        print_message(f"Saved validation result: {args.output}")
+
+    print_message(f"{len(results)} issues found")
+    return 2 if results else 0
+
+
+def cmd_replace(args):
+    """CSV 일괄 치환"""
+    from core.csv_handler import CSVHandler
+
+    count = CSVHandler().batch_replace(args.csv_folder, args.find_text, args.replace_text,
+                                       translated_only=args.translated_only)
+    print_message(f"Replaced in {count} files")
+    return 0
+
+
+def cmd_apply(args):
+    """번역 적용 및 PAC 팩킹"""
+    from core.pac_handler import PACHandler
+
+    success = PACHandler().apply_translation_and_pack(
+        args.csv_folder,
+        args.source_folder,
+        args.output_pac,
+        delete_yaml_json=args.delete_yaml_json,
+        delete_other=args.delete_other,
+        apply_yaml=not args.no_yaml,
+        apply_json=not args.no_json,
+        skip_packing=args.skip_packing,
+        game=args.game,
+        callback=print_message
+    )
+    return 0 if success else 1
+
+
+def build_parser():
+    """명령줄 인자 파서 생성"""
+    parser = argparse.ArgumentParser(
+        prog='cli.py',
+        description='FFT/FF16 translation tool (headless)'
+    )
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    unpack = subparsers.add_parser('unpack', help='unpack a PAC file and convert NXD/PZD')
+    unpack.add_argument('pac_file')
+    unpack.add_argument('output_folder')
+    unpack.add_argument('--no-nxd', action='store_true', help='skip NXD → JSON conversion')
+    unpack.add_argument('--no-pzd', action='store_true', help='skip PZD → YAML conversion')
+    unpack.add_argument('--game', default='fft', choices=['fft', 'ff16'])
+    unpack.set_defaults(func=cmd_unpack)
+
+    csv_parser = subparsers.add_parser('csv', help='generate CSV files from JSON/YAML')
+    csv_parser.add_argument('source_folder')
+    csv_parser.add_argument('output_folder', help='CSV folder or project DB file')
+    csv_parser.add_argument('--no-recursive', dest='recursive', action='store_false',
+                            help='only scan the top folder (default: include subfolders, same as the GUI)')
+    # 이전 옵션 호환 (기본값이 하위 폴더 포함이므로 효과 없음)
+    csv_parser.add_argument('--recursive', dest='recursive', action='store_true', help=argparse.SUPPRESS)
+    csv_parser.add_argument('--deduplicate', action='store_true', help='merge rows with the same original text')
+    csv_parser.add_argument('--regenerate', action='store_true',
+                            help='update existing CSV files and keep translations')
+    csv_parser.add_argument('--reference', action='append', default=[], metavar='FOLDER',
+                            help='unpacked folder of another language (adds Ref_<lang> column, repeatable)')
+    csv_parser.set_defaults(func=cmd_csv)
+
+    validate = subparsers.add_parser('validate', help='validate translations (exit code 2 if issues found)')
+    validate.add_argument('csv_folder', help='CSV folder or project DB file')
+    validate.add_argument('--consistency', action='store_true', help='also check inconsistent translations')
+    validate.add_argument('--glossary', metavar='FILE', help='glossary CSV to enforce')
+    validate.add_argument('--output', metavar='FILE', help='save result (.txt/.csv/.json)')
+    validate.set_defaults(func=cmd_validate)
+
+    replace = subparsers.add_parser('replace', help='batch replace text in CSV files')
+    replace.add_argument('csv_folder', help='CSV folder or project DB file')
+    replace.add_argument('find_text')
+    replace.add_argument('replace_text')
+    replace.add_argument('--translated-only', action='store_true', help='only change the Translation column')
+    replace.set_defaults(func=cmd_replace)
+
+    apply = subparsers.add_parser('apply', help='apply translations and pack a PAC file')
+    apply.add_argument('csv_folder', help='CSV folder or project DB file')
+    apply.add_argument('source_folder', help='unpacked YAML/JSON folder')
+    apply.add_argument('output_pac')
+    apply.add_argument('--no-yaml', action='store_true', help='do not apply CSV to YAML files')
+    apply.add_argument('--no-json', action='store_true', help='do not apply CSV to JSON files')
+    apply.add_argument('--delete-yaml-json', action='store_true', help='delete YAML/JSON after conversion')
+    apply.add_argument('--delete-other', action='store_true', help='delete other intermediate files')
+    apply.add_argument('--skip-packing', action='store_true', help='apply translations without packing')
+    apply.add_argument('--game', default='fft', choices=['fft', 'ff16'])
+    apply.set_defaults(func=cmd_apply)
+
+    return parser
+
+
+def main(argv=None):
+    """메인 함수"""
+    args = build_parser().parse_args(argv)
+
+    from utils.logger import get_logger
+    logger = get_logger()
+    logger.info(f"CLI 실행: {args.command}")
+
+    try:
+        return args.func(args)
+    except KeyboardInterrupt:
+        print_message("Interrupted")
+        return 130
+    except Exception as e:
+        logger.error(f"CLI 실행 실패 ({args.command}): {e}")
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    # 프로세스 풀을 쓰는 작업의 자식 프로세스 지원
+    multiprocessing.freeze_support()
+    sys.exit(main())
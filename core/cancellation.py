@@ -0,0 +1,104 @@
+"""
+작업 취소 모듈 (워커 → PACHandler/Converter → 외부 도구 프로세스까지 전달되는 취소 토큰)
+"""
+import threading
+
+
+class OperationCancelled(Exception):
+    """사용자가 작업을 취소함"""
+
+
+class CancellationToken:
+    """
+    협조적 취소 토큰
+
+    cancel()을 호출하면 플래그가 켜지고, 등록된 외부 도구 프로세스는 즉시 종료 요청을 받습니다.
+    작업 코드는 파일/단계 사이에서 raise_if_cancelled()로 확인합니다.
+    """
+
+    # 종료 요청 후 강제 종료까지 기다리는 시간 (초)
+    TERMINATE_TIMEOUT = 0.5
+
+    def __init__(self):
+        """취소 토큰 초기화"""
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._processes = set()
+
+    def cancel(self):
+        """취소 요청 (실행 중인 외부 도구 프로세스 종료)"""
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._event.set()
+            processes = list(self._processes)
+
+        self._stop(processes)
+
+    def is_cancelled(self):
+        """취소 요청 여부"""
+        return self._event.is_set()
+
+    def raise_if_cancelled(self):
+        """취소되었으면 OperationCancelled 발생"""
+        if self._event.is_set():
+            raise OperationCancelled()
+
+    def register_process(self, process):
+        """
+        취소 시 종료할 프로세스 등록 (이미 취소되었으면 바로 종료)
+
+        Args:
+            process: subprocess.Popen 인스턴스
+        """
+        with self._lock:
+            if not self._event.is_set():
+                self._processes.add(process)
+                return
+        self._stop([process])
+
+    def unregister_process(self, process):
+        """
+        프로세스 등록 해제 (프로세스가 끝난 뒤 호출)
+
+        Args:
+            process: subprocess.Popen 인스턴스
+        """
+        with self._lock:
+            self._processes.discard(process)
+
+    def _stop(self, processes):
+        """프로세스 종료 요청 후 TERMINATE_TIMEOUT 안에 끝나지 않으면 강제 종료"""
+        if not processes:
+            return
+        for process in processes:
+            self._signal(process, process.terminate)
+
+        timer = threading.Timer(self.TERMINATE_TIMEOUT, self._kill, (processes,))
+        timer.daemon = True
+        timer.start()
+
+    def _kill(self, processes):
+        """아직 살아 있는 프로세스 강제 종료"""
+        for process in processes:
+            self._signal(process, process.kill)
+
+    @staticmethod
+    def _signal(process, method):
+        """실행 중인 프로세스에만 종료 시그널 전송"""
+        if process.poll() is None:
+            try:
+                method()
+            except OSError:
+                pass
+
+
+def check_cancelled(cancel_token):
+    """
+    토큰이 있고 취소되었으면 OperationCancelled 발생
+
+    Args:
+        cancel_token: CancellationToken 또는 None
+    """
+    if cancel_token is not None:
+        cancel_token.raise_if_cancelled()
@@ -3,49 +3,75 @@
 """
 import json
 import os
+import time
+import atexit
+import threading
 from pathlib import Path
 from utils.logger import get_logger
 
 
 class ConfigManager:
-    """설정 파일 관리 클래스"""
+    """
+    설정 파일 관리 클래스
 
-    def __init__(self, config_file='config.json'):
+    set()은 메모리의 설정만 바꾸고 저장은 SAVE_DELAY 뒤에 한 번에 합니다.
+    (연속 변경은 최대 SAVE_MAX_DELAY까지 묶임) 저장은 임시 파일에 쓴 뒤 교체하며,
+    남은 변경은 flush() 또는 프로그램 종료 시 저장됩니다.
+    """
+
+    # 마지막 변경 후 저장까지 기다리는 시간 (초)
+    SAVE_DELAY = 0.5
+    # 첫 변경 후 저장을 미룰 수 있는 최대 시간 (초)
+    SAVE_MAX_DELAY = 2.0
+
+    def __init__(self, config_file='config.json', auto_detect=True):
         """
         설정 관리자 초기화
 
         Args:
             config_file: 설정 파일 경로
+            auto_detect: 외부 도구 자동 탐지 여부 (False면 detect_tools를 따로 호출)
         """
         self.config_file = Path(config_file)
         self.logger = get_logger()
+        self._lock = threading.RLock()
+        self._save_timer = None
+        self._dirty_since = None
+        self._saved_text = None  # 마지막으로 읽거나 쓴 파일 내용 (같으면 쓰지 않음)
         self.config = self._load_config()
-        self._auto_detect_tools()
+        self.logger.set_level(self.config.get('log_level'))
+        atexit.register(self.flush)
+        if auto_detect:
+            self.detect_tools()
 
     def _load_config(self):
-        """설정 파일 로드"""
-        if not self.config_file.exists():
-            self.logger.warning(f"설정 파일이 존재하지 않습니다: {self.config_file}")
-            return self._get_default_config()
-
+        """설정 파일 로드 (없는 키는 기본값으로 채움, 파일은 쓰지 않음)"""
+        config = self._get_default_config()
         try:
             with open(self.config_file, 'r', encoding='utf-8') as f:
-                config = json.load(f)
+                text = f.read()
+            config.update(json.loads(text))
+            self._saved_text = text
             self.logger.info("설정 파일 로드 완료")
-            return config
+        except FileNotFoundError:
+            self.logger.warning(f"설정 파일이 존재하지 않습니다: {self.config_file}")
         except Exception as e:
             self.logger.error(f"설정 파일 로드 실패: {e}")
-            return self._get_default_config()
+        return config
 
     def _get_default_config(self):
         """기본 설정 반환"""
         return {
             "language": "ko",
+            "log_level": "DEBUG",
             "ff16tools_path": "",
             "ffttic_nxdtext_path": "",
             "default_game_folder": "",
             "default_unpack_folder": "",
             "default_csv_folder": "",
+            "byte_budgets": {},
+            "max_concurrent_jobs": 2,
+            "max_tool_processes": 0,
             "last_used_paths": {
                 "pac_input": "",
                 "pac_output": "",
@@ -55,15 +81,65 @@ class ConfigManager:
         }
 
     def save_config(self):
-        """설정 파일 저장"""
-        try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=2, ensure_ascii=False)
-            self.logger.info("설정 파일 저장 완료")
-            return True
-        except Exception as e:
-            self.logger.error(f"설정 파일 저장 실패: {e}")
-            return False
+        """
+        설정 파일 즉시 저장 (임시 파일에 쓴 뒤 교체, 내용이 같으면 건너뜀)
+
+        Returns:
+            성공 여부
+        """
+        with self._lock:
+            text = json.dumps(self.config, indent=2, ensure_ascii=False)
+            if text == self._saved_text:
+                return True
+
+            temp_file = self.config_file.with_name(f".{self.config_file.name}.{os.getpid()}.tmp")
+            try:
+                with open(temp_file, 'w', encoding='utf-8') as f:
+                    f.write(text)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp_file, self.config_file)
+                self._saved_text = text
+                self.logger.info("설정 파일 저장 완료")
+                return True
+            except Exception as e:
+                self.logger.error(f"설정 파일 저장 실패: {e}")
+                try:
+                    temp_file.unlink(missing_ok=True)
+                except OSError:
+                    pass
+                return False
+
+    def flush(self):
+        """
+        예약된 저장이 있으면 바로 저장
+
+        Returns:
+            성공 여부
+        """
+        with self._lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if self._dirty_since is None:
+                return True
+            self._dirty_since = None
+            return self.save_config()
+
+    def _schedule_save(self):
+        """변경 후 저장 예약 (SAVE_DELAY 안에 다시 바뀌면 미룸, 최대 SAVE_MAX_DELAY)"""
+        with self._lock:
+            now = time.monotonic()
+            if self._dirty_since is None:
+                self._dirty_since = now
+            elif self._save_timer is not None and now - self._dirty_since >= self.SAVE_MAX_DELAY:
+                return
+
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(self.SAVE_DELAY, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
 
     def get(self, key, default=None):
         """설정 값 가져오기"""
@@ -79,17 +155,18 @@ class ConfigManager:
         return value
 
     def set(self, key, value):
-        """설정 값 설정"""
+        """설정 값 설정 (파일 저장은 예약)"""
         keys = key.split('.')
-        config = self.config
 
-        for k in keys[:-1]:
-            if k not in config:
-                config[k] = {}
-            config = config[k]
+        with self._lock:
+            config = self.config
+            for k in keys[:-1]:
+                if k not in config:
+                    config[k] = {}
+                config = config[k]
 
-        config[keys[-1]] = value
-        self.save_config()
+            config[keys[-1]] = value
+        self._schedule_save()
 
     def get_ff16tools_path(self):
         """FF16Tools 실행 파일 경로 반환"""
@@ -115,6 +192,10 @@ class ConfigManager:
         """마지막으로 사용한 경로 설정"""
         self.set(f'last_used_paths.{path_type}', path)
 
+    def get_byte_budgets(self):
+        """파일/테이블 접두사별 바이트 예산 반환 {접두사: {'max_ratio': ..., 'max_bytes': ...}}"""
+        return self.get('byte_budgets', {})
+
     def get_language(self):
         """언어 설정 반환"""
         return self.get('language', 'ko')
@@ -123,8 +204,13 @@ class ConfigManager:
         """언어 설정"""
         self.set('language', lang_code)
 
-    def _auto_detect_tools(self):
-        """외부 도구 자동 탐지"""
+    def needs_tool_detection(self):
+        """설정된 외부 도구 경로 중 없는 것이 있는지 확인"""
+        return any(not path or not Path(path).exists()
+                   for path in (self.get_ff16tools_path(), self.get_ffttic_nxdtext_path()))
+
+    def detect_tools(self):
+        """외부 도구 자동 탐지 (경로가 없거나 존재하지 않는 도구만)"""
         from utils.tool_finder import get_tool_finder
 
         tool_finder = get_tool_finder()
@@ -156,9 +242,15 @@ class ConfigManager:
 _global_config_manager = None
 
 
-def get_config_manager():
-    """전역 설정 관리자 인스턴스 반환"""
+def get_config_manager(auto_detect=True):
+    """
+    전역 설정 관리자 인스턴스 반환
+
+    Args:
+        auto_detect: 처음 생성할 때 외부 도구를 바로 탐지할지 여부
+                     (GUI는 False로 생성한 뒤 백그라운드 스레드에서 detect_tools 호출)
+    """
     global _global_config_manager
     if _global_config_manager is None:
-        _global_config_manager = ConfigManager()
+        _global_config_manager = ConfigManager(auto_detect=auto_detect)
     return _global_config_manager
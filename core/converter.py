@@ -7,12 +7,17 @@ import multiprocessing
 from core.ff16tools_wrapper import FF16ToolsWrapper
 from core.ffttic_wrapper import FFTTicNXDTextWrapper
 from core.config_manager import get_config_manager
+from core.progress import ProgressTracker
+from core.cancellation import OperationCancelled, check_cancelled
 from utils.logger import get_logger
 
 
 class Converter:
     """NXD/PZD 파일 변환 클래스"""
 
+    # JSON → NXD 변환 중 임시 출력 파일 확장자 (성공하면 원본 NXD로 교체)
+    TEMP_NXD_SUFFIX = '.new.nxd'
+
     def __init__(self, max_workers=None):
         """변환기 초기화
 
@@ -52,85 +57,149 @@ class Converter:
 
         self.logger.info(f"병렬 처리 워커 수: {self.max_workers}")
 
-    def _convert_single_nxd_to_json(self, nxd_file):
+    def _collect_files(self, folder_path, suffix, recursive=True, files=None):
         """
-        단일 NXD 파일을 JSON으로 변환 (병렬 처리용)
+        변환 대상 파일 목록
 
         Args:
-            nxd_file: NXD 파일 경로
+            folder_path: 폴더 경로
+            suffix: 대상 확장자 (예: '.nxd')
+            recursive: 하위 폴더 포함 여부
+            files: 대상 파일 제한 (폴더 기준 상대 경로 또는 절대 경로, None이면 전체)
 
         Returns:
-            (성공 여부, 파일명)
+            파일 경로 리스트
         """
-        try:
-            # 각 스레드에서 새로운 ffttic 인스턴스 생성
-            ffttic = FFTTicNXDTextWrapper(self.ffttic_path)
-            json_output = nxd_file.with_suffix('.json')
-            if ffttic.nxd_to_json(nxd_file, json_output):
-                return (True, nxd_file.name)
-            else:
-                return (False, nxd_file.name)
-        except Exception as e:
-            self.logger.error(f"NXD 변환 오류 ({nxd_file}): {e}")
-            return (False, nxd_file.name)
+        folder = Path(folder_path)
+        if files is not None:
+            targets = [folder / file_path for file_path in files]
+            targets = [target for target in targets if target.suffix == suffix and target.exists()]
+        elif recursive:
+            targets = folder.rglob('*' + suffix)
+        else:
+            targets = folder.glob('*' + suffix)
 
-    def convert_nxd_to_json(self, folder_path, recursive=True, callback=None):
+        # 중단된 변환이 남긴 임시 파일은 제외
+        return [target for target in targets if not target.name.endswith(self.TEMP_NXD_SUFFIX)]
+
+    def _run_parallel(self, source_files, convert_func, stage, label, callback=None, progress=None,
+                      cancel_token=None):
         """
-        폴더 내 모든 NXD 파일을 JSON으로 변환 (병렬 처리)
+        파일 목록을 스레드 풀에서 병렬 변환
 
         Args:
-            folder_path: 폴더 경로
-            recursive: 하위 폴더 포함 여부
+            source_files: 변환할 파일 경로 리스트
+            convert_func: 파일 하나를 변환하는 함수 ((성공 여부, 파일명) 반환)
+            stage: 진행 상황 단계 이름
+            label: 로그에 표시할 변환 이름 (예: 'NXD → JSON')
             callback: 진행 상황 콜백 함수 (processed, total) 인자 받음
+            progress: ProgressEvent를 받는 콜백
+            cancel_token: 취소 토큰 (취소되면 대기 중인 작업을 버리고 OperationCancelled 발생)
 
         Returns:
             변환된 파일 수
         """
-        if not self.ffttic_path:
-            self.logger.error("ffttic-nxdtext가 초기화되지 않음")
-            return 0
-
-        folder = Path(folder_path)
-        if recursive:
-            nxd_files = list(folder.rglob('*.nxd'))
-        else:
-            nxd_files = list(folder.glob('*.nxd'))
-
-        total_files = len(nxd_files)
-        self.logger.info(f"총 {total_files}개 NXD 파일 변환 시작 (병렬 처리: {self.max_workers} 워커)")
+        check_cancelled(cancel_token)
+        total_files = len(source_files)
+        self.logger.info(f"총 {total_files}개 {label.split(' ')[0]} 파일 변환 시작 (병렬 처리: {self.max_workers} 워커)")
 
         success_count = 0
         processed = 0
+        tracker = ProgressTracker(stage, total_files, progress)
 
         # 병렬 처리
         with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
             # 모든 작업 제출
-            future_to_file = {executor.submit(self._convert_single_nxd_to_json, nxd_file): nxd_file
-                            for nxd_file in nxd_files}
+            future_to_file = {executor.submit(convert_func, source_file, cancel_token): source_file
+                              for source_file in source_files}
 
             # 완료된 작업 처리
             for future in as_completed(future_to_file):
+                if cancel_token is not None and cancel_token.is_cancelled():
+                    # 대기 중인 작업 취소 (실행 중인 작업은 프로세스가 종료되어 곧 끝남)
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    break
+
                 processed += 1
                 success, filename = future.result()
                 if success:
                     success_count += 1
-                    self.logger.debug(f"[{processed}/{total_files}] NXD → JSON 변환 완료: {filename}")
+                    self.logger.debug(f"[{processed}/{total_files}] {label} 변환 완료: {filename}")
                 else:
-                    self.logger.error(f"[{processed}/{total_files}] NXD → JSON 변환 실패: {filename}")
+                    self.logger.error(f"[{processed}/{total_files}] {label} 변환 실패: {filename}")
 
                 # 진행 상황 콜백
+                try:
+                    file_size = future_to_file[future].stat().st_size
+                except OSError:
+                    file_size = 0
+                tracker.advance(bytes_done=file_size)
                 if callback:
                     callback(processed, total_files)
 
-        self.logger.info(f"NXD → JSON 변환 완료: {success_count}/{total_files}")
+        if cancel_token is not None and cancel_token.is_cancelled():
+            self.logger.warning(f"{label} 변환 취소됨: {success_count}/{total_files}")
+            raise OperationCancelled()
+
+        tracker.finish()
+        self.logger.info(f"{label} 변환 완료: {success_count}/{total_files}")
         return success_count
 
-    def _convert_single_json_to_nxd(self, json_file):
+    def _convert_single_nxd_to_json(self, nxd_file, cancel_token=None):
+        """
+        단일 NXD 파일을 JSON으로 변환 (병렬 처리용)
+
+        Args:
+            nxd_file: NXD 파일 경로
+            cancel_token: 취소 토큰
+
+        Returns:
+            (성공 여부, 파일명)
+        """
+        try:
+            # 각 스레드에서 새로운 ffttic 인스턴스 생성
+            ffttic = FFTTicNXDTextWrapper(self.ffttic_path)
+            json_output = nxd_file.with_suffix('.json')
+            if ffttic.nxd_to_json(nxd_file, json_output, cancel_token):
+                return (True, nxd_file.name)
+            else:
+                return (False, nxd_file.name)
+        except Exception as e:
+            self.logger.error(f"NXD 변환 오류 ({nxd_file}): {e}")
+            return (False, nxd_file.name)
+
+    def convert_nxd_to_json(self, folder_path, recursive=True, callback=None, files=None,
+                            progress=None, cancel_token=None):
+        """
+        폴더 내 모든 NXD 파일을 JSON으로 변환 (병렬 처리)
+
+        Args:
+            folder_path: 폴더 경로
+            recursive: 하위 폴더 포함 여부
+            callback: 진행 상황 콜백 함수 (processed, total) 인자 받음
+            files: 변환할 파일 제한 (폴더 기준 상대 경로 리스트, None이면 전체)
+            progress: ProgressEvent를 받는 콜백 (단계, 처리 수, 바이트, 경과 시간)
+            cancel_token: 취소 토큰 (취소되면 OperationCancelled 발생)
+
+        Returns:
+            변환된 파일 수
+        """
+        if not self.ffttic_path:
+            self.logger.error("ffttic-nxdtext가 초기화되지 않음")
+            return 0
+
+        nxd_files = self._collect_files(folder_path, '.nxd', recursive, files)
+
+        return self._run_parallel(nxd_files, self._convert_single_nxd_to_json, 'nxd_to_json', 'NXD → JSON',
+                                  callback, progress, cancel_token)
+
+    def _convert_single_json_to_nxd(self, json_file, cancel_token=None):
         """
         단일 JSON 파일을 NXD로 변환 (병렬 처리용)
 
         Args:
             json_file: JSON 파일 경로
+            cancel_token: 취소 토큰
 
         Returns:
             (성공 여부, 파일명)
@@ -147,20 +216,25 @@ class Converter:
             ffttic = FFTTicNXDTextWrapper(self.ffttic_path)
 
             # 임시 출력 파일
-            temp_nxd = json_file.with_suffix('.new.nxd')
+            temp_nxd = json_file.with_suffix(self.TEMP_NXD_SUFFIX)
 
-            if ffttic.json_to_nxd(original_nxd, json_file, temp_nxd):
-                # 성공하면 원본 NXD 교체
-                temp_nxd.replace(original_nxd)
-                return (True, json_file.name)
-            else:
-                return (False, json_file.name)
+            try:
+                if ffttic.json_to_nxd(original_nxd, json_file, temp_nxd, cancel_token):
+                    # 성공하면 원본 NXD 교체
+                    temp_nxd.replace(original_nxd)
+                    return (True, json_file.name)
+                else:
+                    return (False, json_file.name)
+            finally:
+                # 실패/취소로 남은 임시 파일 정리
+                temp_nxd.unlink(missing_ok=True)
 
         except Exception as e:
             self.logger.error(f"JSON 변환 오류 ({json_file}): {e}")
             return (False, json_file.name)
 
-    def convert_json_to_nxd(self, folder_path, recursive=True, callback=None):
+    def convert_json_to_nxd(self, folder_path, recursive=True, callback=None, files=None,
+                            progress=None, cancel_token=None):
         """
         폴더 내 모든 JSON 파일을 NXD로 변환 (병렬 처리, 원본 NXD 필요)
 
@@ -168,6 +242,9 @@ class Converter:
             folder_path: 폴더 경로
             recursive: 하위 폴더 포함 여부
             callback: 진행 상황 콜백 함수 (processed, total) 인자 받음
+            files: 변환할 파일 제한 (폴더 기준 상대 경로 리스트, None이면 전체)
+            progress: ProgressEvent를 받는 콜백 (단계, 처리 수, 바이트, 경과 시간)
+            cancel_token: 취소 토큰 (취소되면 OperationCancelled 발생)
 
         Returns:
             변환된 파일 수
@@ -176,47 +253,18 @@ class Converter:
             self.logger.error("ffttic-nxdtext가 초기화되지 않음")
             return 0
 
-        folder = Path(folder_path)
-        if recursive:
-            json_files = list(folder.rglob('*.json'))
-        else:
-            json_files = list(folder.glob('*.json'))
-
-        total_files = len(json_files)
-        self.logger.info(f"총 {total_files}개 JSON 파일 변환 시작 (병렬 처리: {self.max_workers} 워커)")
-
-        success_count = 0
-        processed = 0
-
-        # 병렬 처리
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # 모든 작업 제출
-            future_to_file = {executor.submit(self._convert_single_json_to_nxd, json_file): json_file
-                            for json_file in json_files}
+        json_files = self._collect_files(folder_path, '.json', recursive, files)
 
-            # 완료된 작업 처리
-            for future in as_completed(future_to_file):
-                processed += 1
-                success, filename = future.result()
-                if success:
-                    success_count += 1
-                    self.logger.debug(f"[{processed}/{total_files}] JSON → NXD 변환 완료: {filename}")
-                else:
-                    self.logger.error(f"[{processed}/{total_files}] JSON → NXD 변환 실패: {filename}")
+        return self._run_parallel(json_files, self._convert_single_json_to_nxd, 'json_to_nxd', 'JSON → NXD',
+                                  callback, progress, cancel_token)
 
-                # 진행 상황 콜백
-                if callback:
-                    callback(processed, total_files)
-
-        self.logger.info(f"JSON → NXD 변환 완료: {success_count}/{total_files}")
-        return success_count
-
-    def _convert_single_pzd_to_yaml(self, pzd_file):
+    def _convert_single_pzd_to_yaml(self, pzd_file, cancel_token=None):
         """
         단일 PZD 파일을 YAML로 변환 (병렬 처리용)
 
         Args:
             pzd_file: PZD 파일 경로
+            cancel_token: 취소 토큰
 
         Returns:
             (성공 여부, 파일명)
@@ -224,7 +272,7 @@ class Converter:
         try:
             # 각 스레드에서 새로운 FF16Tools 인스턴스 생성
             ff16tools = FF16ToolsWrapper(self.ff16tools_path)
-            if ff16tools.pzd_to_yaml(pzd_file):
+            if ff16tools.pzd_to_yaml(pzd_file, cancel_token=cancel_token):
                 return (True, pzd_file.name)
             else:
                 return (False, pzd_file.name)
@@ -232,7 +280,8 @@ class Converter:
             self.logger.error(f"PZD 변환 오류 ({pzd_file}): {e}")
             return (False, pzd_file.name)
 
-    def convert_pzd_to_yaml(self, folder_path, recursive=True, callback=None):
+    def convert_pzd_to_yaml(self, folder_path, recursive=True, callback=None, files=None,
+                            progress=None, cancel_token=None):
         """
         폴더 내 모든 PZD 파일을 YAML로 변환 (병렬 처리)
 
@@ -240,6 +289,9 @@ class Converter:
             folder_path: 폴더 경로
             recursive: 하위 폴더 포함 여부
             callback: 진행 상황 콜백 함수 (processed, total) 인자 받음
+            files: 변환할 파일 제한 (폴더 기준 상대 경로 리스트, None이면 전체)
+            progress: ProgressEvent를 받는 콜백 (단계, 처리 수, 바이트, 경과 시간)
+            cancel_token: 취소 토큰 (취소되면 OperationCancelled 발생)
 
         Returns:
             변환된 파일 수
@@ -248,47 +300,18 @@ class Converter:
             self.logger.error("FF16Tools가 초기화되지 않음")
             return 0
 
-        folder = Path(folder_path)
-        if recursive:
-            pzd_files = list(folder.rglob('*.pzd'))
-        else:
-            pzd_files = list(folder.glob('*.pzd'))
-
-        total_files = len(pzd_files)
-        self.logger.info(f"총 {total_files}개 PZD 파일 변환 시작 (병렬 처리: {self.max_workers} 워커)")
-
-        success_count = 0
-        processed = 0
-
-        # 병렬 처리
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # 모든 작업 제출
-            future_to_file = {executor.submit(self._convert_single_pzd_to_yaml, pzd_file): pzd_file
-                            for pzd_file in pzd_files}
-
-            # 완료된 작업 처리
-            for future in as_completed(future_to_file):
-                processed += 1
-                success, filename = future.result()
-                if success:
-                    success_count += 1
-                    self.logger.debug(f"[{processed}/{total_files}] PZD → YAML 변환 완료: {filename}")
-                else:
-                    self.logger.error(f"[{processed}/{total_files}] PZD → YAML 변환 실패: {filename}")
-
-                # 진행 상황 콜백
-                if callback:
-                    callback(processed, total_files)
+        pzd_files = self._collect_files(folder_path, '.pzd', recursive, files)
 
-        self.logger.info(f"PZD → YAML 변환 완료: {success_count}/{total_files}")
-        return success_count
+        return self._run_parallel(pzd_files, self._convert_single_pzd_to_yaml, 'pzd_to_yaml', 'PZD → YAML',
+                                  callback, progress, cancel_token)
 
-    def _convert_single_yaml_to_pzd(self, yaml_file):
+    def _convert_single_yaml_to_pzd(self, yaml_file, cancel_token=None):
         """
         단일 YAML 파일을 PZD로 변환 (병렬 처리용)
 
         Args:
             yaml_file: YAML 파일 경로
+            cancel_token: 취소 토큰
 
         Returns:
             (성공 여부, 파일명)
@@ -296,7 +319,7 @@ class Converter:
         try:
             # 각 스레드에서 새로운 FF16Tools 인스턴스 생성
             ff16tools = FF16ToolsWrapper(self.ff16tools_path)
-            if ff16tools.yaml_to_pzd(yaml_file):
+            if ff16tools.yaml_to_pzd(yaml_file, cancel_token=cancel_token):
                 return (True, yaml_file.name)
             else:
                 return (False, yaml_file.name)
@@ -304,7 +327,8 @@ class Converter:
             self.logger.error(f"YAML 변환 오류 ({yaml_file}): {e}")
             return (False, yaml_file.name)
 
-    def convert_yaml_to_pzd(self, folder_path, recursive=True, callback=None):
+    def convert_yaml_to_pzd(self, folder_path, recursive=True, callback=None, files=None,
+                            progress=None, cancel_token=None):
         """
         폴더 내 모든 YAML 파일을 PZD로 변환 (병렬 처리)
 
@@ -312,6 +336,9 @@ class Converter:
             folder_path: 폴더 경로
             recursive: 하위 폴더 포함 여부
             callback: 진행 상황 콜백 함수 (processed, total) 인자 받음
+            files: 변환할 파일 제한 (폴더 기준 상대 경로 리스트, None이면 전체)
+            progress: ProgressEvent를 받는 콜백 (단계, 처리 수, 바이트, 경과 시간)
+            cancel_token: 취소 토큰 (취소되면 OperationCancelled 발생)
 
         Returns:
             변환된 파일 수
@@ -320,37 +347,7 @@ class Converter:
             self.logger.error("FF16Tools가 초기화되지 않음")
             return 0
 
-        folder = Path(folder_path)
-        if recursive:
-            yaml_files = list(folder.rglob('*.yaml'))
-        else:
-            yaml_files = list(folder.glob('*.yaml'))
-
-        total_files = len(yaml_files)
-        self.logger.info(f"총 {total_files}개 YAML 파일 변환 시작 (병렬 처리: {self.max_workers} 워커)")
-
-        success_count = 0
-        processed = 0
+        yaml_files = self._collect_files(folder_path, '.yaml', recursive, files)
 
-        # 병렬 처리
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # 모든 작업 제출
-            future_to_file = {executor.submit(self._convert_single_yaml_to_pzd, yaml_file): yaml_file
-                            for yaml_file in yaml_files}
-
-            # 완료된 작업 처리
-            for future in as_completed(future_to_file):
-                processed += 1
-                success, filename = future.result()
-                if success:
-                    success_count += 1
-                    self.logger.debug(f"[{processed}/{total_files}] YAML → PZD 변환 완료: {filename}")
-                else:
-                    self.logger.error(f"[{processed}/{total_files}] YAML → PZD 변환 실패: {filename}")
-
-                # 진행 상황 콜백
-                if callback:
-                    callback(processed, total_files)
-
-        self.logger.info(f"YAML → PZD 변환 완료: {success_count}/{total_files}")
-        return success_count
+        return self._run_parallel(yaml_files, self._convert_single_yaml_to_pzd, 'yaml_to_pzd', 'YAML → PZD',
+                                  callback, progress, cancel_token)
@@ -2,11 +2,16 @@
 CSV 처리 모듈
 """
 import csv
+import os
 import json
+import hashlib
 import yaml
 import pandas as pd
 from pathlib import Path
 from glob import glob
+from core.project_db import ProjectDatabase
+from core.cancellation import check_cancelled
+from core.progress import ProgressTracker
 from utils.logger import get_logger
 
 
@@ -56,20 +61,21 @@ class CSVHandler:
 
         return all_data
 
-    def extract_from_yaml(self, yaml_files, group_by_folder=True):
+    def extract_from_yaml(self, yaml_files, group_by_folder=True, cancel_token=None):
         """
         YAML 파일에서 데이터 추출하여 CSV 형식으로 변환
 
         Args:
             yaml_files: YAML 파일 경로 리스트
             group_by_folder: 폴더별로 그룹화 여부
+            cancel_token: 취소 토큰 (파일마다 확인, 취소되면 OperationCancelled 발생)
 
         Returns:
             폴더별 CSV 데이터 딕셔너리 {폴더명: 데이터 리스트}
         """
         if not group_by_folder:
             # 폴더별 그룹화 없이 하나의 CSV로
-            return {'all': self._extract_yaml_files(yaml_files)}
+            return {'all': self._extract_yaml_files(yaml_files, cancel_token)}
 
         # 폴더별로 그룹화
         folder_groups = {}
@@ -83,16 +89,17 @@ class CSVHandler:
         # 각 폴더별로 CSV 생성
         all_csvs = {}
         for folder_name, files in folder_groups.items():
-            all_csvs[folder_name] = self._extract_yaml_files(files)
+            all_csvs[folder_name] = self._extract_yaml_files(files, cancel_token)
 
         return all_csvs
 
-    def _extract_yaml_files(self, yaml_files):
+    def _extract_yaml_files(self, yaml_files, cancel_token=None):
         """
         YAML 파일 리스트에서 데이터 추출
 
         Args:
             yaml_files: YAML 파일 경로 리스트
+            cancel_token: 취소 토큰 (파일마다 확인)
 
         Returns:
             CSV 데이터 리스트
@@ -101,6 +108,7 @@ class CSVHandler:
         text_counter = 1
 
         for yaml_file in yaml_files:
+            check_cancelled(cancel_token)
             try:
                 with open(yaml_file, 'r', encoding='utf-8') as f:
                     data = yaml.safe_load(f)
@@ -129,23 +137,52 @@ class CSVHandler:
 
         return all_data
 
-    def generate_csvs(self, source_folder, output_folder, recursive=True):
+    # 중복 원문 통합 시 추가되는 열 (같은 원문의 다른 [FileName, EntryID] JSON 리스트)
+    OCCURRENCES_COLUMN = 'Occurrences'
+
+    # 재생성 시 추가되는 열 (new: 새 항목, changed: 원문 변경, conflict: 같은 원문의 번역이 서로 다름)
+    # / 원문 변경 전 번역
+    STATUS_COLUMN = 'Status'
+    PREVIOUS_TRANSLATION_COLUMN = 'PreviousTranslation'
+    CONFLICT_STATUS = 'conflict'
+
+    # 재생성 후 더 이상 만들어지지 않는 CSV에 붙이는 확장자 (번역 로드 대상에서 제외, 내용은 보존)
+    # 같은 이름이 이미 있으면 덮어쓰지 않고 숫자를 붙임 (예: menu.csv.orphaned.1)
+    ORPHANED_SUFFIX = '.orphaned'
+
+    # 참조 언어 열 접두사 (예: Ref_en)
+    REFERENCE_COLUMN_PREFIX = 'Ref_'
+
+    # 재생성용 소스 해시 캐시 (CSV 폴더 안에 저장, 재생성으로 만든 CSV 이름 목록 포함)
+    SOURCE_CACHE_FILE = '.source_hashes.json'
+    SOURCE_CACHE_VERSION = 2
+
+    def generate_csvs(self, source_folder, output_folder, recursive=True, deduplicate=False,
+                      reference_folders=None, cancel_token=None):
         """
         JSON과 YAML을 스캔하여 CSV 생성
 
         Args:
             source_folder: 소스 폴더 경로
-            output_folder: 출력 폴더 경로
+            output_folder: 출력 폴더 경로 (프로젝트 DB 파일이면 CSV 대신 DB에 저장)
             recursive: 하위 폴더 포함 여부
+            deduplicate: 같은 원문을 한 행으로 통합할지 여부
+            reference_folders: 참조 언어 언팩 폴더 리스트 (예: 0004.en, Ref_<언어> 열로 추가)
+            cancel_token: 취소 토큰 (취소되면 CSV를 저장하기 전에 OperationCancelled 발생)
 
         Returns:
             생성된 CSV 파일 수
         """
         source_path = Path(source_folder)
-        output_path = Path(output_folder)
-        output_path.mkdir(parents=True, exist_ok=True)
+        project_db = None
+        if ProjectDatabase.is_project_file(output_folder):
+            project_db = ProjectDatabase(output_folder)
+        else:
+            output_path = Path(output_folder)
+            output_path.mkdir(parents=True, exist_ok=True)
 
         csv_count = 0
+        csv_outputs = []  # [(csv_name, data)]
 
         # JSON 파일 처리 (파일명별로 CSV)
         if recursive:
@@ -154,12 +191,10 @@ class CSVHandler:
             json_files = list(source_path.glob('*.json'))
 
         for json_file in json_files:
+            check_cancelled(cancel_token)
             data = self.extract_from_json([json_file])
             if data:
-                csv_name = json_file.stem + '.csv'
-                csv_path = output_path / csv_name
-                self.save_to_csv(data, csv_path)
-                csv_count += 1
+                csv_outputs.append((json_file.stem + '.csv', data))
 
         # YAML 파일 처리 (폴더명별로 CSV)
         if recursive:
@@ -167,17 +202,430 @@ class CSVHandler:
         else:
             yaml_files = list(source_path.glob('*.yaml'))
 
-        folder_csvs = self.extract_from_yaml(yaml_files, group_by_folder=True)
+        folder_csvs = self.extract_from_yaml(yaml_files, group_by_folder=True, cancel_token=cancel_token)
         for folder_name, data in folder_csvs.items():
             if data:
-                csv_name = f"{folder_name}.csv"
-                csv_path = output_path / csv_name
-                self.save_to_csv(data, csv_path)
-                csv_count += 1
+                csv_outputs.append((f"{folder_name}.csv", data))
+
+        if reference_folders:
+            self.add_reference_columns(csv_outputs, reference_folders, recursive)
+
+        if deduplicate:
+            csv_outputs = self.deduplicate_rows(csv_outputs)
+
+        check_cancelled(cancel_token)
+        for csv_name, data in csv_outputs:
+            if project_db:
+                project_db.import_records(csv_name, data)
+            else:
+                self.save_to_csv(data, output_path / csv_name)
+            csv_count += 1
+
+        if project_db:
+            project_db.close()
 
         self.logger.info(f"총 {csv_count}개의 CSV 파일 생성 완료")
         return csv_count
 
+    def regenerate_csvs(self, source_folder, csv_folder, recursive=True, deduplicate=False,
+                        reference_folders=None, cancel_token=None):
+        """
+        게임 업데이트 후 CSV 재생성 (기존 번역 유지)
+
+        새로 추출한 행을 기존 CSV 폴더의 행과 (FileName, EntryID)로 해시 조인합니다.
+        원문이 같으면 번역을 유지하고, 원문이 바뀐 행은 Status=changed(이전 번역은
+        PreviousTranslation 열), 새 행은 Status=new로 표시합니다.
+        소스 파일 내용 해시는 SOURCE_CACHE_FILE에 보관하여 바뀐 파일만 다시 파싱합니다.
+        이전 재생성이 만든 CSV(캐시에 기록된 이름) 중 이번에 만들어지지 않은 CSV
+        (소스 파일 삭제, 중복 통합 설정 변경 등)는 ORPHANED_SUFFIX를 붙여 번역 로드 대상에서
+        제외합니다. 캐시에 없는 CSV(사용자가 둔 용어집, 검증 결과 등)는 건드리지 않습니다.
+
+        Args:
+            source_folder: 소스 폴더 경로
+            csv_folder: 기존 CSV 폴더 경로 (결과도 이 폴더에 저장)
+            recursive: 하위 폴더 포함 여부
+            deduplicate: 같은 원문을 한 행으로 통합할지 여부
+            reference_folders: 참조 언어 언팩 폴더 리스트 (Ref_<언어> 열로 추가)
+            cancel_token: 취소 토큰 (취소되면 CSV를 저장하기 전에 OperationCancelled 발생)
+
+        Returns:
+            통계 딕셔너리 {csv_count, parsed, cached, kept, changed, new, removed, orphaned, conflicts}
+        """
+        source_path = Path(source_folder)
+        output_path = Path(csv_folder)
+        output_path.mkdir(parents=True, exist_ok=True)
+        stats = {'csv_count': 0, 'parsed': 0, 'cached': 0, 'kept': 0, 'changed': 0, 'new': 0, 'removed': 0,
+                 'orphaned': 0, 'conflicts': 0}
+
+        # 기존 행 인덱스 (조인의 build 쪽)
+        existing = self._load_existing_rows(output_path)
+        cache, previous_csvs = self._load_source_cache(output_path)
+        new_cache = {}
+
+        glob_func = source_path.rglob if recursive else source_path.glob
+        json_files = list(glob_func('*.json'))
+        yaml_files = list(glob_func('*.yaml'))
+
+        def extract(source_file, extractor):
+            """캐시된 해시가 같으면 캐시의 행 사용, 아니면 다시 파싱"""
+            key = source_file.relative_to(source_path).as_posix()
+            digest = hashlib.blake2b(source_file.read_bytes(), digest_size=16).hexdigest()
+            cached = cache.get(key)
+            if cached and cached['hash'] == digest:
+                stats['cached'] += 1
+                rows = cached['rows']
+            else:
+                stats['parsed'] += 1
+                rows = [[row['EntryID'], row['OriginalText']] for row in extractor([source_file])]
+            new_cache[key] = {'hash': digest, 'rows': rows}
+            return [{'Tag': '', 'FileName': source_file.name, 'EntryID': entry_id,
+                     'OriginalText': original, 'Translation': ''} for entry_id, original in rows]
+
+        csv_outputs = []
+        for json_file in json_files:
+            check_cancelled(cancel_token)
+            data = extract(json_file, self.extract_from_json)
+            if data:
+                csv_outputs.append((json_file.stem + '.csv', data))
+
+        folder_groups = {}
+        for yaml_file in yaml_files:
+            folder_groups.setdefault(yaml_file.parent.name, []).append(yaml_file)
+        for folder_name, files in folder_groups.items():
+            data = []
+            for yaml_file in files:
+                check_cancelled(cancel_token)
+                data.extend(extract(yaml_file, self._extract_yaml_files))
+            if data:
+                csv_outputs.append((f"{folder_name}.csv", data))
+
+        # 해시 조인 (probe 쪽: 새 추출 행)
+        seen_keys = set()
+        for _, data in csv_outputs:
+            for text_counter, row in enumerate(data, 1):
+                row['Tag'] = f'<text{text_counter}>'
+                key = (row['FileName'], str(row['EntryID']))
+                seen_keys.add(key)
+                old = existing.get(key)
+                if old is None:
+                    row[self.STATUS_COLUMN] = 'new'
+                    row[self.PREVIOUS_TRANSLATION_COLUMN] = ''
+                    stats['new'] += 1
+                elif old['OriginalText'] == row['OriginalText']:
+                    row['Translation'] = old['Translation']
+                    # 아직 번역되지 않은 행은 이전 표시 유지
+                    untranslated = not old['Translation'].strip()
+                    row[self.STATUS_COLUMN] = old['Status'] if untranslated else ''
+                    row[self.PREVIOUS_TRANSLATION_COLUMN] = old['PreviousTranslation'] if untranslated else ''
+                    stats['kept'] += 1
+                else:
+                    row[self.STATUS_COLUMN] = 'changed'
+                    row[self.PREVIOUS_TRANSLATION_COLUMN] = old['Translation'] or old['PreviousTranslation']
+                    stats['changed'] += 1
+
+        stats['removed'] = sum(1 for key in existing if key not in seen_keys)
+
+        if reference_folders:
+            self.add_reference_columns(csv_outputs, reference_folders, recursive)
+
+        if deduplicate:
+            csv_outputs = self.deduplicate_rows(csv_outputs)
+            stats['conflicts'] = sum(1 for _, data in csv_outputs for row in data
+                                     if row.get(self.STATUS_COLUMN) == self.CONFLICT_STATUS)
+
+        check_cancelled(cancel_token)
+        for csv_name, data in csv_outputs:
+            self.save_to_csv(data, output_path / csv_name)
+            stats['csv_count'] += 1
+
+        produced_names = {name for name, _ in csv_outputs}
+        if csv_outputs:
+            stats['orphaned'] = len(self._mark_orphaned_csvs(output_path, previous_csvs - produced_names))
+        else:
+            # 소스 폴더가 잘못 지정된 경우 기존 CSV를 모두 제외하지 않도록 건너뜀
+            self.logger.warning(f"소스 폴더에서 추출한 행이 없어 기존 CSV를 그대로 둡니다: {source_folder}")
+
+        # 제외되지 않고 남은 이전 CSV(건너뛴 경우, 이름 변경 실패)도 다음 재생성에서 다시 확인
+        csv_names = sorted(name for name in produced_names | previous_csvs if (output_path / name).is_file())
+        self._save_source_cache(output_path, new_cache, csv_names)
+        self.logger.info(
+            f"CSV 재생성 완료: 파싱 {stats['parsed']}개/캐시 {stats['cached']}개 소스, "
+            f"유지 {stats['kept']}, 변경 {stats['changed']}, 신규 {stats['new']}, 삭제 {stats['removed']}, "
+            f"제외된 CSV {stats['orphaned']}, 번역 충돌 {stats['conflicts']}"
+        )
+        return stats
+
+    def _mark_orphaned_csvs(self, csv_folder, orphan_names):
+        """
+        이번 재생성에서 만들어지지 않은 CSV에 ORPHANED_SUFFIX를 붙여 번역 로드 대상에서 제외
+
+        Args:
+            csv_folder: CSV 폴더 경로
+            orphan_names: 이전 재생성이 만들었지만 이번에는 만들지 않은 CSV 파일명 집합
+
+        Returns:
+            제외된 CSV 파일명 리스트
+        """
+        orphaned = []
+        for name in sorted(orphan_names):
+            csv_file = Path(csv_folder) / name
+            if not csv_file.is_file():
+                continue
+            target = csv_file.with_name(name + self.ORPHANED_SUFFIX)
+            counter = 0
+            while target.exists():
+                counter += 1
+                target = csv_file.with_name(f"{name}{self.ORPHANED_SUFFIX}.{counter}")
+            try:
+                os.rename(csv_file, target)
+                orphaned.append(csv_file.name)
+                self.logger.warning(f"더 이상 만들어지지 않는 CSV 제외: {csv_file.name} → {target.name}")
+            except OSError as e:
+                self.logger.error(f"CSV 제외 실패 ({csv_file}): {e}")
+        return orphaned
+
+    def _load_existing_rows(self, csv_folder):
+        """
+        기존 CSV 폴더의 행 인덱스 생성 (통합된 중복 원문은 모든 위치로 펼침)
+
+        Args:
+            csv_folder: CSV 폴더 경로
+
+        Returns:
+            {(filename, str(entry_id)): {OriginalText, Translation, Status, PreviousTranslation}}
+        """
+        existing = {}
+        for csv_file in Path(csv_folder).glob('*.csv'):
+            try:
+                with open(csv_file, 'r', encoding='utf-8-sig', newline='') as f:
+                    for row in csv.DictReader(f):
+                        record = {
+                            'OriginalText': row.get('OriginalText') or '',
+                            'Translation': row.get('Translation') or '',
+                            'Status': row.get(self.STATUS_COLUMN) or '',
+                            'PreviousTranslation': row.get(self.PREVIOUS_TRANSLATION_COLUMN) or ''
+                        }
+                        keys = [((row.get('FileName') or '').strip(), (row.get('EntryID') or '').strip())]
+                        keys += self.parse_occurrences(row.get(self.OCCURRENCES_COLUMN))
+                        for key in keys:
+                            existing[key] = record
+            except Exception as e:
+                self.logger.error(f"기존 CSV 로드 실패 ({csv_file}): {e}")
+        return existing
+
+    def _load_source_cache(self, csv_folder):
+        """
+        소스 해시 캐시 로드
+
+        Returns:
+            ({상대 경로: {hash, rows}}, 이전 재생성이 만든 CSV 파일명 집합)
+        """
+        cache_file = Path(csv_folder) / self.SOURCE_CACHE_FILE
+        if not cache_file.exists():
+            return {}, set()
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') != self.SOURCE_CACHE_VERSION:
+                return {}, set()
+            return data.get('sources', {}), set(data.get('csvs', []))
+        except Exception as e:
+            self.logger.warning(f"소스 해시 캐시 로드 실패, 모든 소스를 다시 파싱합니다: {e}")
+            return {}, set()
+
+    def _save_source_cache(self, csv_folder, sources, csv_names):
+        """소스 해시 캐시 저장 (재생성으로 만든 CSV 파일명 목록 포함)"""
+        cache_file = Path(csv_folder) / self.SOURCE_CACHE_FILE
+        try:
+            with open(cache_file, 'w', encoding='utf-8') as f:
+                json.dump({'version': self.SOURCE_CACHE_VERSION, 'sources': sources, 'csvs': csv_names},
+                          f, ensure_ascii=False)
+        except Exception as e:
+            self.logger.error(f"소스 해시 캐시 저장 실패: {e}")
+
+    @staticmethod
+    def reference_language(reference_folder):
+        """
+        참조 폴더 이름에서 언어 코드 추출 ('0004.en' → 'en', 점이 없으면 폴더 이름)
+
+        Args:
+            reference_folder: 참조 언어 언팩 폴더 경로
+
+        Returns:
+            언어 코드
+        """
+        name = Path(reference_folder).name
+        return name.rsplit('.', 1)[-1] if '.' in name else name
+
+    def build_reference_index(self, reference_folder, recursive=True):
+        """
+        참조 언어 폴더의 모든 항목을 한 번 훑어 해시 조인용 인덱스 생성
+
+        Args:
+            reference_folder: 참조 언어 언팩 폴더 경로
+            recursive: 하위 폴더 포함 여부
+
+        Returns:
+            {(파일명 stem, str(entry_id)): 텍스트}
+        """
+        reference_path = Path(reference_folder)
+        glob_func = reference_path.rglob if recursive else reference_path.glob
+        index = {}
+
+        for source_file in list(glob_func('*.json')) + list(glob_func('*.yaml')):
+            extractor = self.extract_from_json if source_file.suffix == '.json' else self._extract_yaml_files
+            stem = source_file.stem
+            for row in extractor([source_file]):
+                index[(stem, str(row['EntryID']))] = row['OriginalText']
+
+        return index
+
+    def add_reference_columns(self, csv_outputs, reference_folders, recursive=True):
+        """
+        참조 언어 텍스트를 Ref_<언어> 열로 추가 ((FileName stem, EntryID) 해시 조인)
+
+        언어마다 참조 폴더를 한 번만 읽어 인덱스를 만들고, 각 행은 사전 조회 한 번으로
+        연결하므로 단일 언어 내보내기에 선형 비용만 추가됩니다.
+
+        Args:
+            csv_outputs: [(csv_name, 데이터 리스트)] (행에 열이 직접 추가됨)
+            reference_folders: 참조 언어 언팩 폴더 리스트
+            recursive: 하위 폴더 포함 여부
+        """
+        stem_cache = {}
+        for reference_folder in reference_folders:
+            column = self.REFERENCE_COLUMN_PREFIX + self.reference_language(reference_folder)
+            index = self.build_reference_index(reference_folder, recursive)
+
+            matched = 0
+            for _, data in csv_outputs:
+                for row in data:
+                    file_name = row['FileName']
+                    stem = stem_cache.get(file_name)
+                    if stem is None:
+                        stem = stem_cache[file_name] = Path(file_name).stem
+                    text = index.get((stem, str(row['EntryID'])), '')
+                    row[column] = text
+                    if text:
+                        matched += 1
+
+            self.logger.info(f"참조 열 추가 완료: {column} ({reference_folder}, {len(index)}개 항목 중 {matched}개 연결)")
+
+    def deduplicate_rows(self, csv_outputs):
+        """
+        같은 원문을 가진 행을 첫 번째 행 하나로 통합
+
+        남은 행의 Occurrences 열에 통합된 [FileName, EntryID] 목록을 JSON으로 기록하며,
+        번역 적용 시 load_all_translations가 같은 번역을 모든 항목으로 다시 펼칩니다.
+        번역이 없는 행은 같은 원문의 번역된 행에 합쳐지고, 같은 원문인데 번역이 서로 다른
+        행은 하나로 합치지 않고 번역별로 남긴 뒤 Status=conflict로 표시합니다.
+
+        Args:
+            csv_outputs: [(csv_name, 데이터 리스트)]
+
+        Returns:
+            중복이 제거된 [(csv_name, 데이터 리스트)] (빈 CSV는 제외)
+        """
+        groups = {}  # {원문: {번역: 남길 행}} (번역이 없으면 키는 '')
+        occurrences = {}  # {id(남길 행): [[FileName, EntryID], ...]}
+        result = []
+        removed = 0
+
+        for csv_name, data in csv_outputs:
+            kept = []
+            for row in data:
+                translation = row.get('Translation') or ''
+                variants = groups.get(row['OriginalText'])
+                if variants is None:
+                    groups[row['OriginalText']] = {translation: row}
+                    kept.append(row)
+                    continue
+
+                target = variants.get(translation)
+                if target is None and not translation:
+                    # 번역이 없는 행은 먼저 나온 행에 합침
+                    target = next(iter(variants.values()))
+                elif target is None and list(variants) == ['']:
+                    # 먼저 나온 행에 번역이 없으면 이 행의 번역을 넘겨받음
+                    target = variants.pop('')
+                    for column in ('Translation', self.STATUS_COLUMN, self.PREVIOUS_TRANSLATION_COLUMN):
+                        if column in row:
+                            target[column] = row[column]
+                    variants[translation] = target
+
+                if target is None:
+                    # 번역 충돌: 합치지 않고 따로 남김
+                    variants[translation] = row
+                    kept.append(row)
+                else:
+                    occurrences.setdefault(id(target), []).append([row['FileName'], str(row['EntryID'])])
+                    removed += 1
+            if kept:
+                result.append((csv_name, kept))
+
+        conflicts = 0
+        for variants in groups.values():
+            if len(variants) > 1:
+                conflicts += 1
+                for row in variants.values():
+                    row[self.STATUS_COLUMN] = self.CONFLICT_STATUS
+
+        for _, data in result:
+            for row in data:
+                extra = occurrences.get(id(row))
+                row[self.OCCURRENCES_COLUMN] = json.dumps(extra, ensure_ascii=False) if extra else ''
+
+        self.logger.info(f"중복 원문 통합 완료: {removed}개 행 제거 ({len(occurrences)}개 원문)")
+        if conflicts:
+            self.logger.warning(f"번역이 서로 다른 원문 {conflicts}개는 통합하지 않고 Status={self.CONFLICT_STATUS}로 표시")
+        return result
+
+    @classmethod
+    def parse_occurrences(cls, value):
+        """
+        Occurrences 열 값 파싱
+
+        Args:
+            value: Occurrences 열 값 (JSON 리스트 문자열)
+
+        Returns:
+            [(filename, str(entry_id)), ...]
+        """
+        if not value or not str(value).strip():
+            return []
+        try:
+            return [(str(file_name), str(entry_id)) for file_name, entry_id in json.loads(value)]
+        except (ValueError, TypeError):
+            return []
+
+    def import_to_project(self, csv_folder, db_path):
+        """
+        CSV 폴더를 프로젝트 DB로 가져오기
+
+        Args:
+            csv_folder: CSV 폴더 경로
+            db_path: 프로젝트 DB 파일 경로
+
+        Returns:
+            가져온 행 수
+        """
+        with ProjectDatabase(db_path) as project_db:
+            return project_db.import_csv_folder(csv_folder)
+
+    def export_from_project(self, db_path, output_folder):
+        """
+        프로젝트 DB를 CSV 폴더로 내보내기
+
+        Args:
+            db_path: 프로젝트 DB 파일 경로
+            output_folder: 출력 폴더 경로
+
+        Returns:
+            생성된 CSV 파일 수
+        """
+        with ProjectDatabase(db_path) as project_db:
+            return project_db.export_csv_folder(output_folder)
+
     def save_to_csv(self, data, output_file):
         """
         데이터를 CSV 파일로 저장
@@ -193,30 +641,42 @@ class CSVHandler:
         except Exception as e:
             self.logger.error(f"CSV 파일 저장 실패 ({output_file}): {e}")
 
-    def load_all_translations(self, csv_folder):
+    def load_all_translations(self, csv_folder, cancel_token=None, progress=None):
         """
         지정된 폴더 내의 모든 CSV 파일에서 번역 데이터를 로드합니다.
         FileName과 EntryID를 키로 사용하여 번역문을 저장합니다.
         EntryID는 JSON과 YAML 모두에 대응하기 위해 문자열로 저장됩니다.
 
         Args:
-            csv_folder (str): CSV 파일이 있는 폴더 경로.
+            csv_folder (str): CSV 파일이 있는 폴더 경로 (또는 프로젝트 DB 파일).
+            cancel_token: 취소 토큰 (CSV 파일마다 확인, 취소되면 OperationCancelled 발생).
+            progress: ProgressEvent를 받는 콜백 ('load' 단계, CSV 파일 단위).
 
         Returns:
             dict: {(filename, str(entry_id)): translation} 형태의 딕셔너리.
         """
+        if ProjectDatabase.is_project_file(csv_folder):
+            tracker = ProgressTracker('load', 0, progress)
+            with ProjectDatabase(csv_folder) as project_db:
+                translations = project_db.load_all_translations()
+            tracker.finish()
+            return translations
+
         translations = {}
         translated_count = 0
         original_fallback_count = 0
 
         csv_files = list(Path(csv_folder).rglob('*.csv'))
+        tracker = ProgressTracker('load', len(csv_files), progress)
         if not csv_files:
             self.logger.warning(f"CSV 폴더 '{csv_folder}'에서 CSV 파일을 찾을 수 없습니다.")
+            tracker.finish()
             return translations
 
         self.logger.info(f"총 {len(csv_files)}개의 CSV 파일에서 데이터 로딩 시작...")
 
         for csv_file in csv_files:
+            check_cancelled(cancel_token)
             try:
                 with open(csv_file, 'r', encoding='utf-8-sig') as f:
                     reader = csv.DictReader(f)
@@ -227,24 +687,35 @@ class CSVHandler:
                         original_text = row.get('OriginalText', '')
 
                         if filename and entry_id:
+                            # 통합된 중복 원문의 다른 항목에도 같은 번역 적용
+                            keys = [(filename, str(entry_id))]
+                            keys += self.parse_occurrences(row.get(self.OCCURRENCES_COLUMN))
+
                             # 번역문이 있으면 번역문 사용
                             if translation and str(translation).strip():
-                                translations[(filename, str(entry_id))] = str(translation)
-                                translated_count += 1
+                                for key in keys:
+                                    translations[key] = str(translation)
+                                translated_count += len(keys)
                             # 번역문이 없으면 원문 사용 (폴백)
                             else:
-                                translations[(filename, str(entry_id))] = str(original_text)
-                                original_fallback_count += 1
+                                for key in keys:
+                                    translations[key] = str(original_text)
+                                original_fallback_count += len(keys)
                         else:
                             self.logger.warning(f"CSV 파일 '{csv_file.name}'에서 필수 컬럼(FileName, EntryID, Translation) 중 누락된 항목이 있습니다: {row}")
 
             except Exception as e:
                 self.logger.error(f"CSV 파일 로드 중 오류 발생 ({csv_file}): {e}")
 
+            finally:
+                tracker.advance()
+
+        tracker.finish()
         self.logger.info(f"데이터 로딩 완료: 번역된 항목 {translated_count}개, 원문으로 대체된 항목 {original_fallback_count}개.")
         return translations
 
-    def apply_translations_to_folder(self, source_folder, translations, apply_yaml=True, apply_json=True):
+    def apply_translations_to_folder(self, source_folder, translations, apply_yaml=True, apply_json=True,
+                                     cancel_token=None, progress=None):
         """
         통합된 번역 데이터를 지정된 폴더 내의 YAML 및 JSON 파일에 적용합니다.
 
@@ -253,6 +724,8 @@ class CSVHandler:
             translations (dict): {(filename, str(entry_id)): translation} 형태의 번역 딕셔너리.
             apply_yaml (bool): YAML 파일에 번역을 적용할지 여부.
             apply_json (bool): JSON 파일에 번역을 적용할지 여부.
+            cancel_token (CancellationToken): 취소 토큰 (파일 사이에서 확인).
+            progress (callable): ProgressEvent를 받는 콜백 ('apply' 단계, 파일 단위).
 
         Returns:
             int: 총 업데이트된 항목 수.
@@ -264,11 +737,16 @@ class CSVHandler:
             self.logger.error(f"원본 폴더를 찾을 수 없습니다: {source_folder}")
             return 0
 
+        # 진행률을 위해 대상 파일을 먼저 모두 수집
+        yaml_files = list(source_path.rglob('*.yaml')) if apply_yaml else []
+        json_files = list(source_path.rglob('*.json')) if apply_json else []
+        tracker = ProgressTracker('apply', len(yaml_files) + len(json_files), progress)
+
         # YAML 파일에 번역 적용
         if apply_yaml:
-            yaml_files = list(source_path.rglob('*.yaml'))
             self.logger.info(f"총 {len(yaml_files)}개의 YAML 파일에 번역 적용 시도...")
             for yaml_file_path in yaml_files:
+                check_cancelled(cancel_token)
                 try:
                     with open(yaml_file_path, 'r', encoding='utf-8') as f:
                         data = yaml.safe_load(f)
@@ -299,11 +777,14 @@ class CSVHandler:
                 except Exception as e:
                     self.logger.error(f"YAML 파일 '{yaml_file_path}' 번역 적용 중 오류 발생: {e}")
 
+                finally:
+                    tracker.advance()
+
         # JSON 파일에 번역 적용
         if apply_json:
-            json_files = list(source_path.rglob('*.json'))
             self.logger.info(f"총 {len(json_files)}개의 JSON 파일에 번역 적용 시도...")
             for json_file_path in json_files:
+                check_cancelled(cancel_token)
                 try:
                     with open(json_file_path, 'r', encoding='utf-8') as f:
                         data = json.load(f)
@@ -332,6 +813,10 @@ class CSVHandler:
                 except Exception as e:
                     self.logger.error(f"JSON 파일 '{json_file_path}' 번역 적용 중 오류 발생: {e}")
 
+                finally:
+                    tracker.advance()
+
+        tracker.finish()
         return updated_entries_count
 
     def _find_file_recursive(self, folder, filename):
@@ -354,7 +839,7 @@ class CSVHandler:
         CSV 파일들에서 일괄 치환
 
         Args:
-            csv_folder: CSV 폴더 경로
+            csv_folder: CSV 폴더 경로 (또는 프로젝트 DB 파일)
             find_text: 찾을 문자열
             replace_text: 바꿀 문자열
             translated_only: Translation 열만 변경할지 여부
@@ -362,6 +847,10 @@ class CSVHandler:
         Returns:
             처리된 파일 수
         """
+        if ProjectDatabase.is_project_file(csv_folder):
+            with ProjectDatabase(csv_folder) as project_db:
+                return project_db.batch_replace(find_text, replace_text, translated_only)
+
         csv_files = list(Path(csv_folder).glob('*.csv'))
         count = 0
 
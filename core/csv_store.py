@@ -0,0 +1,373 @@
+"""
+CSV 번역 저장소 모듈 (행 오프셋 인덱스 기반 지연 로딩)
+"""
+import csv
+import io
+import mmap
+import os
+from bisect import bisect_right
+from collections import OrderedDict
+from pathlib import Path
+from utils.logger import get_logger
+
+
+class _CSVFileIndex:
+    """CSV 파일 하나의 레코드 바이트 오프셋 인덱스"""
+
+    def __init__(self, path):
+        """
+        Args:
+            path: CSV 파일 경로
+        """
+        self.path = Path(path)
+        self.header = []
+        self.offsets = []  # 각 레코드(헤더 제외)의 시작 바이트 오프셋 + 파일 끝
+        self._file = None
+        self._mm = None
+        self.open()
+
+    def open(self):
+        """파일을 메모리 매핑하고 레코드 경계를 인덱싱"""
+        self._file = open(self.path, 'rb')
+        if os.path.getsize(self.path) == 0:
+            self._mm = b''
+        else:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        mm = self._mm
+        size = len(mm)
+        pos = 3 if mm[:3] == b'\xef\xbb\xbf' else 0
+        record_starts = []
+
+        # 따옴표 안의 줄바꿈은 레코드 경계가 아님 (따옴표 수가 짝수일 때만 레코드 종료)
+        while pos < size:
+            record_starts.append(pos)
+            quotes = 0
+            while True:
+                end = mm.find(b'\n', pos)
+                end = size if end == -1 else end + 1
+                quotes += mm[pos:end].count(b'"')
+                pos = end
+                if quotes % 2 == 0 or pos >= size:
+                    break
+
+        if record_starts:
+            self.header = self._parse(record_starts[0], record_starts[1] if len(record_starts) > 1 else size)
+            self.offsets = record_starts[1:] + [size]
+        else:
+            self.offsets = [size]
+
+    def close(self):
+        """메모리 매핑 해제"""
+        if isinstance(self._mm, mmap.mmap):
+            self._mm.close()
+        if self._file:
+            self._file.close()
+        self._mm = None
+        self._file = None
+
+    def is_open(self):
+        """메모리 매핑 여부"""
+        return self._mm is not None
+
+    def row_count(self):
+        """데이터 행 수"""
+        return len(self.offsets) - 1
+
+    def _parse(self, start, end):
+        """바이트 범위를 CSV 레코드 하나로 파싱"""
+        text = self._mm[start:end].decode('utf-8', errors='replace')
+        return next(csv.reader(io.StringIO(text, newline='')), [])
+
+    def read_row(self, local_row):
+        """
+        데이터 행 하나 파싱
+
+        Args:
+            local_row: 파일 내 0-based 행 번호
+
+        Returns:
+            필드 리스트
+        """
+        return self._parse(self.offsets[local_row], self.offsets[local_row + 1])
+
+    def raw(self, start, end):
+        """원본 바이트 범위 반환"""
+        return self._mm[start:end]
+
+    def find(self, needle, start_row):
+        """
+        원본 바이트에서 검색어가 나타나는 행 번호 반환 (start_row 이후)
+
+        Args:
+            needle: 검색할 바이트열 (CSV 이스케이프 적용)
+            start_row: 검색 시작 행
+
+        Returns:
+            파일 내 행 번호 (없으면 None)
+        """
+        if start_row >= self.row_count():
+            return None
+        pos = self._mm.find(needle, self.offsets[start_row])
+        if pos == -1:
+            return None
+        return bisect_right(self.offsets, pos) - 1
+
+    def line_terminator(self, local_row):
+        """행의 줄바꿈 문자 (\\r\\n 또는 \\n)"""
+        end = self.offsets[local_row + 1]
+        return '\r\n' if self._mm[end - 2:end] == b'\r\n' else '\n'
+
+
+class CSVStore:
+    """
+    CSV 폴더를 하나의 표로 다루는 저장소
+
+    각 파일은 레코드 시작 오프셋만 인덱싱하고, 행은 요청될 때만 파싱합니다(LRU 캐시).
+    편집된 번역은 메모리에 보관되며 저장 시 변경된 행만 다시 기록합니다.
+    """
+
+    CACHE_SIZE = 2000
+
+    def __init__(self):
+        """저장소 초기화"""
+        self.logger = get_logger()
+        self.folder = None
+        self.files = []
+        self._starts = [0]  # 각 파일의 전역 시작 행 (+ 전체 행 수)
+        self._cache = OrderedDict()
+        self._dirty = {}  # {전역 행: 수정된 번역}
+        self._key_index = None
+
+    def open_folder(self, csv_folder):
+        """
+        CSV 폴더 열기
+
+        Args:
+            csv_folder: CSV 폴더 경로
+
+        Returns:
+            전체 행 수
+        """
+        self.close()
+        self.folder = Path(csv_folder)
+
+        for csv_file in sorted(self.folder.glob('*.csv')):
+            try:
+                self.files.append(_CSVFileIndex(csv_file))
+            except Exception as e:
+                self.logger.error(f"CSV 인덱싱 실패 ({csv_file}): {e}")
+
+        self._rebuild_starts()
+        self.logger.info(f"CSV 저장소 열기 완료: {len(self.files)}개 파일, {self.row_count()}행")
+        return self.row_count()
+
+    def close(self):
+        """열린 파일 모두 닫기"""
+        for file_index in self.files:
+            file_index.close()
+        self.files = []
+        self._starts = [0]
+        self._cache.clear()
+        self._dirty.clear()
+        self._key_index = None
+
+    def _rebuild_starts(self):
+        """파일별 전역 시작 행 재계산"""
+        self._starts = [0]
+        for file_index in self.files:
+            self._starts.append(self._starts[-1] + file_index.row_count())
+
+    def row_count(self):
+        """전체 행 수"""
+        return self._starts[-1]
+
+    def _locate(self, row):
+        """전역 행 번호 → (파일 인덱스, 파일 내 행 번호)"""
+        file_no = bisect_right(self._starts, row) - 1
+        return file_no, row - self._starts[file_no]
+
+    def get_row(self, row):
+        """
+        행 데이터 반환 (편집 내용 반영)
+
+        Args:
+            row: 전역 행 번호
+
+        Returns:
+            {열 이름: 값} 딕셔너리
+        """
+        record = self._cache.get(row)
+        if record is None:
+            file_no, local_row = self._locate(row)
+            file_index = self.files[file_no]
+            fields = file_index.read_row(local_row)
+            record = dict(zip(file_index.header, fields))
+            record.setdefault('FileName', '')
+            record.setdefault('EntryID', '')
+            record.setdefault('OriginalText', '')
+            record.setdefault('Translation', '')
+            record['_csv'] = file_index.path.name
+            self._cache[row] = record
+            if len(self._cache) > self.CACHE_SIZE:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(row)
+
+        if row in self._dirty:
+            record = dict(record, Translation=self._dirty[row])
+        return record
+
+    def set_translation(self, row, text):
+        """
+        번역 수정 (저장 전까지 메모리에 보관)
+
+        Args:
+            row: 전역 행 번호
+            text: 새 번역문
+        """
+        self._dirty[row] = text
+
+    def is_dirty(self, row):
+        """수정된 행인지 여부"""
+        return row in self._dirty
+
+    def dirty_count(self):
+        """저장되지 않은 수정 행 수"""
+        return len(self._dirty)
+
+    def search(self, text, start_row=0, columns=('OriginalText', 'Translation')):
+        """
+        텍스트가 포함된 다음 행 검색 (원본 바이트를 직접 검색 후 오프셋 인덱스로 행 계산)
+
+        Args:
+            text: 검색어
+            start_row: 검색 시작 전역 행
+            columns: 검색 대상 열
+
+        Returns:
+            전역 행 번호 (없으면 None)
+        """
+        if not text:
+            return None
+
+        needle = text.replace('"', '""').encode('utf-8')
+        found = None
+
+        file_no, local_row = self._locate(start_row) if start_row < self.row_count() else (len(self.files), 0)
+        while file_no < len(self.files) and found is None:
+            file_index = self.files[file_no]
+            while True:
+                hit = file_index.find(needle, local_row)
+                if hit is None:
+                    break
+                row = self._starts[file_no] + hit
+                record = self.get_row(row)
+                if any(text in record.get(column, '') for column in columns):
+                    found = row
+                    break
+                local_row = hit + 1
+            file_no += 1
+            local_row = 0
+
+        # 저장되지 않은 수정 내용에서도 검색
+        if 'Translation' in columns:
+            for row, translation in self._dirty.items():
+                if row >= start_row and (found is None or row < found) and text in translation:
+                    found = row
+
+        return found
+
+    def build_key_index(self):
+        """(FileName, EntryID) → 전역 행 키 인덱스 생성"""
+        key_index = {}
+        for file_no, file_index in enumerate(self.files):
+            try:
+                name_col = file_index.header.index('FileName')
+                id_col = file_index.header.index('EntryID')
+            except ValueError:
+                continue
+            for local_row in range(file_index.row_count()):
+                fields = file_index.read_row(local_row)
+                if len(fields) > max(name_col, id_col):
+                    row = self._starts[file_no] + local_row
+                    key_index.setdefault((fields[name_col], fields[id_col]), row)
+                    key_index.setdefault((None, fields[id_col]), row)
+        self._key_index = key_index
+
+    def find_entry(self, entry_id, file_name=None):
+        """
+        EntryID로 행 찾기 (키 인덱스가 없으면 먼저 생성)
+
+        Args:
+            entry_id: EntryID
+            file_name: FileName (None이면 첫 번째 일치 항목)
+
+        Returns:
+            전역 행 번호 (없으면 None)
+        """
+        if self._key_index is None:
+            self.build_key_index()
+
+        return self._key_index.get((file_name, str(entry_id)))
+
+    def save(self):
+        """
+        수정된 행만 다시 기록 (수정된 파일만, 임시 파일 후 교체)
+
+        Returns:
+            저장된 행 수
+        """
+        if not self._dirty:
+            return 0
+
+        by_file = {}
+        for row, translation in self._dirty.items():
+            file_no, local_row = self._locate(row)
+            by_file.setdefault(file_no, {})[local_row] = translation
+
+        saved = 0
+        for file_no, rows in by_file.items():
+            file_index = self.files[file_no]
+            try:
+                header = file_index.header
+                if 'Translation' not in header:
+                    self.logger.error(f"Translation 열이 없음: {file_index.path}")
+                    continue
+                translation_col = header.index('Translation')
+
+                temp_path = file_index.path.with_suffix('.csv.tmp')
+                with open(temp_path, 'wb') as f:
+                    prev_end = 0
+                    for local_row in sorted(rows):
+                        start = file_index.offsets[local_row]
+                        f.write(file_index.raw(prev_end, start))
+
+                        fields = file_index.read_row(local_row)
+                        fields += [''] * (len(header) - len(fields))
+                        fields[translation_col] = rows[local_row]
+
+                        buffer = io.StringIO()
+                        csv.writer(buffer, lineterminator=file_index.line_terminator(local_row)).writerow(fields)
+                        f.write(buffer.getvalue().encode('utf-8'))
+                        prev_end = file_index.offsets[local_row + 1]
+                    f.write(file_index.raw(prev_end, file_index.offsets[-1]))
+
+                file_index.close()
+                os.replace(temp_path, file_index.path)
+                file_index.open()
+                saved += len(rows)
+                self.logger.info(f"CSV 저장 완료: {file_index.path.name} ({len(rows)}행)")
+
+            except Exception as e:
+                self.logger.error(f"CSV 저장 실패 ({file_index.path}): {e}")
+                if not file_index.is_open():
+                    file_index.open()
+                continue
+
+            for local_row in rows:
+                self._dirty.pop(self._starts[file_no] + local_row, None)
+
+        self._rebuild_starts()
+        self._cache.clear()
+        return saved
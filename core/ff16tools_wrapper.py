@@ -3,6 +3,7 @@ FF16Tools 래퍼 클래스
 """
 import subprocess
 from pathlib import Path
+from core.process_budget import get_process_budget
 from utils.logger import get_logger
 
 
@@ -23,16 +24,38 @@ class FF16ToolsWrapper:
             self.logger.error(f"FF16Tools를 찾을 수 없음: {exe_path}")
             raise FileNotFoundError(f"FF16Tools를 찾을 수 없음: {exe_path}")
 
-    def run_command(self, args, callback=None):
+    def run_command(self, args, callback=None, cancel_token=None):
         """
         FF16Tools 명령 실행
 
         Args:
             args: 명령어 인자 리스트
             callback: 출력을 받을 콜백 함수
+            cancel_token: 취소 토큰 (취소되면 프로세스 종료)
 
         Returns:
-            반환 코드 (0: 성공, 그 외: 실패)
+            반환 코드 (0: 성공, 그 외: 실패, 취소: -1)
+        """
+        # 전역 예산에서 실행 슬롯 받기 (다른 작업과 합쳐 동시 실행 수 제한)
+        budget = get_process_budget()
+        if not budget.acquire(cancel_token):
+            return -1
+        try:
+            return self._run_process(args, callback, cancel_token)
+        finally:
+            budget.release()
+
+    def _run_process(self, args, callback=None, cancel_token=None):
+        """
+        FF16Tools 프로세스 실행 및 출력 처리
+
+        Args:
+            args: 명령어 인자 리스트
+            callback: 출력을 받을 콜백 함수
+            cancel_token: 취소 토큰
+
+        Returns:
+            반환 코드
         """
         cmd = [str(self.exe_path)] + args
         self.logger.info(f"FF16Tools 실행: {' '.join(cmd)}")
@@ -53,37 +76,52 @@ class FF16ToolsWrapper:
                 errors='ignore',
                 creationflags=creationflags
             )
-
-            # 실시간 출력
-            for line in process.stdout:
-                line = line.strip()
-                if line:
-                    self.logger.debug(f"FF16Tools: {line}")
-                    if callback:
-                        callback(line)
-
-            # 에러 출력
-            stderr_output = process.stderr.read()
-            if stderr_output:
-                self.logger.error(f"FF16Tools 에러: {stderr_output}")
-
-                # .NET 오류 감지
-                if ".NET" in stderr_output or "dotnet" in stderr_output:
-                    error_msg = "FF16Tools 실행 실패: .NET Runtime이 필요합니다.\n\n"
-                    if "version '9.0.0'" in stderr_output:
-                        error_msg += ".NET 9.0 Runtime을 설치해주세요.\n"
-                        error_msg += "다운로드: https://dotnet.microsoft.com/download/dotnet/9.0"
+            if cancel_token is not None:
+                cancel_token.register_process(process)
+
+            try:
+                # 실시간 출력
+                for line in process.stdout:
+                    line = line.strip()
+                    if line:
+                        self.logger.debug(f"FF16Tools: {line}")
+                        if callback:
+                            callback(line)
+
+                # 에러 출력
+                stderr_output = process.stderr.read()
+                if stderr_output:
+                    self.logger.error(f"FF16Tools 에러: {stderr_output}")
+
+                    # .NET 오류 감지
+                    if ".NET" in stderr_output or "dotnet" in stderr_output:
+                        error_msg = "FF16Tools 실행 실패: .NET Runtime이 필요합니다.\n\n"
+                        if "version '9.0.0'" in stderr_output:
+                            error_msg += ".NET 9.0 Runtime을 설치해주세요.\n"
+                            error_msg += "다운로드: https://dotnet.microsoft.com/download/dotnet/9.0"
+                        else:
+                            error_msg += "필요한 .NET Runtime을 설치해주세요.\n"
+                            error_msg += stderr_output[:200]  # 처음 200자만
+
+                        if callback:
+                            callback(error_msg)
                     else:
-                        error_msg += "필요한 .NET Runtime을 설치해주세요.\n"
-                        error_msg += stderr_output[:200]  # 처음 200자만
-
-                    if callback:
-                        callback(error_msg)
-                else:
-                    if callback:
-                        callback(f"ERROR: {stderr_output}")
+                        if callback:
+                            callback(f"ERROR: {stderr_output}")
+
+                process.wait()
+            finally:
+                # 출력 처리 중 예외가 나도 프로세스를 정리하고 취소 토큰에서 해제
+                if process.poll() is None:
+                    process.kill()
+                    process.wait()
+                if cancel_token is not None:
+                    cancel_token.unregister_process(process)
+
+            if cancel_token is not None and cancel_token.is_cancelled():
+                self.logger.warning(f"FF16Tools 실행 취소됨: {' '.join(args)}")
+                return -1
 
-            process.wait()
             self.logger.info(f"FF16Tools 종료 코드: {process.returncode}")
             return process.returncode
 
@@ -93,7 +131,7 @@ class FF16ToolsWrapper:
                 callback(f"실행 실패: {e}")
             return -1
 
-    def unpack_all(self, pac_file, output_folder, game='fft'):
+    def unpack_all(self, pac_file, output_folder, game='fft', cancel_token=None):
         """
         PAC 파일 언팩
 
@@ -101,14 +139,15 @@ class FF16ToolsWrapper:
             pac_file: 언팩할 PAC 파일 경로
             output_folder: 출력 폴더 경로
             game: 게임 종류 (fft 또는 ff16)
+            cancel_token: 취소 토큰
 
         Returns:
             성공 여부
         """
         args = ['unpack-all', '-i', str(pac_file), '-o', str(output_folder), '-g', game]
-        return self.run_command(args) == 0
+        return self.run_command(args, cancel_token=cancel_token) == 0
 
-    def pack(self, input_folder, output_pac, game='fft'):
+    def pack(self, input_folder, output_pac, game='fft', cancel_token=None):
         """
         PAC 파일 팩
 
@@ -116,14 +155,15 @@ class FF16ToolsWrapper:
             input_folder: 팩킹할 폴더 경로
             output_pac: 출력 PAC 파일 경로
             game: 게임 종류 (fft 또는 ff16)
+            cancel_token: 취소 토큰
 
         Returns:
             성공 여부
         """
         args = ['pack', '-i', str(input_folder), '-o', str(output_pac), '-g', game]
-        return self.run_command(args) == 0
+        return self.run_command(args, cancel_token=cancel_token) == 0
 
-    def pzd_to_yaml(self, pzd_file, game='fft', callback=None):
+    def pzd_to_yaml(self, pzd_file, game='fft', callback=None, cancel_token=None):
         """
         PZD 파일을 YAML로 변환
 
@@ -131,6 +171,7 @@ class FF16ToolsWrapper:
             pzd_file: PZD 파일 경로
             game: 사용 안 함 (pzd-to-yaml은 game type을 받지 않음)
             callback: 진행 상황 콜백
+            cancel_token: 취소 토큰
 
         Returns:
             성공 여부
@@ -144,7 +185,7 @@ class FF16ToolsWrapper:
             expected_yaml.unlink()
 
         args = ['pzd-conv', '-i', str(pzd_file)]
-        result = self.run_command(args, callback) == 0
+        result = self.run_command(args, callback, cancel_token) == 0
 
         # 변환 후 YAML 파일 생성 확인
         if result and not expected_yaml.exists():
@@ -153,16 +194,17 @@ class FF16ToolsWrapper:
 
         return result
 
-    def yaml_to_pzd(self, yaml_file, game='fft'):
+    def yaml_to_pzd(self, yaml_file, game='fft', cancel_token=None):
         """
         YAML 파일을 PZD로 변환
 
         Args:
             yaml_file: YAML 파일 경로
             yaml to pzd는 game을 받지 않음.
+            cancel_token: 취소 토큰
 
         Returns:
             성공 여부
         """
         args = ['pzd-conv', '-i', str(yaml_file)]
-        return self.run_command(args) == 0
+        return self.run_command(args, cancel_token=cancel_token) == 0
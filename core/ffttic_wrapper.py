@@ -3,6 +3,7 @@ ffttic-nxdtext 래퍼 클래스
 """
 import subprocess
 from pathlib import Path
+from core.process_budget import get_process_budget
 from utils.logger import get_logger
 
 
@@ -23,16 +24,38 @@ class FFTTicNXDTextWrapper:
             self.logger.error(f"ffttic-nxdtext를 찾을 수 없음: {exe_path}")
             raise FileNotFoundError(f"ffttic-nxdtext를 찾을 수 없음: {exe_path}")
 
-    def run_command(self, args, callback=None):
+    def run_command(self, args, callback=None, cancel_token=None):
         """
         ffttic-nxdtext 명령 실행
 
         Args:
             args: 명령어 인자 리스트
             callback: 출력을 받을 콜백 함수
+            cancel_token: 취소 토큰 (취소되면 프로세스 종료)
 
         Returns:
-            반환 코드 (0: 성공, 그 외: 실패)
+            반환 코드 (0: 성공, 그 외: 실패, 취소: -1)
+        """
+        # 전역 예산에서 실행 슬롯 받기 (다른 작업과 합쳐 동시 실행 수 제한)
+        budget = get_process_budget()
+        if not budget.acquire(cancel_token):
+            return -1
+        try:
+            return self._run_process(args, callback, cancel_token)
+        finally:
+            budget.release()
+
+    def _run_process(self, args, callback=None, cancel_token=None):
+        """
+        ffttic-nxdtext 프로세스 실행 및 출력 처리
+
+        Args:
+            args: 명령어 인자 리스트
+            callback: 출력을 받을 콜백 함수
+            cancel_token: 취소 토큰
+
+        Returns:
+            반환 코드
         """
         cmd = [str(self.exe_path)] + args
         self.logger.info(f"ffttic-nxdtext 실행: {' '.join(cmd)}")
@@ -53,23 +76,38 @@ class FFTTicNXDTextWrapper:
                 errors='ignore',
                 creationflags=creationflags
             )
-
-            # 실시간 출력
-            for line in process.stdout:
-                line = line.strip()
-                if line:
-                    self.logger.debug(f"ffttic-nxdtext: {line}")
+            if cancel_token is not None:
+                cancel_token.register_process(process)
+
+            try:
+                # 실시간 출력
+                for line in process.stdout:
+                    line = line.strip()
+                    if line:
+                        self.logger.debug(f"ffttic-nxdtext: {line}")
+                        if callback:
+                            callback(line)
+
+                # 에러 출력
+                stderr_output = process.stderr.read()
+                if stderr_output:
+                    self.logger.error(f"ffttic-nxdtext 에러: {stderr_output}")
                     if callback:
-                        callback(line)
+                        callback(f"ERROR: {stderr_output}")
+
+                process.wait()
+            finally:
+                # 출력 처리 중 예외가 나도 프로세스를 정리하고 취소 토큰에서 해제
+                if process.poll() is None:
+                    process.kill()
+                    process.wait()
+                if cancel_token is not None:
+                    cancel_token.unregister_process(process)
 
-            # 에러 출력
-            stderr_output = process.stderr.read()
-            if stderr_output:
-                self.logger.error(f"ffttic-nxdtext 에러: {stderr_output}")
-                if callback:
-                    callback(f"ERROR: {stderr_output}")
+            if cancel_token is not None and cancel_token.is_cancelled():
+                self.logger.warning(f"ffttic-nxdtext 실행 취소됨: {' '.join(args)}")
+                return -1
 
-            process.wait()
             self.logger.info(f"ffttic-nxdtext 종료 코드: {process.returncode}")
             return process.returncode
 
@@ -79,13 +117,14 @@ class FFTTicNXDTextWrapper:
                 callback(f"실행 실패: {e}")
             return -1
 
-    def nxd_to_json(self, nxd_file, output_json=None):
+    def nxd_to_json(self, nxd_file, output_json=None, cancel_token=None):
         """
         NXD 파일을 JSON으로 변환
 
         Args:
             nxd_file: NXD 파일 경로
             output_json: 출력 JSON 파일 경로 (None이면 자동 생성)
+            cancel_token: 취소 토큰
 
         Returns:
             성공 여부
@@ -94,9 +133,9 @@ class FFTTicNXDTextWrapper:
             output_json = Path(nxd_file).with_suffix('.json')
 
         args = ['export', str(nxd_file), '--out-json', str(output_json)]
-        return self.run_command(args) == 0
+        return self.run_command(args, cancel_token=cancel_token) == 0
 
-    def json_to_nxd(self, original_nxd, json_file, output_nxd=None):
+    def json_to_nxd(self, original_nxd, json_file, output_nxd=None, cancel_token=None):
         """
         JSON 파일을 NXD로 변환 (원본 NXD 파일 필요)
 
@@ -104,6 +143,7 @@ class FFTTicNXDTextWrapper:
             original_nxd: 원본 NXD 파일 경로
             json_file: JSON 파일 경로
             output_nxd: 출력 NXD 파일 경로 (None이면 원본 덮어쓰기)
+            cancel_token: 취소 토큰
 
         Returns:
             성공 여부
@@ -112,4 +152,4 @@ class FFTTicNXDTextWrapper:
             output_nxd = original_nxd
 
         args = ['import', str(original_nxd), '--json', str(json_file), '--out', str(output_nxd)]
-        return self.run_command(args) == 0
+        return self.run_command(args, cancel_token=cancel_token) == 0
@@ -0,0 +1,214 @@
+"""
+용어집 검사 모듈 (Aho-Corasick 다중 패턴 검색)
+"""
+import csv
+from collections import deque
+from core.validator import CSVValidator
+from utils.logger import get_logger
+
+
+class AhoCorasick:
+    """
+    여러 문자열을 한 번에 찾는 Aho-Corasick 오토마톤
+
+    패턴 수와 관계없이 텍스트 길이 + 일치 수에 비례하는 시간으로 검색합니다.
+    """
+
+    def __init__(self):
+        """빈 오토마톤 생성"""
+        self._goto = [{}]   # 노드별 {문자: 다음 노드}
+        self._fail = [0]    # 노드별 실패 링크
+        self._output = [[]]  # 노드별 일치 패턴 번호 (실패 링크의 출력 포함)
+        self._built = False
+
+    def add(self, pattern, value):
+        """
+        패턴 추가 (build 전에 호출)
+
+        Args:
+            pattern: 찾을 문자열
+            value: 일치 시 반환할 값
+        """
+        if not pattern:
+            return
+
+        node = 0
+        for ch in pattern:
+            next_node = self._goto[node].get(ch)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][ch] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            node = next_node
+        self._output[node].append(value)
+        self._built = False
+
+    def build(self):
+        """실패 링크 계산 (너비 우선)"""
+        queue = deque(self._goto[0].values())
+        for node in queue:
+            self._fail[node] = 0
+
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                fail = self._goto[fail].get(ch, 0)
+                self._fail[child] = fail
+                if self._output[fail]:
+                    self._output[child] = self._output[child] + self._output[fail]
+
+        self._built = True
+
+    def iter_matches(self, text):
+        """
+        텍스트에서 모든 패턴 일치 검색
+
+        Args:
+            text: 검색할 텍스트
+
+        Yields:
+            (일치가 끝나는 위치, 패턴 값)
+        """
+        if not self._built:
+            self.build()
+
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        node = 0
+        for pos, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            for value in output[node]:
+                yield pos, value
+
+
+class GlossaryChecker:
+    """
+    원문에 용어집 용어가 있으면 번역문에 지정된 번역어가 있는지 검사
+
+    용어집 CSV는 Source/Target 열(없으면 앞의 두 열)을 사용하며,
+    Target에 '|'로 여러 허용 번역어를 지정할 수 있습니다.
+    """
+
+    ISSUE = CSVValidator.GLOSSARY_ISSUE
+
+    def __init__(self):
+        """용어집 검사기 초기화"""
+        self.logger = get_logger()
+        self.terms = []  # [(원문 용어, [허용 번역어, ...])]
+        self.automaton = AhoCorasick()
+
+    def add_term(self, source, targets):
+        """
+        용어 추가
+
+        Args:
+            source: 원문 용어
+            targets: 허용 번역어 리스트
+        """
+        source = source.strip()
+        targets = [target.strip() for target in targets if target and target.strip()]
+        if not source or not targets:
+            return
+
+        self.automaton.add(source, len(self.terms))
+        self.terms.append((source, targets))
+
+    def load(self, glossary_file):
+        """
+        용어집 CSV 로드
+
+        Args:
+            glossary_file: 용어집 CSV 경로
+
+        Returns:
+            로드된 용어 수
+        """
+        with open(glossary_file, 'r', encoding='utf-8-sig', newline='') as f:
+            reader = csv.reader(f)
+            header = next(reader, [])
+            if 'Source' in header and 'Target' in header:
+                source_col, target_col = header.index('Source'), header.index('Target')
+            else:
+                # 헤더가 없으면 첫 행도 용어로 사용
+                source_col, target_col = 0, 1
+                if len(header) > 1:
+                    self.add_term(header[0], header[1].split('|'))
+
+            for row in reader:
+                if len(row) > max(source_col, target_col):
+                    self.add_term(row[source_col], row[target_col].split('|'))
+
+        self.automaton.build()
+        self.logger.info(f"용어집 로드 완료: {glossary_file} ({len(self.terms)}개 용어)")
+        return len(self.terms)
+
+    def check_text(self, original, translated):
+        """
+        행 하나 검사
+
+        Args:
+            original: 원문
+            translated: 번역문
+
+        Returns:
+            번역어가 빠진 용어 리스트 [(원문 용어, [허용 번역어, ...])]
+        """
+        missing = []
+        seen = set()
+        for _, term_no in self.automaton.iter_matches(original):
+            if term_no in seen:
+                continue
+            seen.add(term_no)
+            source, targets = self.terms[term_no]
+            if not any(target in translated for target in targets):
+                missing.append((source, targets))
+        return missing
+
+    def check_folder(self, csv_folder, on_file_done=None):
+        """
+        CSV 폴더 전체 검사 (원문은 오토마톤으로 한 번만 훑음)
+
+        Args:
+            csv_folder: 검사할 CSV 폴더 경로 (또는 프로젝트 DB 파일)
+            on_file_done: 파일 하나의 검사가 끝날 때마다 해당 파일의 결과 리스트를 받는 콜백
+
+        Returns:
+            검증 결과 리스트 [{file, row, issues, text, terms}, ...]
+        """
+        results = []
+        file_results = []
+
+        for csv_name, row_no, original, translated in CSVValidator().iter_translated_rows(csv_folder):
+            if file_results and file_results[-1]['file'] != csv_name:
+                results.extend(file_results)
+                if on_file_done:
+                    on_file_done(file_results)
+                file_results = []
+
+            missing = self.check_text(original, translated)
+            if missing:
+                terms = ', '.join(f"{source}→{'|'.join(targets)}" for source, targets in missing)
+                file_results.append({
+                    'file': csv_name,
+                    'row': row_no,
+                    'issues': self.ISSUE,
+                    'text': f"[{terms}] {translated}"[:100],
+                    'terms': terms
+                })
+
+        if file_results:
+            results.extend(file_results)
+            if on_file_done:
+                on_file_done(file_results)
+
+        self.logger.info(f"용어집 검사 완료. 총 {len(results)}개 문제 발견")
+        return results
@@ -0,0 +1,207 @@
+"""
+파일 트리 매니페스트 모듈 (게임 버전 간 변경 파일 비교)
+"""
+import os
+import json
+import hashlib
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from utils.logger import get_logger
+
+
+class TreeManifest:
+    """
+    언팩된 폴더의 파일 목록과 내용 해시
+
+    os.scandir로 트리를 훑고 blake2b 해시를 스레드 풀에서 병렬 계산합니다.
+    이전 매니페스트와 크기/수정 시각이 같은 파일은 해시를 다시 계산하지 않습니다.
+    """
+
+    # 매니페스트 파일명 (트리 루트에 저장)
+    MANIFEST_FILE = '.manifest.json'
+    MANIFEST_PREFIX = '.manifest'
+    VERSION = 1
+
+    # 기본 추적 대상 확장자
+    EXTENSIONS = ('.nxd', '.pzd', '.json', '.yaml')
+
+    CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self, root, files=None, created=None):
+        """
+        Args:
+            root: 트리 루트 경로
+            files: {상대 경로: {'size', 'mtime_ns', 'hash'}}
+            created: 생성 시각 (ISO 문자열)
+        """
+        self.root = Path(root)
+        self.files = files or {}
+        self.created = created or datetime.now().isoformat(timespec='seconds')
+
+    @classmethod
+    def _scan(cls, root, extensions):
+        """
+        트리 탐색 (os.scandir, 재귀 대신 스택 사용)
+
+        Returns:
+            [(상대 경로, 절대 경로, 크기, 수정 시각)]
+        """
+        entries = []
+        stack = [(str(root), '')]
+        while stack:
+            directory, prefix = stack.pop()
+            try:
+                with os.scandir(directory) as iterator:
+                    for entry in iterator:
+                        relative = prefix + entry.name
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append((entry.path, relative + '/'))
+                        elif entry.is_file(follow_symlinks=False):
+                            if entry.name.startswith(cls.MANIFEST_PREFIX):
+                                continue
+                            if extensions and os.path.splitext(entry.name)[1].lower() not in extensions:
+                                continue
+                            stat = entry.stat(follow_symlinks=False)
+                            entries.append((relative, entry.path, stat.st_size, stat.st_mtime_ns))
+            except OSError as e:
+                get_logger().warning(f"폴더 탐색 실패 ({directory}): {e}")
+        return entries
+
+    @classmethod
+    def _hash_file(cls, path):
+        """파일 내용 blake2b 해시"""
+        digest = hashlib.blake2b(digest_size=16)
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(cls.CHUNK_SIZE), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    @classmethod
+    def build(cls, root, extensions=EXTENSIONS, previous=None, max_workers=None):
+        """
+        트리 매니페스트 생성
+
+        Args:
+            root: 트리 루트 경로
+            extensions: 추적할 확장자 (None이면 모든 파일)
+            previous: 이전 매니페스트 (크기/수정 시각이 같으면 해시 재사용)
+            max_workers: 해시 계산 스레드 수 (기본값: CPU 코어 수)
+
+        Returns:
+            TreeManifest
+        """
+        logger = get_logger()
+        if max_workers is None:
+            max_workers = min(max(multiprocessing.cpu_count(), 2), 8)
+
+        entries = cls._scan(root, extensions)
+        previous_files = previous.files if previous else {}
+        files = {}
+        to_hash = []
+
+        for relative, path, size, mtime_ns in entries:
+            old = previous_files.get(relative)
+            if old and old['size'] == size and old['mtime_ns'] == mtime_ns:
+                files[relative] = old
+            else:
+                to_hash.append((relative, path, size, mtime_ns))
+
+        # hashlib은 큰 버퍼 해시 중 GIL을 해제하므로 스레드로 병렬화
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            digests = executor.map(lambda item: cls._hash_file(item[1]), to_hash)
+            for (relative, _, size, mtime_ns), digest in zip(to_hash, digests):
+                files[relative] = {'size': size, 'mtime_ns': mtime_ns, 'hash': digest}
+
+        logger.info(f"매니페스트 생성 완료: {root} ({len(files)}개 파일, {len(to_hash)}개 해시 계산)")
+        return cls(root, files)
+
+    @classmethod
+    def load(cls, manifest_file):
+        """
+        저장된 매니페스트 로드
+
+        Args:
+            manifest_file: 매니페스트 파일 경로 (폴더면 그 안의 MANIFEST_FILE)
+
+        Returns:
+            TreeManifest (없거나 읽을 수 없으면 None)
+        """
+        manifest_path = Path(manifest_file)
+        if manifest_path.is_dir():
+            manifest_path = manifest_path / cls.MANIFEST_FILE
+        if not manifest_path.exists():
+            return None
+
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') != cls.VERSION:
+                return None
+            return cls(data.get('root', manifest_path.parent), data['files'], data.get('created'))
+        except Exception as e:
+            get_logger().warning(f"매니페스트 로드 실패 ({manifest_path}): {e}")
+            return None
+
+    def save(self, manifest_file=None):
+        """
+        매니페스트 저장
+
+        Args:
+            manifest_file: 저장 경로 (None이면 트리 루트의 MANIFEST_FILE)
+
+        Returns:
+            저장된 경로
+        """
+        manifest_path = Path(manifest_file) if manifest_file else self.root / self.MANIFEST_FILE
+        with open(manifest_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'version': self.VERSION,
+                'root': str(self.root),
+                'created': self.created,
+                'files': self.files
+            }, f, ensure_ascii=False)
+        return manifest_path
+
+    def diff(self, other):
+        """
+        두 매니페스트 비교 (self: 이전 버전, other: 새 버전)
+
+        Args:
+            other: 새 버전 매니페스트
+
+        Returns:
+            {'added': [...], 'removed': [...], 'modified': [...]} (상대 경로, 정렬됨)
+        """
+        old_files = self.files
+        new_files = other.files
+        return {
+            'added': sorted(path for path in new_files if path not in old_files),
+            'removed': sorted(path for path in old_files if path not in new_files),
+            'modified': sorted(path for path, info in new_files.items()
+                               if path in old_files and old_files[path]['hash'] != info['hash'])
+        }
+
+    @classmethod
+    def changed_files(cls, root, extensions=EXTENSIONS, manifest_file=None):
+        """
+        저장된 매니페스트 이후 추가/변경된 파일 목록
+
+        작업이 성공한 뒤 반환된 매니페스트를 save()해야 다음 비교의 기준이 됩니다.
+
+        Args:
+            root: 트리 루트 경로
+            extensions: 추적할 확장자
+            manifest_file: 기준 매니페스트 경로 (None이면 트리 루트의 MANIFEST_FILE)
+
+        Returns:
+            (추가/변경된 파일 상대 경로 리스트 (저장된 매니페스트가 없으면 None), 새 매니페스트)
+        """
+        previous = cls.load(manifest_file or root)
+        current = cls.build(root, extensions, previous=previous)
+        if previous is None:
+            return None, current
+
+        changes = previous.diff(current)
+        return changes['added'] + changes['modified'], current
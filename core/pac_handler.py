@@ -5,6 +5,8 @@ from pathlib import Path
 from core.ff16tools_wrapper import FF16ToolsWrapper
 from core.converter import Converter
 from core.config_manager import get_config_manager
+from core.progress import ProgressTracker
+from core.cancellation import OperationCancelled, check_cancelled
 from utils.logger import get_logger
 
 
@@ -28,7 +30,8 @@ class PACHandler:
                 self.logger.error(f"FF16Tools 초기화 실패: {e}")
 
     def unpack_and_convert(self, pac_file, output_folder, convert_nxd=True,
-                          convert_pzd=True, game='fft', callback=None):
+                          convert_pzd=True, game='fft', callback=None, progress=None,
+                          cancel_token=None):
         """
         PAC 파일 언팩 및 NXD/PZD 변환
 
@@ -39,6 +42,8 @@ class PACHandler:
             convert_pzd: PZD → YAML 변환 여부
             game: 게임 종류 (fft 또는 ff16)
             callback: 진행 상황 콜백 함수
+            progress: ProgressEvent를 받는 콜백 (단계별 처리 수/경과 시간)
+            cancel_token: 취소 토큰 (취소되면 OperationCancelled 발생)
 
         Returns:
             성공 여부
@@ -56,12 +61,16 @@ class PACHandler:
 
             self.logger.info(f"PAC 언팩 시작: {pac_file}")
 
-            if not self.ff16tools.unpack_all(pac_file, output_folder, game):
+            # 외부 도구 한 번 실행이라 전체 양을 알 수 없음
+            tracker = ProgressTracker('unpack', 0, progress)
+            if not self.ff16tools.unpack_all(pac_file, output_folder, game, cancel_token):
+                check_cancelled(cancel_token)
                 self.logger.error("PAC 언팩 실패")
                 if callback:
                     callback("오류: PAC 언팩 실패")
                 return False
 
+            tracker.finish()
             if callback:
                 callback("PAC 언팩 완료")
 
@@ -70,7 +79,8 @@ class PACHandler:
                 if callback:
                     callback("NXD 파일을 JSON으로 변환 중...")
 
-                nxd_count = self.converter.convert_nxd_to_json(output_folder)
+                nxd_count = self.converter.convert_nxd_to_json(output_folder, progress=progress,
+                                                               cancel_token=cancel_token)
 
                 if callback:
                     callback(f"NXD → JSON 변환 완료: {nxd_count}개 파일")
@@ -80,7 +90,8 @@ class PACHandler:
                 if callback:
                     callback("PZD 파일을 YAML로 변환 중...")
 
-                pzd_count = self.converter.convert_pzd_to_yaml(output_folder)
+                pzd_count = self.converter.convert_pzd_to_yaml(output_folder, progress=progress,
+                                                               cancel_token=cancel_token)
 
                 if callback:
                     callback(f"PZD → YAML 변환 완료: {pzd_count}개 파일")
@@ -91,13 +102,18 @@ class PACHandler:
 
             return True
 
+        except OperationCancelled:
+            self.logger.warning("언팩 및 변환 취소됨")
+            raise
+
         except Exception as e:
             self.logger.error(f"언팩 및 변환 실패: {e}")
             if callback:
                 callback(f"오류: {e}")
             return False
 
-    def pack(self, input_folder, output_pac, game='fft', callback=None):
+    def pack(self, input_folder, output_pac, game='fft', callback=None, progress=None,
+             cancel_token=None):
         """
         폴더를 PAC 파일로 팩킹
 
@@ -106,6 +122,8 @@ class PACHandler:
             output_pac: 출력 PAC 파일 경로
             game: 게임 종류 (fft 또는 ff16)
             callback: 진행 상황 콜백 함수
+            progress: ProgressEvent를 받는 콜백
+            cancel_token: 취소 토큰 (취소되면 OperationCancelled 발생)
 
         Returns:
             성공 여부
@@ -122,18 +140,25 @@ class PACHandler:
 
             self.logger.info(f"PAC 팩킹 시작: {input_folder} → {output_pac}")
 
-            if not self.ff16tools.pack(input_folder, output_pac, game):
+            tracker = ProgressTracker('pack', 0, progress)
+            if not self.ff16tools.pack(input_folder, output_pac, game, cancel_token):
+                check_cancelled(cancel_token)
                 self.logger.error("PAC 팩킹 실패")
                 if callback:
                     callback("오류: PAC 팩킹 실패")
                 return False
 
+            tracker.finish()
             self.logger.info("PAC 팩킹 완료")
             if callback:
                 callback("PAC 팩킹 완료!")
 
             return True
 
+        except OperationCancelled:
+            self.logger.warning("PAC 팩킹 취소됨")
+            raise
+
         except Exception as e:
             self.logger.error(f"PAC 팩킹 실패: {e}")
             if callback:
@@ -143,7 +168,7 @@ class PACHandler:
     def apply_translation_and_pack(self, csv_folder, source_folder, output_pac,
                                    delete_yaml_json=False, delete_other=False,
                                    apply_yaml=True, apply_json=True, skip_packing=False,
-                                   game='fft', callback=None):
+                                   game='fft', callback=None, progress=None, cancel_token=None):
         """
         번역 적용 및 PAC 팩킹
 
@@ -158,6 +183,8 @@ class PACHandler:
             skip_packing: 패킹 건너뛰기 여부
             game: 게임 종류
             callback: 진행 상황 콜백 함수
+            progress: ProgressEvent를 받는 콜백 (단계별 처리 수/경과 시간)
+            cancel_token: 취소 토큰 (취소되면 OperationCancelled 발생)
 
         Returns:
             성공 여부
@@ -169,8 +196,8 @@ class PACHandler:
             # 1. CSV 폴더에서 모든 번역 로드
             if callback:
                 callback(f"1/5: 모든 CSV 파일에서 번역 데이터 로딩 중...")
-            
-            translations = csv_handler.load_all_translations(csv_folder)
+
+            translations = csv_handler.load_all_translations(csv_folder, cancel_token, progress)
             if not translations:
                 self.logger.warning("CSV 파일에서 번역 데이터를 찾을 수 없습니다.")
                 # 번역 데이터가 없어도 나머지 프로세스는 진행될 수 있으므로 여기서 중단하지 않습니다.
@@ -181,8 +208,10 @@ class PACHandler:
             # 2. 로드된 번역을 YAML/JSON 파일에 적용
             if callback:
                 callback(f"2/5: CSV 번역을 YAML/JSON 파일에 적용 중...")
-            
-            updated_files_count = csv_handler.apply_translations_to_folder(source_folder, translations, apply_yaml, apply_json)
+
+            check_cancelled(cancel_token)
+            updated_files_count = csv_handler.apply_translations_to_folder(source_folder, translations, apply_yaml, apply_json,
+                                                                           cancel_token, progress)
             self.logger.info(f"{updated_files_count}개의 파일에 번역이 적용되었습니다.")
 
             if callback:
@@ -198,7 +227,8 @@ class PACHandler:
                 if callback:
                     callback(f"3/5: YAML을 PZD로 변환 중...")
 
-                yaml_count = self.converter.convert_yaml_to_pzd(source_folder)
+                yaml_count = self.converter.convert_yaml_to_pzd(source_folder, progress=progress,
+                                                                cancel_token=cancel_token)
 
                 if callback:
                     callback(f"YAML → PZD 변환 완료: {yaml_count}개")
@@ -210,7 +240,8 @@ class PACHandler:
                 if callback:
                     callback(f"4/5: JSON을 NXD로 변환 중...")
 
-                json_count = self.converter.convert_json_to_nxd(source_folder)
+                json_count = self.converter.convert_json_to_nxd(source_folder, progress=progress,
+                                                                cancel_token=cancel_token)
 
                 if callback:
                     callback(f"JSON → NXD 변환 완료: {json_count}개")
@@ -222,7 +253,10 @@ class PACHandler:
                 if callback:
                     callback(f"5/5: 불필요한 파일 삭제 중...")
 
+                check_cancelled(cancel_token)
+                tracker = ProgressTracker('cleanup', 0, progress)
                 self._cleanup_files(source_folder, delete_yaml_json, delete_other)
+                tracker.finish()
 
                 if callback:
                     callback("파일 정리 완료")
@@ -234,7 +268,7 @@ class PACHandler:
                 if callback:
                     callback(f"최종 단계: PAC 파일 팩킹 중...")
 
-                if not self.pack(source_folder, output_pac, game, callback):
+                if not self.pack(source_folder, output_pac, game, callback, progress, cancel_token):
                     return False
 
                 self.logger.info("번역 적용 및 팩킹 완료")
@@ -247,6 +281,10 @@ class PACHandler:
 
             return True
 
+        except OperationCancelled:
+            self.logger.warning("번역 적용 및 팩킹 취소됨")
+            raise
+
         except Exception as e:
             self.logger.error(f"번역 적용 및 팩킹 실패: {e}")
             if callback:
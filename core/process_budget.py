@@ -0,0 +1,85 @@
+"""
+외부 도구 프로세스 동시 실행 제한 모듈 (여러 작업이 함께 실행될 때 공유하는 예산)
+"""
+import threading
+import multiprocessing
+from core.config_manager import get_config_manager
+from utils.logger import get_logger
+
+
+class ProcessBudget:
+    """
+    애플리케이션 전체에서 동시에 실행되는 외부 도구 프로세스 수 제한
+
+    작업마다 Converter가 자체 스레드 풀을 가지므로, 작업 여러 개가 함께 실행되면
+    프로세스 수가 워커 수의 배수로 늘어납니다. 모든 run_command가 이 예산에서
+    슬롯을 받아 실행하도록 하여 전체 프로세스 수를 limit 이하로 유지합니다.
+    """
+
+    # 취소 여부를 확인하는 간격 (초)
+    POLL_INTERVAL = 0.1
+
+    def __init__(self, limit):
+        """
+        Args:
+            limit: 동시에 실행할 수 있는 최대 프로세스 수
+        """
+        self.limit = max(1, int(limit))
+        self._semaphore = threading.BoundedSemaphore(self.limit)
+        self._lock = threading.Lock()
+        self.running = 0
+
+    def acquire(self, cancel_token=None):
+        """
+        실행 슬롯 받기 (빈 슬롯이 생길 때까지 대기)
+
+        Args:
+            cancel_token: 취소 토큰 (대기 중 취소되면 슬롯 없이 반환)
+
+        Returns:
+            슬롯을 받았으면 True, 취소되었으면 False
+        """
+        while not self._semaphore.acquire(timeout=self.POLL_INTERVAL):
+            if cancel_token is not None and cancel_token.is_cancelled():
+                return False
+
+        if cancel_token is not None and cancel_token.is_cancelled():
+            self._semaphore.release()
+            return False
+
+        with self._lock:
+            self.running += 1
+        return True
+
+    def release(self):
+        """실행 슬롯 반환"""
+        with self._lock:
+            self.running -= 1
+        self._semaphore.release()
+
+
+def default_process_limit():
+    """기본 프로세스 수 (CPU 코어 수, 최소 2, 최대 8 - Converter 워커 수와 같은 기준)"""
+    return min(max(multiprocessing.cpu_count(), 2), 8)
+
+
+# 전역 인스턴스
+_global_process_budget = None
+_global_lock = threading.Lock()
+
+
+def get_process_budget():
+    """
+    전역 프로세스 예산 인스턴스 반환
+
+    설정 max_tool_processes가 0 이하이면 default_process_limit()를 사용합니다.
+    """
+    global _global_process_budget
+    with _global_lock:
+        if _global_process_budget is None:
+            limit = get_config_manager().get('max_tool_processes', 0) or 0
+            if limit <= 0:
+                limit = default_process_limit()
+            _global_process_budget = ProcessBudget(limit)
+            get_logger().info(f"외부 도구 동시 실행 제한: {_global_process_budget.limit}")
+        return _global_process_budget
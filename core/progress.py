@@ -0,0 +1,129 @@
+"""
+진행 상황 이벤트 모듈 (단계, 처리 수, 바이트, 경과 시간)
+"""
+import time
+
+
+class ProgressEvent:
+    """
+    작업 진행 상황 한 건
+
+    total이 0이면 전체 양을 알 수 없는 단계(외부 도구 실행 등)입니다.
+    """
+
+    __slots__ = ('stage', 'processed', 'total', 'bytes_done', 'elapsed', 'finished')
+
+    def __init__(self, stage, processed=0, total=0, bytes_done=0, elapsed=0.0, finished=False):
+        """
+        Args:
+            stage: 단계 이름 (예: 'unpack', 'nxd_to_json')
+            processed: 처리한 파일 수
+            total: 전체 파일 수 (모르면 0)
+            bytes_done: 처리한 바이트 수
+            elapsed: 단계 시작 후 경과 시간 (초)
+            finished: 단계 종료 이벤트 여부
+        """
+        self.stage = stage
+        self.processed = processed
+        self.total = total
+        self.bytes_done = bytes_done
+        self.elapsed = elapsed
+        self.finished = finished
+
+    @property
+    def percent(self):
+        """진행률 (0~100, 전체를 모르면 None)"""
+        if self.finished:
+            return 100.0
+        if self.total <= 0:
+            return None
+        return min(100.0, self.processed * 100.0 / self.total)
+
+    @property
+    def rate(self):
+        """초당 처리 파일 수"""
+        if self.elapsed <= 0:
+            return 0.0
+        return self.processed / self.elapsed
+
+    @property
+    def eta(self):
+        """남은 예상 시간 (초, 계산할 수 없으면 None)"""
+        rate = self.rate
+        if self.total <= 0 or self.processed <= 0 or rate <= 0:
+            return None
+        return (self.total - self.processed) / rate
+
+    @property
+    def done(self):
+        """단계 완료 여부"""
+        return self.finished or (self.total > 0 and self.processed >= self.total)
+
+    def __repr__(self):
+        return (f"ProgressEvent({self.stage!r}, {self.processed}/{self.total}, "
+                f"{self.bytes_done}B, {self.elapsed:.2f}s)")
+
+
+class ProgressTracker:
+    """
+    단계 하나의 진행 상황을 세고 콜백으로 ProgressEvent를 보내는 클래스
+
+    파일마다 GUI를 갱신하지 않도록 MIN_INTERVAL 간격으로만 보내며,
+    첫 이벤트와 마지막 이벤트는 항상 보냅니다.
+    """
+
+    MIN_INTERVAL = 0.05
+
+    def __init__(self, stage, total=0, progress=None):
+        """
+        Args:
+            stage: 단계 이름
+            total: 전체 파일 수 (모르면 0)
+            progress: ProgressEvent를 받는 콜백 (None이면 아무것도 보내지 않음)
+        """
+        self.stage = stage
+        self.total = total
+        self.progress = progress
+        self.processed = 0
+        self.bytes_done = 0
+        self.start_time = time.perf_counter()
+        self.finished = False
+        self._last_emit = None
+        self.emit(force=True)
+
+    def event(self):
+        """현재 진행 상황 이벤트"""
+        return ProgressEvent(self.stage, self.processed, self.total, self.bytes_done,
+                             time.perf_counter() - self.start_time, self.finished)
+
+    def emit(self, force=False):
+        """
+        콜백으로 현재 이벤트 전송
+
+        Args:
+            force: 간격과 관계없이 전송
+        """
+        if not self.progress:
+            return
+        now = time.perf_counter()
+        if not force and self._last_emit is not None and now - self._last_emit < self.MIN_INTERVAL:
+            return
+        self._last_emit = now
+        self.progress(self.event())
+
+    def advance(self, count=1, bytes_done=0):
+        """
+        처리량 추가
+
+        Args:
+            count: 처리한 파일 수
+            bytes_done: 처리한 바이트 수
+        """
+        self.processed += count
+        self.bytes_done += bytes_done
+        self.emit(force=self.total > 0 and self.processed >= self.total)
+
+    def finish(self):
+        """단계 완료 (전체를 모르던 단계도 100%로 표시)"""
+        self.finished = True
+        self.emit(force=True)
@@ -0,0 +1,333 @@
+"""
+번역 프로젝트 데이터베이스 모듈 (SQLite)
+"""
+import csv
+import json
+import re
+import sqlite3
+from pathlib import Path
+from utils.logger import get_logger
+
+
+class ProjectDatabase:
+    """
+    CSV 폴더를 한 번 가져와 (FileName, EntryID) 키로 보관하는 SQLite 프로젝트 저장소
+
+    번역 로드/검증/일괄 치환은 CSV를 다시 읽지 않고 SQL로 처리하며,
+    CSV는 필요할 때 export_csv_folder로 다시 내보냅니다.
+    """
+
+    # 프로젝트 파일 확장자
+    EXTENSIONS = ('.db', '.sqlite', '.fftproj')
+
+    # CSV 기본 열 → DB 열
+    CSV_COLUMNS = {
+        'Tag': 'tag',
+        'FileName': 'file_name',
+        'EntryID': 'entry_id',
+        'OriginalText': 'original_text',
+        'Translation': 'translation'
+    }
+
+    # 스키마 버전 (PRAGMA user_version, 1: (file_name, entry_id) 기본 키 → 2: (csv_name, row_no))
+    SCHEMA_VERSION = 2
+
+    # 행은 CSV 위치로 식별 (같은 키나 빈 키를 가진 행도 모두 보존), (FileName, EntryID)는 조회용 인덱스
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS entries (
+            file_name TEXT NOT NULL,
+            entry_id TEXT NOT NULL,
+            csv_name TEXT NOT NULL,
+            row_no INTEGER NOT NULL,
+            tag TEXT NOT NULL DEFAULT '',
+            original_text TEXT NOT NULL DEFAULT '',
+            translation TEXT NOT NULL DEFAULT '',
+            extra TEXT NOT NULL DEFAULT '{}',
+            PRIMARY KEY (csv_name, row_no)
+        );
+        CREATE INDEX IF NOT EXISTS idx_entries_key ON entries (file_name, entry_id);
+        CREATE INDEX IF NOT EXISTS idx_entries_original ON entries (original_text);
+        CREATE INDEX IF NOT EXISTS idx_entries_translation ON entries (translation);
+        CREATE TABLE IF NOT EXISTS csv_files (
+            csv_name TEXT PRIMARY KEY,
+            columns TEXT NOT NULL
+        );
+    """
+
+    def __init__(self, db_path):
+        """
+        프로젝트 데이터베이스 열기 (없으면 생성)
+
+        Args:
+            db_path: 데이터베이스 파일 경로
+        """
+        self.db_path = Path(db_path)
+        self.logger = get_logger()
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self._migrate()
+        self.conn.executescript(self.SCHEMA)
+        self.conn.execute(f"PRAGMA user_version={self.SCHEMA_VERSION}")
+        self.conn.create_function('regexp', 2, self._regexp, deterministic=True)
+
+    def _migrate(self):
+        """이전 스키마(기본 키 (file_name, entry_id))의 entries 테이블을 새 스키마로 옮김"""
+        version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        exists = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'entries'"
+        ).fetchone()
+        if version >= self.SCHEMA_VERSION or not exists:
+            return
+
+        self.logger.info(f"프로젝트 DB 스키마 갱신: {self.db_path} (버전 {version} → {self.SCHEMA_VERSION})")
+        with self.conn:
+            self.conn.execute("ALTER TABLE entries RENAME TO entries_old")
+            self.conn.execute("DROP INDEX IF EXISTS idx_entries_csv")
+            self.conn.execute("DROP INDEX IF EXISTS idx_entries_original")
+            self.conn.execute("DROP INDEX IF EXISTS idx_entries_translation")
+            self.conn.executescript(self.SCHEMA)
+            self.conn.execute(
+                "INSERT INTO entries (file_name, entry_id, csv_name, row_no, tag, original_text, translation, extra) "
+                "SELECT file_name, entry_id, csv_name, row_no, tag, original_text, translation, extra "
+                "FROM entries_old"
+            )
+            self.conn.execute("DROP TABLE entries_old")
+
+    @classmethod
+    def is_project_file(cls, path):
+        """경로가 프로젝트 데이터베이스 파일인지 여부"""
+        return bool(path) and Path(path).suffix.lower() in cls.EXTENSIONS
+
+    @staticmethod
+    def _regexp(pattern, value):
+        """SQL REGEXP 연산자 구현"""
+        return value is not None and re.search(pattern, value) is not None
+
+    def close(self):
+        """데이터베이스 닫기"""
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def import_records(self, csv_name, records, columns=None):
+        """
+        CSV 한 개 분량의 행을 가져오기 (기존 같은 CSV의 행은 교체)
+
+        Args:
+            csv_name: CSV 파일명
+            records: 행 딕셔너리 리스트 (CSV 열 이름 키)
+            columns: CSV 열 순서 (None이면 첫 행의 키 순서)
+
+        Returns:
+            가져온 행 수
+        """
+        records = list(records)
+        if columns is None:
+            columns = list(records[0].keys()) if records else list(self.CSV_COLUMNS)
+
+        extra_columns = [column for column in columns if column not in self.CSV_COLUMNS]
+        rows = []
+        for row_no, record in enumerate(records):
+            rows.append((
+                str(record.get('FileName', '')),
+                str(record.get('EntryID', '')),
+                csv_name,
+                row_no,
+                str(record.get('Tag', '')),
+                str(record.get('OriginalText', '')),
+                str(record.get('Translation', '') or ''),
+                json.dumps({column: record.get(column, '') for column in extra_columns}, ensure_ascii=False)
+            ))
+
+        with self.conn:
+            self.conn.execute("DELETE FROM entries WHERE csv_name = ?", (csv_name,))
+            self.conn.executemany(
+                "INSERT INTO entries (file_name, entry_id, csv_name, row_no, tag, "
+                "original_text, translation, extra) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            self.conn.execute(
+                "INSERT OR REPLACE INTO csv_files (csv_name, columns) VALUES (?, ?)",
+                (csv_name, json.dumps(columns, ensure_ascii=False))
+            )
+
+        return len(rows)
+
+    def import_csv_folder(self, csv_folder):
+        """
+        CSV 폴더 전체를 데이터베이스로 가져오기
+
+        Args:
+            csv_folder: CSV 폴더 경로
+
+        Returns:
+            가져온 행 수
+        """
+        total = 0
+        csv_files = list(Path(csv_folder).glob('*.csv'))
+        self.logger.info(f"총 {len(csv_files)}개 CSV 파일을 프로젝트 DB로 가져오기 시작: {self.db_path}")
+
+        for csv_file in csv_files:
+            try:
+                with open(csv_file, 'r', encoding='utf-8-sig', newline='') as f:
+                    reader = csv.DictReader(f)
+                    total += self.import_records(csv_file.name, reader, reader.fieldnames)
+                self.logger.info(f"프로젝트 DB 가져오기 완료: {csv_file.name}")
+            except Exception as e:
+                self.logger.error(f"프로젝트 DB 가져오기 실패 ({csv_file}): {e}")
+
+        self.logger.info(f"프로젝트 DB 가져오기 완료: {total}행")
+        return total
+
+    def export_csv_folder(self, output_folder):
+        """
+        데이터베이스 내용을 CSV 폴더로 내보내기
+
+        Args:
+            output_folder: 출력 폴더 경로
+
+        Returns:
+            생성된 CSV 파일 수
+        """
+        output_path = Path(output_folder)
+        output_path.mkdir(parents=True, exist_ok=True)
+        count = 0
+
+        for csv_name, columns_json in self.conn.execute("SELECT csv_name, columns FROM csv_files ORDER BY csv_name"):
+            columns = json.loads(columns_json)
+            try:
+                with open(output_path / csv_name, 'w', encoding='utf-8-sig', newline='') as f:
+                    writer = csv.writer(f)
+                    writer.writerow(columns)
+                    cursor = self.conn.execute(
+                        "SELECT tag, file_name, entry_id, original_text, translation, extra "
+                        "FROM entries WHERE csv_name = ? ORDER BY row_no",
+                        (csv_name,)
+                    )
+                    for tag, file_name, entry_id, original_text, translation, extra in cursor:
+                        values = json.loads(extra)
+                        values.update({
+                            'Tag': tag,
+                            'FileName': file_name,
+                            'EntryID': entry_id,
+                            'OriginalText': original_text,
+                            'Translation': translation
+                        })
+                        writer.writerow([values.get(column, '') for column in columns])
+                count += 1
+                self.logger.info(f"CSV 내보내기 완료: {csv_name}")
+            except Exception as e:
+                self.logger.error(f"CSV 내보내기 실패 ({csv_name}): {e}")
+
+        return count
+
+    def load_all_translations(self):
+        """
+        번역 데이터 로드 (CSVHandler.load_all_translations와 같은 형식)
+
+        Returns:
+            dict: {(filename, str(entry_id)): translation} (번역이 없으면 원문)
+        """
+        cursor = self.conn.execute(
+            "SELECT file_name, entry_id, "
+            "CASE WHEN trim(translation) <> '' THEN translation ELSE original_text END "
+            "FROM entries WHERE file_name <> '' AND entry_id <> '' ORDER BY csv_name, row_no"
+        )
+        translations = {(file_name, entry_id): text for file_name, entry_id, text in cursor}
+
+        # 통합된 중복 원문(Occurrences 열)의 다른 항목에도 같은 번역 적용
+        cursor = self.conn.execute(
+            "SELECT CASE WHEN trim(translation) <> '' THEN translation ELSE original_text END, extra "
+            "FROM entries WHERE extra LIKE '%\"Occurrences\": \"[%'"
+        )
+        for text, extra in cursor:
+            for file_name, entry_id in json.loads(json.loads(extra)['Occurrences']):
+                translations[(str(file_name), str(entry_id))] = text
+        self.logger.info(f"프로젝트 DB에서 번역 데이터 {len(translations)}개 로드 완료")
+        return translations
+
+    def find_rows(self, pattern):
+        """
+        Translation이 정규식과 일치하는 행 조회
+
+        Args:
+            pattern: 정규식
+
+        Returns:
+            (csv_name, row_no, translation) 반복자 (CSV, 행 순)
+        """
+        return self.conn.execute(
+            "SELECT csv_name, row_no, translation FROM entries "
+            "WHERE trim(translation) <> '' AND translation REGEXP ? ORDER BY csv_name, row_no",
+            (pattern,)
+        )
+
+    def iter_csv_rows(self):
+        """
+        모든 행 조회 (바이트 길이 검증용)
+
+        Returns:
+            (csv_name, row_no, file_name, original_text, translation) 반복자 (CSV, 행 순)
+        """
+        return self.conn.execute(
+            "SELECT csv_name, row_no, file_name, original_text, translation FROM entries "
+            "ORDER BY csv_name, row_no"
+        )
+
+    def iter_translated_rows(self):
+        """
+        번역된 행 조회
+
+        Returns:
+            (csv_name, row_no, original_text, translation) 반복자 (CSV, 행 순)
+        """
+        return self.conn.execute(
+            "SELECT csv_name, row_no, original_text, translation FROM entries "
+            "WHERE trim(translation) <> '' ORDER BY csv_name, row_no"
+        )
+
+    def batch_replace(self, find_text, replace_text, translated_only=False):
+        """
+        일괄 치환 (CSVHandler.batch_replace와 같은 규칙)
+
+        translated_only이면 Translation 열에서 부분 문자열을 치환하고,
+        아니면 모든 텍스트 열에서 값 전체가 일치하는 셀을 치환합니다.
+
+        Args:
+            find_text: 찾을 문자열
+            replace_text: 바꿀 문자열
+            translated_only: Translation 열만 변경할지 여부
+
+        Returns:
+            변경된 CSV 파일 수
+        """
+        with self.conn:
+            if translated_only:
+                touched = {row[0] for row in self.conn.execute(
+                    "SELECT DISTINCT csv_name FROM entries WHERE instr(translation, ?) > 0", (find_text,)
+                )}
+                self.conn.execute(
+                    "UPDATE entries SET translation = replace(translation, ?, ?) WHERE instr(translation, ?) > 0",
+                    (find_text, replace_text, find_text)
+                )
+            else:
+                touched = set()
+                for column in ('tag', 'original_text', 'translation'):
+                    touched.update(row[0] for row in self.conn.execute(
+                        f"SELECT DISTINCT csv_name FROM entries WHERE {column} = ?", (find_text,)
+                    ))
+                    self.conn.execute(
+                        f"UPDATE entries SET {column} = ? WHERE {column} = ?", (replace_text, find_text)
+                    )
+
+        self.logger.info(f"프로젝트 DB 일괄 치환 완료: {len(touched)}개 CSV")
+        return len(touched)
+
+    def row_count(self):
+        """전체 행 수"""
+        return self.conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
@@ -0,0 +1,283 @@
+"""
+전문 검색 인덱스 모듈 (문자 n-gram 역색인)
+"""
+import csv
+import json
+import os
+from array import array
+from pathlib import Path
+from utils.logger import get_logger
+
+
+class SearchIndex:
+    """
+    CSV 폴더의 OriginalText/Translation에 대한 문자 bi-gram 역색인
+
+    일본어/한국어는 띄어쓰기로 단어를 나눌 수 없으므로 문자 2-gram을 색인하고,
+    후보 행을 n-gram 교집합으로 좁힌 뒤 부분 문자열 비교로 확인합니다.
+    인덱스는 CSV별로 보관되어 변경된 CSV만 다시 색인합니다.
+
+    CSV 폴더는 번역자끼리 주고받으므로 인덱스 파일은 JSON으로 저장하고,
+    로드할 때 구조와 행 번호 범위를 검사하여 신뢰하지 않는 데이터로 취급합니다.
+    """
+
+    # 인덱스 파일명 (CSV 폴더 안에 저장)
+    INDEX_FILE = '.search_index.json'
+    INDEX_VERSION = 3
+    GRAM_SIZE = 2
+
+    # 검색 대상 열 (posting 값 = 행 번호 * 2 + 열 번호)
+    COLUMNS = ('OriginalText', 'Translation')
+
+    def __init__(self, csv_folder, index_path=None):
+        """
+        Args:
+            csv_folder: CSV 폴더 경로
+            index_path: 인덱스 파일 경로 (None이면 CSV 폴더 안의 INDEX_FILE)
+        """
+        self.logger = get_logger()
+        self.csv_folder = Path(csv_folder)
+        self.index_path = Path(index_path) if index_path else self.csv_folder / self.INDEX_FILE
+        # {csv_name: {'fingerprint': (size, mtime_ns), 'rows': [(entry_id, file_name, original, translation)],
+        #             'postings': {gram: array('I')}, 'short': array('I')}}
+        self.files = {}
+
+    @classmethod
+    def _grams(cls, text):
+        """텍스트의 고유 n-gram 집합 (대소문자 무시)"""
+        text = text.casefold()
+        size = cls.GRAM_SIZE
+        return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+    @staticmethod
+    def _fingerprint(path):
+        """파일 변경 감지용 (크기, 수정 시각)"""
+        stat = os.stat(path)
+        return (stat.st_size, stat.st_mtime_ns)
+
+    def load(self):
+        """
+        저장된 인덱스 로드
+
+        Returns:
+            로드 성공 여부
+        """
+        if not self.index_path.exists():
+            return False
+
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if not isinstance(data, dict) or data.get('version') != self.INDEX_VERSION:
+                return False
+            files = data.get('files')
+            if not isinstance(files, dict):
+                raise ValueError("files 항목이 올바르지 않음")
+            self.files = {self._check_name(name): self._decode_entry(entry)
+                          for name, entry in files.items()}
+            self.logger.info(f"검색 인덱스 로드 완료: {self.index_path} ({len(self.files)}개 파일)")
+            return True
+        except Exception as e:
+            self.logger.warning(f"검색 인덱스 로드 실패, 다시 생성합니다: {e}")
+            self.files = {}
+            return False
+
+    @staticmethod
+    def _check_name(name):
+        """인덱스에 기록된 CSV 이름 검사 (폴더 밖 경로 거부)"""
+        if not name.endswith('.csv') or Path(name).name != name:
+            raise ValueError(f"잘못된 CSV 이름: {name!r}")
+        return name
+
+    @classmethod
+    def _decode_entry(cls, entry):
+        """
+        JSON에서 읽은 파일 항목을 검사하여 내부 형식으로 변환
+
+        Args:
+            entry: {'fingerprint': [size, mtime_ns], 'rows': [[...]], 'postings': {gram: [...]}, 'short': [...]}
+
+        Returns:
+            내부 형식 항목 (fingerprint는 튜플, posting은 array('I'))
+
+        Raises:
+            ValueError: 구조나 값이 올바르지 않은 경우
+        """
+        if not isinstance(entry, dict):
+            raise ValueError("파일 항목이 딕셔너리가 아님")
+
+        fingerprint = entry.get('fingerprint')
+        if (not isinstance(fingerprint, list) or len(fingerprint) != 2
+                or not all(type(value) is int for value in fingerprint)):
+            raise ValueError("fingerprint가 올바르지 않음")
+
+        rows = entry.get('rows')
+        if not isinstance(rows, list):
+            raise ValueError("rows가 리스트가 아님")
+        for row in rows:
+            if (not isinstance(row, list) or len(row) != 4
+                    or not all(isinstance(value, str) for value in row)):
+                raise ValueError("rows 항목이 올바르지 않음")
+
+        # posting 값은 (행 번호 * 2 + 열 번호)이므로 행 수 * 2 미만이어야 함
+        posting_limit = len(rows) * 2
+
+        def decode_posting(values):
+            if not isinstance(values, list) or not all(type(value) is int for value in values):
+                raise ValueError("posting이 정수 리스트가 아님")
+            if values and (min(values) < 0 or max(values) >= posting_limit):
+                raise ValueError("posting 범위가 올바르지 않음")
+            return array('I', values)
+
+        postings = entry.get('postings')
+        if not isinstance(postings, dict):
+            raise ValueError("postings가 딕셔너리가 아님")
+
+        return {
+            'fingerprint': tuple(fingerprint),
+            'rows': [tuple(row) for row in rows],
+            'postings': {gram: decode_posting(values) for gram, values in postings.items()},
+            'short': decode_posting(entry.get('short')),
+        }
+
+    def save(self):
+        """인덱스 저장 (임시 파일 후 교체)"""
+        files = {
+            name: {
+                'fingerprint': list(entry['fingerprint']),
+                'rows': entry['rows'],
+                'postings': {gram: posting.tolist() for gram, posting in entry['postings'].items()},
+                'short': entry['short'].tolist(),
+            }
+            for name, entry in self.files.items()
+        }
+        temp_path = self.index_path.with_name(self.index_path.name + '.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': self.INDEX_VERSION, 'files': files}, f,
+                      ensure_ascii=False, separators=(',', ':'))
+        os.replace(temp_path, self.index_path)
+        self.logger.info(f"검색 인덱스 저장 완료: {self.index_path}")
+
+    def update(self, callback=None):
+        """
+        변경된 CSV만 다시 색인하고 삭제된 CSV는 제거
+
+        Args:
+            callback: 진행 상황 콜백 함수 (processed, total) 인자 받음
+
+        Returns:
+            (다시 색인한 파일 수, 제거한 파일 수)
+        """
+        csv_files = sorted(self.csv_folder.glob('*.csv'))
+        current = {csv_file.name for csv_file in csv_files}
+
+        removed = [name for name in self.files if name not in current]
+        for name in removed:
+            del self.files[name]
+
+        updated = 0
+        for processed, csv_file in enumerate(csv_files, 1):
+            try:
+                fingerprint = self._fingerprint(csv_file)
+                entry = self.files.get(csv_file.name)
+                if entry is None or entry['fingerprint'] != fingerprint:
+                    self.files[csv_file.name] = self._index_file(csv_file, fingerprint)
+                    updated += 1
+            except Exception as e:
+                self.logger.error(f"검색 인덱스 생성 실패 ({csv_file}): {e}")
+
+            if callback:
+                callback(processed, len(csv_files))
+
+        if updated or removed:
+            self.save()
+
+        self.logger.info(f"검색 인덱스 갱신 완료: {updated}개 파일 색인, {len(removed)}개 파일 제거")
+        return updated, len(removed)
+
+    def _index_file(self, csv_file, fingerprint):
+        """CSV 파일 하나 색인"""
+        rows = []
+        postings = {}
+        short = array('I')  # n-gram이 없는 짧은 텍스트
+
+        with open(csv_file, 'r', encoding='utf-8-sig', newline='') as f:
+            for row_no, row in enumerate(csv.DictReader(f)):
+                texts = [row.get(column) or '' for column in self.COLUMNS]
+                rows.append((row.get('EntryID', ''), row.get('FileName', ''), texts[0], texts[1]))
+                for column_no, text in enumerate(texts):
+                    posting = row_no * 2 + column_no
+                    if 0 < len(text) < self.GRAM_SIZE:
+                        short.append(posting)
+                    for gram in self._grams(text):
+                        bucket = postings.get(gram)
+                        if bucket is None:
+                            bucket = postings[gram] = array('I')
+                        bucket.append(posting)
+
+        return {'fingerprint': fingerprint, 'rows': rows, 'postings': postings, 'short': short}
+
+    def search(self, query, limit=1000, columns=COLUMNS):
+        """
+        검색어가 포함된 행 검색
+
+        Args:
+            query: 검색어
+            limit: 최대 결과 수
+            columns: 검색 대상 열
+
+        Returns:
+            결과 리스트 [{file, row, entry_id, file_name, column, text}, ...]
+        """
+        query_folded = query.casefold()
+        if not query_folded:
+            return []
+
+        column_numbers = {self.COLUMNS.index(column) for column in columns}
+        grams = self._grams(query_folded)
+        results = []
+
+        for csv_name in sorted(self.files):
+            entry = self.files[csv_name]
+            rows = entry['rows']
+
+            if grams:
+                postings = entry['postings']
+                lists = [postings.get(gram) for gram in grams]
+                if any(posting is None for posting in lists):
+                    continue
+                lists.sort(key=len)
+                candidates = set(lists[0])
+                for posting in lists[1:]:
+                    candidates.intersection_update(posting)
+                    if not candidates:
+                        break
+            else:
+                # 검색어가 n-gram보다 짧으면 검색어를 포함하는 n-gram의 합집합
+                candidates = set(entry['short'])
+                for gram, posting in entry['postings'].items():
+                    if query_folded in gram:
+                        candidates.update(posting)
+
+            for posting in sorted(candidates):
+                row_no, column_no = divmod(posting, 2)
+                if column_no not in column_numbers:
+                    continue
+                text = rows[row_no][2 + column_no]
+                if query_folded in text.casefold():
+                    results.append({
+                        'file': csv_name,
+                        'row': row_no + 2,  # +2 (헤더 + 0-based)
+                        'entry_id': rows[row_no][0],
+                        'file_name': rows[row_no][1],
+                        'column': self.COLUMNS[column_no],
+                        'text': text
+                    })
+                    if len(results) >= limit:
+                        return results
+
+        return results
+
+    def row_count(self):
+        """색인된 전체 행 수"""
+        return sum(len(entry['rows']) for entry in self.files.values())
@@ -0,0 +1,215 @@
+"""
+용어 후보 통계 모듈 (문자 n-gram / 가타카나 빈도 분석)
+"""
+import csv
+import re
+import multiprocessing
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from core.glossary import AhoCorasick
+from utils.logger import get_logger
+
+
+# 용어가 될 수 있는 문자 (한자, 히라가나, 가타카나, 전각/반각 영숫자)
+TERM_RUN_PATTERN = re.compile(r'[぀-ヿ一-鿿０-９Ａ-Ｚａ-ｚ0-9A-Za-z]+')
+
+# 가타카나 연속 구간 (장음 부호 포함)
+KATAKANA_RUN_PATTERN = re.compile(r'[ァ-ヺー]{2,}')
+
+# 히라가나만으로 된 n-gram (조사/어미라 용어 후보에서 제외)
+HIRAGANA_ONLY_PATTERN = re.compile(r'[぀-ゟ]+')
+
+
+def _count_file(csv_file, min_n, max_n):
+    """
+    CSV 파일 하나의 OriginalText 통계 (프로세스 풀 작업 단위)
+
+    Args:
+        csv_file: CSV 파일 경로
+        min_n: 최소 n-gram 길이
+        max_n: 최대 n-gram 길이
+
+    Returns:
+        (n-gram Counter, 가타카나 Counter)
+    """
+    ngrams = Counter()
+    katakana = Counter()
+
+    with open(csv_file, 'r', encoding='utf-8-sig', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        if 'OriginalText' not in header:
+            return ngrams, katakana
+        column = header.index('OriginalText')
+
+        for row in reader:
+            text = row[column] if len(row) > column else ''
+            katakana.update(KATAKANA_RUN_PATTERN.findall(text))
+            # 행 단위로 모아서 한 번에 집계 (Counter.update 호출 횟수 최소화)
+            ngrams.update([
+                run[i:i + n]
+                for run in TERM_RUN_PATTERN.findall(text)
+                for n in range(min_n, min(max_n, len(run)) + 1)
+                for i in range(len(run) - n + 1)
+            ])
+
+    return ngrams, katakana
+
+
+class TermStatistics:
+    """
+    원문 코퍼스에서 용어집 후보를 추출하는 클래스
+
+    CSV 파일 단위로 프로세스 풀에서 빈도를 세고(프로세스별 Counter) 마지막에 합칩니다.
+    더 긴 n-gram과 빈도가 같은 짧은 n-gram은 그 일부로 보고 제외합니다.
+    """
+
+    def __init__(self, min_n=2, max_n=6, max_workers=None):
+        """
+        Args:
+            min_n: 최소 n-gram 길이
+            max_n: 최대 n-gram 길이
+            max_workers: 병렬 처리에 사용할 최대 프로세스 수 (기본값: CPU 코어 수)
+        """
+        self.logger = get_logger()
+        self.min_n = min_n
+        self.max_n = max_n
+        if max_workers is None:
+            self.max_workers = min(max(multiprocessing.cpu_count(), 2), 8)
+        else:
+            self.max_workers = max_workers
+
+    def count(self, csv_folder):
+        """
+        폴더 전체 빈도 집계
+
+        Args:
+            csv_folder: CSV 폴더 경로
+
+        Returns:
+            (n-gram Counter, 가타카나 Counter)
+        """
+        csv_files = sorted(Path(csv_folder).glob('*.csv'))
+        ngrams = Counter()
+        katakana = Counter()
+
+        self.logger.info(f"용어 통계 시작: {len(csv_files)}개 CSV 파일 ({self.max_workers} 프로세스)")
+
+        if len(csv_files) <= 1 or self.max_workers <= 1:
+            partials = (_count_file(csv_file, self.min_n, self.max_n) for csv_file in csv_files)
+            for file_ngrams, file_katakana in partials:
+                ngrams.update(file_ngrams)
+                katakana.update(file_katakana)
+        else:
+            with ProcessPoolExecutor(max_workers=min(self.max_workers, len(csv_files))) as executor:
+                futures = [executor.submit(_count_file, str(csv_file), self.min_n, self.max_n)
+                           for csv_file in csv_files]
+                for csv_file, future in zip(csv_files, futures):
+                    try:
+                        file_ngrams, file_katakana = future.result()
+                        ngrams.update(file_ngrams)
+                        katakana.update(file_katakana)
+                    except Exception as e:
+                        self.logger.error(f"용어 통계 실패 ({csv_file}): {e}")
+
+        return ngrams, katakana
+
+    def _closed_ngrams(self, ngrams, min_count):
+        """
+        더 긴 n-gram에 포함되고 빈도가 같은 n-gram 제외
+
+        Args:
+            ngrams: n-gram Counter
+            min_count: 최소 빈도
+
+        Returns:
+            {n-gram: 빈도}
+        """
+        frequent = {term: count for term, count in ngrams.items() if count >= min_count}
+        subsumed = set()
+        for term, count in frequent.items():
+            if len(term) > self.min_n:
+                for part in (term[:-1], term[1:]):
+                    if frequent.get(part) == count:
+                        subsumed.add(part)
+        return {term: count for term, count in frequent.items() if term not in subsumed}
+
+    def analyze(self, csv_folder, top=500, min_count=3):
+        """
+        용어 후보 추출
+
+        Args:
+            csv_folder: CSV 폴더 경로
+            top: 반환할 최대 후보 수
+            min_count: 최소 빈도
+
+        Returns:
+            후보 리스트 [{term, kind, count, file, row, example}, ...] (빈도 내림차순)
+        """
+        ngrams, katakana = self.count(csv_folder)
+
+        scored = {term: (count, 'katakana') for term, count in katakana.items() if count >= min_count}
+        for term, count in self._closed_ngrams(ngrams, min_count).items():
+            if term not in scored and not HIRAGANA_ONLY_PATTERN.fullmatch(term):
+                scored[term] = (count, 'ngram')
+
+        ranked = sorted(scored.items(), key=lambda item: (-item[1][0], -len(item[0]), item[0]))[:top]
+        candidates = [{'term': term, 'kind': kind, 'count': count, 'file': '', 'row': '', 'example': ''}
+                      for term, (count, kind) in ranked]
+
+        self._find_examples(csv_folder, candidates)
+        self.logger.info(f"용어 통계 완료: 후보 {len(candidates)}개 (n-gram {len(ngrams)}개, 가타카나 {len(katakana)}개)")
+        return candidates
+
+    def _find_examples(self, csv_folder, candidates):
+        """후보별 첫 번째 예문 찾기 (Aho-Corasick으로 한 번만 훑음)"""
+        if not candidates:
+            return
+
+        automaton = AhoCorasick()
+        for candidate_no, candidate in enumerate(candidates):
+            automaton.add(candidate['term'], candidate_no)
+        automaton.build()
+
+        remaining = len(candidates)
+        for csv_file in sorted(Path(csv_folder).glob('*.csv')):
+            try:
+                with open(csv_file, 'r', encoding='utf-8-sig', newline='') as f:
+                    for idx, row in enumerate(csv.DictReader(f)):
+                        text = row.get('OriginalText') or ''
+                        for _, candidate_no in automaton.iter_matches(text):
+                            candidate = candidates[candidate_no]
+                            if not candidate['example']:
+                                candidate['file'] = csv_file.name
+                                candidate['row'] = idx + 2  # +2 (헤더 + 0-based)
+                                candidate['example'] = text[:100]
+                                remaining -= 1
+                        if not remaining:
+                            return
+            except Exception as e:
+                self.logger.error(f"CSV 읽기 실패 ({csv_file}): {e}")
+
+    def save_candidates(self, candidates, output_file):
+        """
+        후보를 용어집 형식 CSV로 저장 (Target을 채우면 그대로 용어집으로 사용 가능)
+
+        Args:
+            candidates: analyze가 반환한 후보 리스트
+            output_file: 출력 파일 경로
+
+        Returns:
+            성공 여부
+        """
+        try:
+            with open(output_file, 'w', encoding='utf-8-sig', newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(['Source', 'Target', 'Count', 'Kind', 'File', 'Row', 'Example'])
+                for candidate in candidates:
+                    writer.writerow([candidate['term'], '', candidate['count'], candidate['kind'],
+                                     candidate['file'], candidate['row'], candidate['example']])
+            self.logger.info(f"용어 후보 저장 완료: {output_file}")
+            return True
+        except Exception as e:
+            self.logger.error(f"용어 후보 저장 실패: {e}")
+            return False
@@ -0,0 +1,229 @@
+"""
+번역 메모리 모듈 (유사 원문 번역 제안)
+"""
+import csv
+import math
+from array import array
+from collections import Counter
+from pathlib import Path
+import pandas as pd
+from utils.logger import get_logger
+
+
+class TranslationMemory:
+    """
+    기존 (OriginalText, Translation) 쌍으로 만든 번역 메모리
+
+    원문을 문자 bi-gram 집합으로 색인하고 Dice 계수로 유사도를 계산합니다.
+    모든 쌍을 비교하지 않도록 prefix 필터(가장 드문 n-gram만으로 후보 생성)와
+    길이 필터를 적용합니다. 후보의 공유 n-gram 수는 나머지 n-gram의 posting에서
+    모두 세므로, 후보를 잘라내지 않고 모든 후보의 Dice 계수를 정확히 계산합니다.
+    """
+
+    GRAM_SIZE = 2
+
+    # 일괄 채우기 시 추가되는 열
+    SUGGESTION_COLUMN = 'Suggestion'
+    SCORE_COLUMN = 'SuggestionScore'
+
+    def __init__(self):
+        """번역 메모리 초기화"""
+        self.logger = get_logger()
+        self.originals = []
+        self.translations = []
+        self.gram_counts = array('I')
+        self.postings = {}  # {gram: array('I') 쌍 번호}
+        self._exact = {}    # {원문: 쌍 번호}
+
+    @classmethod
+    def _grams(cls, text):
+        """텍스트의 고유 n-gram 집합 (공백 무시, 대소문자 무시)"""
+        text = ''.join(text.split()).casefold()
+        size = cls.GRAM_SIZE
+        if len(text) < size:
+            return {text} if text else set()
+        return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+    def __len__(self):
+        return len(self.originals)
+
+    def add(self, original, translation):
+        """
+        번역 쌍 추가 (같은 원문은 처음 추가된 번역만 보관)
+
+        Args:
+            original: 원문
+            translation: 번역문
+
+        Returns:
+            추가 여부
+        """
+        if not original or not translation or not translation.strip() or original in self._exact:
+            return False
+
+        grams = self._grams(original)
+        if not grams:
+            return False
+
+        pair_id = len(self.originals)
+        self._exact[original] = pair_id
+        self.originals.append(original)
+        self.translations.append(translation)
+        self.gram_counts.append(len(grams))
+
+        for gram in grams:
+            bucket = self.postings.get(gram)
+            if bucket is None:
+                bucket = self.postings[gram] = array('I')
+            bucket.append(pair_id)
+
+        return True
+
+    def build_from_folder(self, csv_folder):
+        """
+        CSV 폴더의 번역된 행으로 번역 메모리 생성
+
+        Args:
+            csv_folder: CSV 폴더 경로
+
+        Returns:
+            추가된 번역 쌍 수
+        """
+        added = 0
+        for csv_file in sorted(Path(csv_folder).glob('*.csv')):
+            try:
+                with open(csv_file, 'r', encoding='utf-8-sig', newline='') as f:
+                    for row in csv.DictReader(f):
+                        if self.add(row.get('OriginalText') or '', row.get('Translation') or ''):
+                            added += 1
+            except Exception as e:
+                self.logger.error(f"번역 메모리 생성 실패 ({csv_file}): {e}")
+
+        self.logger.info(f"번역 메모리 생성 완료: {added}개 번역 쌍 ({len(self.postings)}개 n-gram)")
+        return added
+
+    def suggest(self, text, k=3, min_score=0.5):
+        """
+        원문과 가장 비슷한 번역 쌍 검색
+
+        Args:
+            text: 원문
+            k: 최대 제안 수
+            min_score: 최소 유사도 (Dice 계수, 0~1)
+
+        Returns:
+            제안 리스트 [{original, translation, score}, ...] (유사도 내림차순)
+        """
+        grams = self._grams(text or '')
+        if not grams:
+            return []
+
+        size = len(grams)
+        min_score = max(min_score, 1e-6)
+
+        # Dice >= s 이면 공통 n-gram 수 c >= s*n/(2-s), 후보 길이 m 은 [n*s/(2-s), n*(2-s)/s]
+        min_overlap = max(1, math.ceil(min_score * size / (2 - min_score) - 1e-9))
+        # (경계값이 부동소수점 오차로 잘리지 않도록 여유를 둠)
+        min_len = size * min_score / (2 - min_score) - 1e-9
+        max_len = size * (2 - min_score) / min_score + 1e-9
+
+        # 가장 드문 n-gram (size - min_overlap + 1)개 중 하나는 반드시 공유해야 함
+        known = sorted((gram for gram in grams if gram in self.postings), key=lambda gram: len(self.postings[gram]))
+        if len(known) < min_overlap:
+            return []
+        prefix = known[:len(known) - min_overlap + 1]
+
+        gram_counts = self.gram_counts
+        hits = Counter()
+        for gram in prefix:
+            hits.update(self.postings[gram])
+        for pair_id in [pair_id for pair_id in hits if not min_len <= gram_counts[pair_id] <= max_len]:
+            del hits[pair_id]
+
+        # 나머지 n-gram은 이미 후보인 쌍만 세어 공유 n-gram 수를 완성 (새 후보는 만들지 않음)
+        for gram in known[len(prefix):]:
+            for pair_id in self.postings[gram]:
+                if pair_id in hits:
+                    hits[pair_id] += 1
+
+        scored = []
+        for pair_id, overlap in hits.items():
+            score = 2 * overlap / (size + gram_counts[pair_id])
+            if score >= min_score - 1e-9:
+                scored.append((score, pair_id))
+
+        exact = self._exact.get(text)
+        scored.sort(key=lambda item: (-item[0], item[1] != exact, item[1]))
+
+        return [
+            {'original': self.originals[pair_id], 'translation': self.translations[pair_id],
+             'score': 1.0 if pair_id == exact else round(score, 4)}
+            for score, pair_id in scored[:k]
+        ]
+
+    def fill_csv(self, csv_file, min_score=0.5):
+        """
+        번역되지 않은 행에 가장 비슷한 번역을 제안 열로 기록
+
+        Translation 열은 변경하지 않고 Suggestion/SuggestionScore 열만 갱신합니다.
+
+        Args:
+            csv_file: CSV 파일 경로
+            min_score: 최소 유사도
+
+        Returns:
+            제안이 채워진 행 수
+        """
+        df = pd.read_csv(csv_file, encoding='utf-8-sig', dtype=str, keep_default_na=False)
+        if 'OriginalText' not in df.columns:
+            return 0
+        if 'Translation' not in df.columns:
+            df['Translation'] = ''
+
+        untranslated = df['Translation'].str.strip() == ''
+        cache = {}
+        suggestions = []
+        scores = []
+        for original, needs_suggestion in zip(df['OriginalText'], untranslated):
+            if not needs_suggestion:
+                suggestions.append('')
+                scores.append('')
+                continue
+            # 같은 원문은 한 번만 검색
+            if original not in cache:
+                best = self.suggest(original, k=1, min_score=min_score)
+                cache[original] = (best[0]['translation'], f"{best[0]['score']:.2f}") if best else ('', '')
+            suggestion, score = cache[original]
+            suggestions.append(suggestion)
+            scores.append(score)
+
+        df[self.SUGGESTION_COLUMN] = suggestions
+        df[self.SCORE_COLUMN] = scores
+        df.to_csv(csv_file, index=False, encoding='utf-8-sig')
+
+        return sum(1 for suggestion in suggestions if suggestion)
+
+    def fill_folder(self, csv_folder, min_score=0.5, callback=None):
+        """
+        CSV 폴더 전체에 번역 제안 채우기
+
+        Args:
+            csv_folder: CSV 폴더 경로
+            min_score: 최소 유사도
+            callback: 진행 상황 콜백 함수 (csv_name, filled) 인자 받음
+
+        Returns:
+            제안이 채워진 전체 행 수
+        """
+        total = 0
+        for csv_file in sorted(Path(csv_folder).glob('*.csv')):
+            try:
+                filled = self.fill_csv(csv_file, min_score)
+                total += filled
+                self.logger.info(f"번역 제안 채우기 완료: {csv_file.name} ({filled}행)")
+                if callback:
+                    callback(csv_file.name, filled)
+            except Exception as e:
+                self.logger.error(f"번역 제안 채우기 실패 ({csv_file}): {e}")
+
+        return total
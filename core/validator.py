@@ -2,8 +2,13 @@
 CSV 검증 모듈
 """
 import re
-import pandas as pd
+import csv
+import json
+import hashlib
+import unicodedata
+from itertools import groupby
 from pathlib import Path
+from core.project_db import ProjectDatabase
 from utils.logger import get_logger
 
 
@@ -18,20 +23,42 @@ class CSVValidator:
         'katakana': r'[\u30a0-\u30ff]'  # 가타카나
     }
 
+    # 바이트 길이 검사 이슈 이름
+    BYTE_LENGTH_ISSUE = '바이트 초과'
+
+    # 번역 일관성 검사 이슈 이름
+    INCONSISTENT_ISSUE = '번역 불일치'
+
+    # 용어집 검사 이슈 이름 (core.glossary)
+    GLOSSARY_ISSUE = '용어 불일치'
+
+    # 문제 유형 목록 (결과 필터에 사용)
+    ISSUE_TYPES = ['전각문자', '한자', '히라가나', '가타카나', BYTE_LENGTH_ISSUE, INCONSISTENT_ISSUE,
+                   GLOSSARY_ISSUE]
+
     def __init__(self):
         """검증기 초기화"""
         self.logger = get_logger()
 
-    def validate_csv(self, csv_folder):
+    # 결과 내보내기에 사용하는 열 순서
+    RESULT_FIELDS = ['file', 'row', 'issues', 'text', 'original_bytes', 'translated_bytes']
+
+    def validate_csv(self, csv_folder, on_file_done=None):
         """
         CSV 파일들에서 일본어 문자 검증
 
         Args:
-            csv_folder: 검증할 CSV 폴더 경로
+            csv_folder: 검증할 CSV 폴더 경로 (또는 프로젝트 DB 파일)
+            on_file_done: 파일 하나의 검증이 끝날 때마다 해당 파일의 결과 리스트를 받는 콜백
 
         Returns:
             검증 결과 리스트 [{file, row, issues, text}, ...]
         """
+        if ProjectDatabase.is_project_file(csv_folder):
+            return self._validate_project(csv_folder, on_file_done)
+
+        import pandas as pd
+
         results = []
         csv_files = list(Path(csv_folder).glob('*.csv'))
 
@@ -46,6 +73,7 @@ class CSVValidator:
                     self.logger.warning(f"Translation 열이 없음: {csv_file}")
                     continue
 
+                file_results = []
                 for idx, row in df.iterrows():
                     translated = str(row['Translation'])
 
@@ -66,13 +94,17 @@ class CSVValidator:
                         issues.append('가타카나')
 
                     if issues:
-                        results.append({
+                        file_results.append({
                             'file': csv_file.name,
                             'row': idx + 2,  # +2 (헤더 + 0-based)
                             'issues': ', '.join(issues),
                             'text': translated[:100]  # 처음 100자만
                         })
 
+                results.extend(file_results)
+                if on_file_done and file_results:
+                    on_file_done(file_results)
+
                 self.logger.info(f"검증 완료: {csv_file.name}")
 
             except Exception as e:
@@ -81,6 +113,299 @@ class CSVValidator:
         self.logger.info(f"검증 완료. 총 {len(results)}개 문제 발견")
         return results
 
+    def _validate_project(self, db_path, on_file_done=None):
+        """
+        프로젝트 DB에서 일본어 문자 검증 (SQL로 후보 행만 조회)
+
+        Args:
+            db_path: 프로젝트 DB 파일 경로
+            on_file_done: 파일 하나의 검증이 끝날 때마다 해당 파일의 결과 리스트를 받는 콜백
+
+        Returns:
+            검증 결과 리스트 [{file, row, issues, text}, ...]
+        """
+        results = []
+        file_results = []
+        issue_names = {
+            'fullwidth': '전각문자',
+            'kanji': '한자',
+            'hiragana': '히라가나',
+            'katakana': '가타카나'
+        }
+        any_pattern = '|'.join(self.JAPANESE_PATTERNS.values())
+
+        with ProjectDatabase(db_path) as project_db:
+            for csv_name, row_no, translated in project_db.find_rows(any_pattern):
+                if file_results and file_results[-1]['file'] != csv_name:
+                    results.extend(file_results)
+                    if on_file_done:
+                        on_file_done(file_results)
+                    file_results = []
+
+                issues = [issue_names[name] for name, pattern in self.JAPANESE_PATTERNS.items()
+                          if re.search(pattern, translated)]
+                file_results.append({
+                    'file': csv_name,
+                    'row': row_no + 2,  # +2 (헤더 + 0-based)
+                    'issues': ', '.join(issues),
+                    'text': translated[:100]
+                })
+
+        if file_results:
+            results.extend(file_results)
+            if on_file_done:
+                on_file_done(file_results)
+
+        self.logger.info(f"프로젝트 DB 검증 완료. 총 {len(results)}개 문제 발견")
+        return results
+
+    def validate_byte_length(self, csv_folder, max_ratio=None, max_bytes=None,
+                             budgets=None, encoding='utf-8', on_file_done=None):
+        """
+        Translation의 인코딩 바이트 길이를 OriginalText와 비교하여 검증
+
+        바이트 길이는 행 단위가 아니라 열 단위(벡터 연산)로 계산합니다.
+
+        Args:
+            csv_folder: 검증할 CSV 폴더 경로 (또는 프로젝트 DB 파일)
+            max_ratio: 허용 비율 (Translation 바이트 / OriginalText 바이트, None이면 검사 안 함)
+            max_bytes: 허용 최대 바이트 수 (None이면 검사 안 함)
+            budgets: 파일/테이블 접두사별 예산 {접두사: {'max_ratio': 1.2, 'max_bytes': 256}}
+                     (FileName 또는 CSV 파일명이 접두사로 시작하면 적용, 가장 긴 접두사 우선)
+            encoding: 바이트 길이 계산에 사용할 인코딩
+            on_file_done: 파일 하나의 검증이 끝날 때마다 해당 파일의 결과 리스트를 받는 콜백
+
+        Returns:
+            (검증 결과 리스트, 파일별 합계 딕셔너리)
+            파일별 합계: {CSV 파일명: {rows, original_bytes, translated_bytes, over_count}}
+        """
+        import pandas as pd
+
+        results = []
+        totals = {}
+        budgets = budgets or {}
+
+        self.logger.info(f"바이트 길이 검증 시작: {csv_folder}")
+
+        for csv_name, df in self._iter_byte_length_frames(csv_folder):
+            try:
+                if 'Translation' not in df.columns or 'OriginalText' not in df.columns:
+                    self.logger.warning(f"OriginalText/Translation 열이 없음: {csv_name}")
+                    continue
+
+                original_bytes = df['OriginalText'].str.encode(encoding, errors='replace').str.len()
+                translated_bytes = df['Translation'].str.encode(encoding, errors='replace').str.len()
+                translated_mask = df['Translation'].str.strip() != ''
+
+                # 파일/테이블 접두사별 예산은 고유 파일명 단위로 한 번만 계산
+                if 'FileName' in df.columns:
+                    table_names = df['FileName']
+                else:
+                    table_names = pd.Series(csv_name, index=df.index)
+                resolved = {
+                    name: self._resolve_byte_budget(name, csv_name, budgets, max_ratio, max_bytes)
+                    for name in table_names.unique()
+                }
+                ratio_limit = pd.to_numeric(table_names.map(lambda n: resolved[n][0]), errors='coerce')
+                bytes_limit = pd.to_numeric(table_names.map(lambda n: resolved[n][1]), errors='coerce')
+
+                over_ratio = ratio_limit.notna() & (translated_bytes > original_bytes * ratio_limit)
+                over_bytes = bytes_limit.notna() & (translated_bytes > bytes_limit)
+                over_mask = translated_mask & (over_ratio | over_bytes)
+
+                totals[csv_name] = {
+                    'rows': int(translated_mask.sum()),
+                    'original_bytes': int(original_bytes[translated_mask].sum()),
+                    'translated_bytes': int(translated_bytes[translated_mask].sum()),
+                    'over_count': int(over_mask.sum())
+                }
+
+                file_results = []
+                for idx in df.index[over_mask]:
+                    file_results.append({
+                        'file': csv_name,
+                        'row': idx + 2,  # +2 (헤더 + 0-based)
+                        'issues': self.BYTE_LENGTH_ISSUE,
+                        'text': df.at[idx, 'Translation'][:100],
+                        'original_bytes': int(original_bytes[idx]),
+                        'translated_bytes': int(translated_bytes[idx])
+                    })
+
+                results.extend(file_results)
+                if on_file_done and file_results:
+                    on_file_done(file_results)
+
+                self.logger.info(f"바이트 길이 검증 완료: {csv_name}")
+
+            except Exception as e:
+                self.logger.error(f"바이트 길이 검증 실패 ({csv_name}): {e}")
+
+        self.logger.info(f"바이트 길이 검증 완료. 총 {len(results)}개 초과 항목 발견")
+        return results, totals
+
+    def _iter_byte_length_frames(self, csv_folder):
+        """
+        바이트 길이 검증용 CSV별 DataFrame 반복자
+
+        Args:
+            csv_folder: CSV 폴더 경로 (또는 프로젝트 DB 파일)
+
+        Yields:
+            (CSV 파일명, DataFrame) - 인덱스는 0-based 데이터 행 번호
+        """
+        import pandas as pd
+
+        if ProjectDatabase.is_project_file(csv_folder):
+            with ProjectDatabase(csv_folder) as project_db:
+                for csv_name, rows in groupby(project_db.iter_csv_rows(), key=lambda row: row[0]):
+                    rows = list(rows)
+                    yield csv_name, pd.DataFrame([row[2:] for row in rows],
+                                                 columns=['FileName', 'OriginalText', 'Translation'],
+                                                 index=[row[1] for row in rows])
+            return
+
+        for csv_file in Path(csv_folder).glob('*.csv'):
+            try:
+                df = pd.read_csv(csv_file, encoding='utf-8-sig', dtype=str, keep_default_na=False)
+            except Exception as e:
+                self.logger.error(f"바이트 길이 검증 실패 ({csv_file}): {e}")
+                continue
+            yield csv_file.name, df
+
+    @staticmethod
+    def _normalize_text(text):
+        """비교용 정규화 (NFKC, 연속 공백을 하나로)"""
+        return ' '.join(unicodedata.normalize('NFKC', text).split())
+
+    def iter_translated_rows(self, csv_folder):
+        """
+        번역된 행 반복자
+
+        Args:
+            csv_folder: CSV 폴더 경로 (또는 프로젝트 DB 파일)
+
+        Yields:
+            (CSV 파일명, 행 번호, 원문, 번역문)
+        """
+        if ProjectDatabase.is_project_file(csv_folder):
+            with ProjectDatabase(csv_folder) as project_db:
+                for csv_name, row_no, original, translated in project_db.iter_translated_rows():
+                    yield csv_name, row_no + 2, original, translated
+            return
+
+        for csv_file in sorted(Path(csv_folder).glob('*.csv')):
+            try:
+                with open(csv_file, 'r', encoding='utf-8-sig', newline='') as f:
+                    for idx, row in enumerate(csv.DictReader(f)):
+                        translated = row.get('Translation') or ''
+                        if translated.strip():
+                            # +2 (헤더 + 0-based)
+                            yield csv_file.name, idx + 2, row.get('OriginalText') or '', translated
+            except Exception as e:
+                self.logger.error(f"CSV 읽기 실패 ({csv_file}): {e}")
+
+    def find_inconsistent_translations(self, csv_folder, on_file_done=None):
+        """
+        같은 원문이 서로 다르게 번역된 행 검색
+
+        정규화한 원문의 해시로 한 번만 순회하며 그룹을 만들고,
+        번역이 두 가지 이상인 그룹을 출현 횟수가 많은 순으로 반환합니다.
+
+        Args:
+            csv_folder: 검증할 CSV 폴더 경로 (또는 프로젝트 DB 파일)
+            on_file_done: 결과 리스트를 받는 콜백 (검사가 끝난 후 한 번 호출)
+
+        Returns:
+            검증 결과 리스트 [{file, row, issues, text, original, group, variants}, ...]
+        """
+        # {원문 해시: [원문, {정규화 번역: [(file, row, 번역문), ...]}]}
+        groups = {}
+
+        for csv_name, row_no, original, translated in self.iter_translated_rows(csv_folder):
+            key = hashlib.blake2b(self._normalize_text(original).encode('utf-8'), digest_size=16).digest()
+            group = groups.get(key)
+            if group is None:
+                group = groups[key] = [original, {}]
+            group[1].setdefault(self._normalize_text(translated), []).append((csv_name, row_no, translated))
+
+        inconsistent = [group for group in groups.values() if len(group[1]) > 1]
+        inconsistent.sort(key=lambda group: sum(len(rows) for rows in group[1].values()), reverse=True)
+
+        results = []
+        for rank, (original, variants) in enumerate(inconsistent, 1):
+            # 그룹 안에서는 많이 쓰인 번역부터
+            for rows in sorted(variants.values(), key=len, reverse=True):
+                for csv_name, row_no, translated in rows:
+                    results.append({
+                        'file': csv_name,
+                        'row': row_no,
+                        'issues': self.INCONSISTENT_ISSUE,
+                        'text': f"#{rank} {original[:40]} → {translated}"[:100],
+                        'original': original,
+                        'group': rank,
+                        'variants': len(variants)
+                    })
+
+        if on_file_done and results:
+            on_file_done(results)
+
+        self.logger.info(f"번역 일관성 검사 완료. {len(inconsistent)}개 원문에서 {len(results)}개 행 발견")
+        return results
+
+    def _resolve_byte_budget(self, table_name, csv_name, budgets, max_ratio, max_bytes):
+        """
+        파일/테이블 이름에 적용할 바이트 예산 결정
+
+        Args:
+            table_name: FileName 열 값
+            csv_name: CSV 파일명
+            budgets: 접두사별 예산 딕셔너리
+            max_ratio: 기본 허용 비율
+            max_bytes: 기본 허용 최대 바이트 수
+
+        Returns:
+            (허용 비율, 허용 최대 바이트 수)
+        """
+        best_prefix = None
+        for prefix in budgets:
+            if str(table_name).startswith(prefix) or csv_name.startswith(prefix):
+                if best_prefix is None or len(prefix) > len(best_prefix):
+                    best_prefix = prefix
+
+        if best_prefix is None:
+            return max_ratio, max_bytes
+
+        budget = budgets[best_prefix]
+        return budget.get('max_ratio', max_ratio), budget.get('max_bytes', max_bytes)
+
+    def get_byte_length_summary(self, totals):
+        """
+        바이트 길이 검증의 파일별 합계 요약 생성 (증가량이 큰 파일 순)
+
+        Args:
+            totals: validate_byte_length가 반환한 파일별 합계
+
+        Returns:
+            요약 문자열
+        """
+        if not totals:
+            return ""
+
+        lines = ["파일별 바이트 합계 (원문 → 번역, 증가량 순):\n"]
+        ordered = sorted(
+            totals.items(),
+            key=lambda item: item[1]['translated_bytes'] - item[1]['original_bytes'],
+            reverse=True
+        )
+        for file_name, total in ordered:
+            original = total['original_bytes']
+            translated = total['translated_bytes']
+            ratio = f"{translated / original:.2f}" if original else "-"
+            lines.append(f"  - {file_name}: {original} → {translated} bytes "
+                         f"(x{ratio}, 초과 {total['over_count']}개)\n")
+
+        return "".join(lines)
+
     def save_validation_result(self, results, output_file):
         """
         검증 결과를 TXT 파일로 저장
@@ -102,13 +427,53 @@ class CSVValidator:
                     f.write("문제가 발견되지 않았습니다.\n")
                 else:
                     f.write(f"총 {len(results)}개의 문제가 발견되었습니다.\n\n")
+                    f.writelines(self._iter_result_records(results))
+
+            self.logger.info(f"검증 결과 저장 완료: {output_file}")
+            return True
+
+        except Exception as e:
+            self.logger.error(f"검증 결과 저장 실패: {e}")
+            return False
+
+    def save_validation_result_json(self, results, output_file):
+        """
+        검증 결과를 JSON 파일로 저장
+
+        Args:
+            results: 검증 결과 리스트
+            output_file: 출력 파일 경로
+
+        Returns:
+            성공 여부
+        """
+        try:
+            with open(output_file, 'w', encoding='utf-8') as f:
+                json.dump(results, f, ensure_ascii=False, indent=2)
+
+            self.logger.info(f"검증 결과 저장 완료: {output_file}")
+            return True
+
+        except Exception as e:
+            self.logger.error(f"검증 결과 저장 실패: {e}")
+            return False
 
-                    for result in results:
-                        f.write(f"파일: {result['file']}\n")
-                        f.write(f"행 번호: {result['row']}\n")
-                        f.write(f"문제: {result['issues']}\n")
-                        f.write(f"내용: {result['text']}\n")
-                        f.write("-" * 80 + "\n\n")
+    def save_validation_result_csv(self, results, output_file):
+        """
+        검증 결과를 CSV 파일로 저장
+
+        Args:
+            results: 검증 결과 리스트
+            output_file: 출력 파일 경로
+
+        Returns:
+            성공 여부
+        """
+        try:
+            with open(output_file, 'w', encoding='utf-8-sig', newline='') as f:
+                writer = csv.DictWriter(f, fieldnames=self.RESULT_FIELDS, extrasaction='ignore')
+                writer.writeheader()
+                writer.writerows(results)
 
             self.logger.info(f"검증 결과 저장 완료: {output_file}")
             return True
@@ -117,6 +482,45 @@ class CSVValidator:
             self.logger.error(f"검증 결과 저장 실패: {e}")
             return False
 
+    def export_validation_result(self, results, output_file):
+        """
+        확장자(.txt/.json/.csv)에 맞는 형식으로 검증 결과 저장
+
+        Args:
+            results: 검증 결과 리스트
+            output_file: 출력 파일 경로
+
+        Returns:
+            성공 여부
+        """
+        suffix = Path(output_file).suffix.lower()
+        if suffix == '.json':
+            return self.save_validation_result_json(results, output_file)
+        if suffix == '.csv':
+            return self.save_validation_result_csv(results, output_file)
+        return self.save_validation_result(results, output_file)
+
+    def _iter_result_records(self, results):
+        """
+        TXT 저장용 결과 레코드 문자열 생성기
+
+        Args:
+            results: 검증 결과 리스트
+
+        Yields:
+            결과 하나에 해당하는 문자열
+        """
+        for result in results:
+            byte_line = ""
+            if 'translated_bytes' in result:
+                byte_line = f"바이트: {result['original_bytes']} → {result['translated_bytes']}\n"
+            yield (f"파일: {result['file']}\n"
+                   f"행 번호: {result['row']}\n"
+                   f"문제: {result['issues']}\n"
+                   f"{byte_line}"
+                   f"내용: {result['text']}\n"
+                   + "-" * 80 + "\n\n")
+
     def get_validation_summary(self, results):
         """
         검증 결과 요약 생성
@@ -132,12 +536,7 @@ class CSVValidator:
 
         # 파일별, 문제별 통계
         file_stats = {}
-        issue_stats = {
-            '전각문자': 0,
-            '한자': 0,
-            '히라가나': 0,
-            '가타카나': 0
-        }
+        issue_stats = {issue_type: 0 for issue_type in self.ISSUE_TYPES}
 
         for result in results:
             # 파일별 통계
@@ -151,17 +550,16 @@ class CSVValidator:
                 if issue in issue_stats:
                     issue_stats[issue] += 1
 
-        summary = f"총 {len(results)}개의 문제가 발견되었습니다.\n\n"
-        summary += "파일별 문제 수:\n"
+        lines = [f"총 {len(results)}개의 문제가 발견되었습니다.\n\n", "파일별 문제 수:\n"]
         for file_name, count in sorted(file_stats.items()):
-            summary += f"  - {file_name}: {count}개\n"
+            lines.append(f"  - {file_name}: {count}개\n")
 
-        summary += "\n문제 유형별 통계:\n"
+        lines.append("\n문제 유형별 통계:\n")
         for issue_type, count in issue_stats.items():
             if count > 0:
-                summary += f"  - {issue_type}: {count}개\n"
+                lines.append(f"  - {issue_type}: {count}개\n")
 
-        return summary
+        return "".join(lines)
 
     def get_detailed_validation_text(self, results):
         """
@@ -176,19 +574,28 @@ class CSVValidator:
         if not results:
             return "문제가 발견되지 않았습니다."
 
-        text = f"총 {len(results)}개의 문제가 발견되었습니다.\n\n"
-        text += "=" * 80 + "\n\n"
+        header = f"총 {len(results)}개의 문제가 발견되었습니다.\n\n" + "=" * 80 + "\n\n"
+        return header + "".join(self.iter_detailed_lines(results))
 
-        current_file = None
+    def iter_detailed_lines(self, results, current_file=None):
+        """
+        상세 결과 문자열 생성기 (일괄 결과를 이어서 출력할 때도 사용)
+
+        Args:
+            results: 검증 결과 리스트
+            current_file: 직전에 출력된 파일명 (같은 파일이면 파일 헤더 생략)
+
+        Yields:
+            상세 결과 문자열 조각
+        """
         for result in results:
             # 파일이 바뀔 때마다 파일명 표시
             if current_file != result['file']:
                 current_file = result['file']
-                text += f"\n[파일: {current_file}]\n"
-                text += "-" * 80 + "\n"
+                yield f"\n[파일: {current_file}]\n" + "-" * 80 + "\n"
 
             # 행별 문제 표시
-            text += f"  행 {result['row']}: {result['issues']}\n"
-            text += f"    내용: {result['text'][:80]}...\n\n"
-
-        return text
+            yield f"  행 {result['row']}: {result['issues']}\n"
+            if 'translated_bytes' in result:
+                yield f"    바이트: {result['original_bytes']} → {result['translated_bytes']}\n"
+            yield f"    내용: {result['text'][:80]}...\n\n"
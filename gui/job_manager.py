@@ -0,0 +1,218 @@
+"""
+백그라운드 작업 관리 모듈 (여러 탭의 워커를 대기열에 넣고 동시 실행 수 제한)
+"""
+import time
+from collections import deque
+from functools import partial
+from PyQt6.QtCore import QObject, pyqtSignal
+from core.config_manager import get_config_manager
+from utils.logger import get_logger
+
+
+class Job:
+    """대기열에 들어간 작업 하나 (워커 스레드와 상태/시간 기록)"""
+
+    QUEUED = 'queued'
+    RUNNING = 'running'
+    DONE = 'done'
+    FAILED = 'failed'
+    CANCELLED = 'cancelled'
+
+    def __init__(self, job_id, title, worker, owner=None):
+        """
+        Args:
+            job_id: 작업 번호
+            title: 표시할 작업 이름
+            worker: 워커 스레드 (finished_signal의 첫 인자가 성공 여부)
+            owner: 작업을 요청한 탭 (탭별 취소에 사용)
+        """
+        self.job_id = job_id
+        self.title = title
+        self.worker = worker
+        self.owner = owner
+        self.status = self.QUEUED
+        self.success = False
+        self.message = ''
+        self.percent = None
+        self.queued_at = time.monotonic()
+        self.started_at = None
+        self.finished_at = None
+
+    @property
+    def active(self):
+        """대기 중이거나 실행 중인지 여부"""
+        return self.status in (self.QUEUED, self.RUNNING)
+
+    @property
+    def cancellable(self):
+        """워커가 취소를 지원하는지 여부"""
+        return hasattr(self.worker, 'cancel')
+
+    @property
+    def wait_time(self):
+        """대기 시간 (초)"""
+        end = self.started_at if self.started_at is not None else time.monotonic()
+        return end - self.queued_at
+
+    @property
+    def run_time(self):
+        """실행 시간 (초, 아직 시작하지 않았으면 None)"""
+        if self.started_at is None:
+            return None
+        end = self.finished_at if self.finished_at is not None else time.monotonic()
+        return end - self.started_at
+
+
+class JobManager(QObject):
+    """
+    애플리케이션 전체 백그라운드 작업 관리자
+
+    탭은 워커를 직접 시작하지 않고 submit()으로 넘깁니다. 동시에 실행되는 작업은
+    max_running개로 제한되고 나머지는 순서대로 대기합니다. 외부 도구 프로세스 수는
+    작업 수와 별개로 core.process_budget의 전역 예산으로 제한됩니다.
+    """
+
+    job_added = pyqtSignal(object)
+    job_updated = pyqtSignal(object)
+
+    def __init__(self, max_running=None):
+        """
+        Args:
+            max_running: 동시에 실행할 최대 작업 수 (기본값: 설정 max_concurrent_jobs)
+        """
+        super().__init__()
+        self.logger = get_logger()
+        if max_running is None:
+            max_running = get_config_manager().get('max_concurrent_jobs', 2)
+        self.max_running = max(1, int(max_running))
+        self.jobs = []
+        self._queue = deque()
+        self._next_id = 1
+
+    def submit(self, title, worker, owner=None):
+        """
+        작업 등록 (실행 슬롯이 있으면 바로 시작, 없으면 대기)
+
+        Args:
+            title: 표시할 작업 이름
+            worker: 아직 시작하지 않은 워커 스레드
+            owner: 작업을 요청한 탭
+
+        Returns:
+            Job
+        """
+        job = Job(self._next_id, title, worker, owner)
+        self._next_id += 1
+        self.jobs.append(job)
+
+        worker.finished_signal.connect(partial(self._on_result, job))
+        worker.finished.connect(partial(self._on_thread_finished, job))
+        if hasattr(worker, 'progress_signal'):
+            worker.progress_signal.connect(partial(self._on_progress, job))
+
+        self._queue.append(job)
+        self.logger.info(f"작업 등록 #{job.job_id}: {title}")
+        self.job_added.emit(job)
+        self._start_next()
+        return job
+
+    def cancel(self, job):
+        """
+        작업 취소
+
+        대기 중인 작업은 취소 상태로 바로 시작하여 워커의 취소 경로로 끝나게 합니다.
+        (요청한 탭이 평소처럼 완료 시그널을 받음)
+
+        Args:
+            job: Job
+
+        Returns:
+            취소 요청 여부
+        """
+        if not job.active or not job.cancellable:
+            return False
+
+        job.worker.cancel()
+        if job.status == Job.QUEUED:
+            self._queue.remove(job)
+            self._start(job)
+        return True
+
+    def cancel_jobs(self, owner=None):
+        """
+        작업 여러 개 취소
+
+        Args:
+            owner: 이 탭이 요청한 작업만 취소 (None이면 전체)
+
+        Returns:
+            취소 요청한 작업 수
+        """
+        jobs = [job for job in self.jobs if owner is None or job.owner is owner]
+        return sum(1 for job in jobs if self.cancel(job))
+
+    def has_active(self, owner=None):
+        """대기/실행 중인 작업이 있는지 확인 (owner를 주면 그 탭의 작업만)"""
+        return any(job.active and (owner is None or job.owner is owner) for job in self.jobs)
+
+    def running_count(self):
+        """실행 중인 작업 수"""
+        return sum(1 for job in self.jobs if job.status == Job.RUNNING)
+
+    def wait_all(self):
+        """시작된 모든 작업이 끝날 때까지 대기 (종료 시 사용)"""
+        for job in self.jobs:
+            if job.started_at is not None:
+                job.worker.wait()
+
+    def clear_finished(self):
+        """끝난 작업을 목록에서 제거"""
+        self.jobs = [job for job in self.jobs if job.active]
+
+    def _start_next(self):
+        """실행 슬롯이 남아 있으면 대기 중인 작업 시작"""
+        while self._queue and self.running_count() < self.max_running:
+            self._start(self._queue.popleft())
+
+    def _start(self, job):
+        """작업 시작"""
+        job.status = Job.RUNNING
+        job.started_at = time.monotonic()
+        self.logger.info(f"작업 시작 #{job.job_id}: {job.title} (대기 {job.wait_time:.1f}초)")
+        job.worker.start()
+        self.job_updated.emit(job)
+
+    def _on_result(self, job, success, *args):
+        """워커 완료 시그널 (성공 여부, 메시지, ...)"""
+        job.success = success
+        job.message = str(args[0]) if args else ''
+
+    def _on_progress(self, job, value):
+        """워커 진행 시그널 (ProgressEvent 또는 백분율)"""
+        job.percent = value if isinstance(value, int) else value.percent
+        self.job_updated.emit(job)
+
+    def _on_thread_finished(self, job):
+        """워커 스레드 종료"""
+        job.finished_at = time.monotonic()
+        cancel_token = getattr(job.worker, 'cancel_token', None)
+        if cancel_token is not None and cancel_token.is_cancelled():
+            job.status = Job.CANCELLED
+        else:
+            job.status = Job.DONE if job.success else Job.FAILED
+
+        self.logger.info(f"작업 종료 #{job.job_id}: {job.title} ({job.status}, 실행 {job.run_time:.1f}초)")
+        self.job_updated.emit(job)
+        self._start_next()
+
+
+# 전역 인스턴스
+_global_job_manager = None
+
+
+def get_job_manager():
+    """전역 작업 관리자 인스턴스 반환 (GUI 스레드에서 호출)"""
+    global _global_job_manager
+    if _global_job_manager is None:
+        _global_job_manager = JobManager()
+    return _global_job_manager
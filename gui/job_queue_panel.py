@@ -0,0 +1,117 @@
+"""
+작업 대기열 패널 (작업별 상태/진행률/대기 시간/실행 시간)
+"""
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
+                              QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView)
+from PyQt6.QtCore import Qt, QTimer
+from gui.job_manager import Job, get_job_manager
+from gui.progress_panel import ProgressPanel
+from utils.i18n import t
+
+
+class JobQueuePanel(QWidget):
+    """JobManager의 작업 목록을 표로 보여주고 선택한 작업을 취소하는 패널"""
+
+    COLUMNS = ['title', 'status', 'progress', 'wait', 'run']
+
+    # 실행 중인 작업의 시간 표시 갱신 간격
+    REFRESH_INTERVAL_MS = 1000
+
+    def __init__(self, parent=None):
+        """
+        Args:
+            parent: 부모 위젯
+        """
+        super().__init__(parent)
+        self.job_manager = get_job_manager()
+        self.rows = {}  # {job_id: 행 번호}
+        self.init_ui()
+
+        self.job_manager.job_added.connect(self.add_job)
+        self.job_manager.job_updated.connect(self.update_job)
+
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setInterval(self.REFRESH_INTERVAL_MS)
+        self.refresh_timer.timeout.connect(self.refresh_times)
+
+    def init_ui(self):
+        """UI 초기화"""
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(4, 4, 4, 4)
+
+        self.table = QTableWidget(0, len(self.COLUMNS))
+        self.table.setHorizontalHeaderLabels([t(f"jobs.column_{column}") for column in self.COLUMNS])
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        self.table.verticalHeader().setVisible(False)
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        layout.addWidget(self.table)
+
+        button_layout = QHBoxLayout()
+        self.btn_cancel = QPushButton(t("jobs.cancel_selected"))
+        self.btn_cancel.clicked.connect(self.cancel_selected)
+        self.btn_clear = QPushButton(t("jobs.clear_finished"))
+        self.btn_clear.clicked.connect(self.clear_finished)
+        button_layout.addStretch()
+        button_layout.addWidget(self.btn_cancel)
+        button_layout.addWidget(self.btn_clear)
+        layout.addLayout(button_layout)
+
+    def add_job(self, job):
+        """작업 행 추가"""
+        row = self.table.rowCount()
+        self.table.insertRow(row)
+        self.rows[job.job_id] = row
+
+        title_item = QTableWidgetItem(job.title)
+        title_item.setData(Qt.ItemDataRole.UserRole, job.job_id)
+        self.table.setItem(row, 0, title_item)
+        for column in range(1, len(self.COLUMNS)):
+            self.table.setItem(row, column, QTableWidgetItem())
+        self.update_job(job)
+
+    def update_job(self, job):
+        """작업 행 갱신"""
+        row = self.rows.get(job.job_id)
+        if row is None:
+            return
+
+        percent = 100 if job.status == Job.DONE else job.percent
+        run_time = job.run_time
+        self.table.item(row, 1).setText(t(f"jobs.status_{job.status}"))
+        self.table.item(row, 2).setText(f"{int(percent)}%" if percent is not None else "")
+        self.table.item(row, 3).setText(ProgressPanel.format_seconds(job.wait_time))
+        self.table.item(row, 4).setText(ProgressPanel.format_seconds(run_time) if run_time is not None else "")
+        if job.message:
+            self.table.item(row, 0).setToolTip(job.message)
+
+        if self.job_manager.has_active():
+            if not self.refresh_timer.isActive():
+                self.refresh_timer.start()
+        else:
+            self.refresh_timer.stop()
+
+    def refresh_times(self):
+        """대기/실행 중인 작업의 시간 표시 갱신"""
+        for job in self.job_manager.jobs:
+            if job.active:
+                self.update_job(job)
+
+    def selected_jobs(self):
+        """선택한 행의 작업 리스트"""
+        job_ids = {self.table.item(index.row(), 0).data(Qt.ItemDataRole.UserRole)
+                   for index in self.table.selectionModel().selectedRows()}
+        return [job for job in self.job_manager.jobs if job.job_id in job_ids]
+
+    def cancel_selected(self):
+        """선택한 작업 취소"""
+        for job in self.selected_jobs():
+            self.job_manager.cancel(job)
+
+    def clear_finished(self):
+        """끝난 작업을 목록에서 제거"""
+        self.job_manager.clear_finished()
+        self.table.setRowCount(0)
+        self.rows = {}
+        for job in self.job_manager.jobs:
+            self.add_job(job)
@@ -0,0 +1,92 @@
+"""
+공용 로그 출력 위젯 (버퍼링 + 일괄 출력 + 줄 수 제한)
+"""
+from PyQt6.QtWidgets import QPlainTextEdit
+from PyQt6.QtCore import QTimer, QUrl
+from PyQt6.QtGui import QDesktopServices
+from utils.logger import get_logger
+from utils.i18n import t
+
+
+class LogWidget(QPlainTextEdit):
+    """
+    워커 시그널로 들어오는 로그를 모아서 주기적으로 한 번에 출력하는 로그 창
+
+    메시지마다 다시 그리지 않도록 FLUSH_INTERVAL_MS 간격으로 묶어서 추가하고,
+    문서는 MAX_BLOCKS 줄까지만 보관합니다. 전체 로그는 애플리케이션 로그 파일에 남습니다.
+    """
+
+    FLUSH_INTERVAL_MS = 100
+    MAX_BLOCKS = 5000
+
+    def __init__(self, log_name=None, parent=None):
+        """
+        Args:
+            log_name: 로그 파일에 함께 기록할 때 붙일 이름 (None이면 파일에 기록하지 않음)
+            parent: 부모 위젯
+        """
+        super().__init__(parent)
+        self.setReadOnly(True)
+        self.setMaximumBlockCount(self.MAX_BLOCKS)
+        self.log_name = log_name
+        self.logger = get_logger()
+        self._pending = []
+
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self.flush)
+
+    def append_message(self, message):
+        """
+        로그 메시지 추가 (다음 flush 때 출력)
+
+        Args:
+            message: 메시지 (여러 줄 가능)
+        """
+        self._pending.append(str(message))
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def flush(self):
+        """대기 중인 메시지를 한 번에 출력"""
+        self._flush_timer.stop()
+        if not self._pending:
+            return
+
+        messages, self._pending = self._pending, []
+        if self.log_name:
+            for message in messages:
+                self.logger.info(f"[{self.log_name}] {message}")
+
+        # 사용자가 위로 스크롤해 보고 있으면 위치 유지
+        scrollbar = self.verticalScrollBar()
+        at_bottom = scrollbar.value() >= scrollbar.maximum()
+        self.appendPlainText('\n'.join(messages))
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
+
+    def clear(self):
+        """로그와 대기 중인 메시지 모두 지우기"""
+        self._pending = []
+        self._flush_timer.stop()
+        super().clear()
+
+    def setPlainText(self, text):
+        """내용 교체 (대기 중인 메시지는 버림)"""
+        self._pending = []
+        self._flush_timer.stop()
+        super().setPlainText(text)
+
+    def contextMenuEvent(self, event):
+        """기본 메뉴에 로그 파일 열기 추가"""
+        menu = self.createStandardContextMenu()
+        menu.addSeparator()
+        open_action = menu.addAction(t("common.open_log_file"))
+        open_action.triggered.connect(self.open_log_file)
+        menu.exec(event.globalPos())
+
+    def open_log_file(self):
+        """애플리케이션 로그 파일 열기"""
+        self.flush()
+        QDesktopServices.openUrl(QUrl.fromLocalFile(str(self.logger.log_file.resolve())))
@@ -1,16 +1,17 @@
 """
 메인 윈도우
 """
+import time
 from PyQt6.QtWidgets import (QMainWindow, QTabWidget, QWidget, QVBoxLayout,
                               QMenuBar, QStatusBar, QMessageBox, QFileDialog,
-                              QDialog, QComboBox, QLabel, QPushButton, QHBoxLayout)
-from PyQt6.QtCore import Qt
-from gui.tab_unpack import TabUnpack
-from gui.tab_to_csv import TabToCSV
-from gui.tab_csv_edit import TabCSVEdit
-from gui.tab_apply import TabApply
+                              QDialog, QComboBox, QLabel, QPushButton, QHBoxLayout,
+                              QDockWidget)
+from PyQt6.QtCore import Qt, QThread, pyqtSignal
 from core.config_manager import get_config_manager
+from gui.job_manager import get_job_manager
+from gui.job_queue_panel import JobQueuePanel
 from utils.logger import get_logger
+from utils.profiler import get_profiler
 from utils.i18n import t, set_language, get_language, get_available_languages
 
 
@@ -73,15 +74,80 @@ class LanguageDialog(QDialog):
         return self.language_combo.currentData()
 
 
+class ToolDetectWorker(QThread):
+    """외부 도구 자동 탐지를 수행하는 워커 스레드"""
+
+    finished_signal = pyqtSignal()
+
+    def __init__(self, config_manager):
+        super().__init__()
+        self.config_manager = config_manager
+
+    def run(self):
+        """작업 실행"""
+        try:
+            with get_profiler().phase("ToolFinder"):
+                self.config_manager.detect_tools()
+        except Exception as e:
+            get_logger().error(f"외부 도구 자동 탐지 실패: {e}")
+        self.finished_signal.emit()
+
+
+# 탭 생성 함수 - 탭 모듈은 처음 선택될 때 가져옴
+# (함수 안의 정적 import라서 PyInstaller가 탭 모듈을 찾아 번들에 포함)
+def create_tab_unpack():
+    from gui.tab_unpack import TabUnpack
+    return TabUnpack()
+
+
+def create_tab_to_csv():
+    from gui.tab_to_csv import TabToCSV
+    return TabToCSV()
+
+
+def create_tab_csv_edit():
+    from gui.tab_csv_edit import TabCSVEdit
+    return TabCSVEdit()
+
+
+def create_tab_apply():
+    from gui.tab_apply import TabApply
+    return TabApply()
+
+
+def create_tab_translation_editor():
+    from gui.tab_translation_editor import TabTranslationEditor
+    return TabTranslationEditor()
+
+
+def create_tab_search():
+    from gui.tab_search import TabSearch
+    return TabSearch()
+
+
 class MainWindow(QMainWindow):
     """메인 윈도우 클래스"""
 
+    # (탭 생성 함수, 탭 제목 키) - 탭은 처음 선택될 때 생성
+    TABS = [
+        (create_tab_unpack, 'tabs.unpack'),
+        (create_tab_to_csv, 'tabs.to_csv'),
+        (create_tab_csv_edit, 'tabs.csv_edit'),
+        (create_tab_apply, 'tabs.apply'),
+        (create_tab_translation_editor, 'tabs.editor'),
+        (create_tab_search, 'tabs.search'),
+    ]
+
     def __init__(self):
         super().__init__()
         self.config_manager = get_config_manager()
         self.logger = get_logger()
+        self.tool_detect_worker = None
+        self.tab_pages = []
+        self.tab_widgets = {}
+        self.job_manager = get_job_manager()
         self.init_ui()
-        self.check_external_tools()
+        self.detect_external_tools()
 
     def init_ui(self):
         """UI 초기화"""
@@ -91,19 +157,51 @@ class MainWindow(QMainWindow):
         # 메뉴바
         self.create_menu_bar()
 
-        # 탭 위젯
-        tabs = QTabWidget()
-        tabs.addTab(TabUnpack(), t("tabs.unpack"))
-        tabs.addTab(TabToCSV(), t("tabs.to_csv"))
-        tabs.addTab(TabCSVEdit(),t("tabs.csv_edit"))
-        tabs.addTab(TabApply(), t("tabs.apply"))
-
-        self.setCentralWidget(tabs)
+        # 탭 위젯 (빈 페이지만 만들고 실제 탭은 처음 선택될 때 생성)
+        self.tabs = QTabWidget()
+        for _, title_key in self.TABS:
+            page = QWidget()
+            page_layout = QVBoxLayout(page)
+            page_layout.setContentsMargins(0, 0, 0, 0)
+            self.tab_pages.append(page)
+            self.tabs.addTab(page, t(title_key))
+        self.tabs.currentChanged.connect(self.ensure_tab)
+        self.ensure_tab(self.tabs.currentIndex())
+
+        self.setCentralWidget(self.tabs)
+
+        # 작업 대기열 (모든 탭의 백그라운드 작업)
+        self.job_dock = QDockWidget(t("jobs.title"), self)
+        self.job_dock.setObjectName("job_dock")
+        self.job_dock.setWidget(JobQueuePanel())
+        self.addDockWidget(Qt.DockWidgetArea.BottomDockWidgetArea, self.job_dock)
+        self.view_menu.addAction(self.job_dock.toggleViewAction())
 
         # 상태바
         self.statusBar().showMessage("준비")
         self.logger.info("메인 윈도우 초기화 완료")
 
+    def ensure_tab(self, index):
+        """
+        탭 생성 (처음 선택될 때 한 번만)
+
+        Args:
+            index: 탭 인덱스
+
+        Returns:
+            탭 위젯
+        """
+        if index < 0 or index in self.tab_widgets:
+            return self.tab_widgets.get(index)
+
+        create_tab, _ = self.TABS[index]
+        start = time.perf_counter()
+        widget = create_tab()
+        self.tab_pages[index].layout().addWidget(widget)
+        self.tab_widgets[index] = widget
+        self.logger.info(f"탭 생성: {type(widget).__name__} ({(time.perf_counter() - start) * 1000:.1f}ms)")
+        return widget
+
     def create_menu_bar(self):
         """메뉴바 생성"""
         menubar = self.menuBar()
@@ -113,6 +211,9 @@ class MainWindow(QMainWindow):
         exit_action = file_menu.addAction("종료")
         exit_action.triggered.connect(self.close)
 
+        # 보기 메뉴 (작업 대기열 표시 여부는 init_ui에서 추가)
+        self.view_menu = menubar.addMenu("보기")
+
         # 설정 메뉴
         settings_menu = menubar.addMenu("설정")
         language_action = settings_menu.addAction("언어 / Language")
@@ -128,6 +229,24 @@ class MainWindow(QMainWindow):
         about_action = help_menu.addAction("정보")
         about_action.triggered.connect(self.show_about)
 
+    def detect_external_tools(self):
+        """외부 도구 경로가 없으면 백그라운드에서 자동 탐지 후 확인"""
+        if not self.config_manager.needs_tool_detection():
+            self.check_external_tools()
+            return
+
+        self.statusBar().showMessage("외부 도구 탐지 중...")
+        self.tool_detect_worker = ToolDetectWorker(self.config_manager)
+        self.tool_detect_worker.finished_signal.connect(self.on_tools_detected)
+        self.tool_detect_worker.start()
+
+    def on_tools_detected(self):
+        """외부 도구 자동 탐지 완료 시 호출"""
+        self.tool_detect_worker = None
+        self.statusBar().showMessage("준비")
+        get_profiler().write(self.logger.log_dir)
+        self.check_external_tools()
+
     def check_external_tools(self):
         """외부 도구 경로 확인"""
         ff16tools_path = self.config_manager.get_ff16tools_path()
@@ -211,4 +330,13 @@ class MainWindow(QMainWindow):
     def closeEvent(self, event):
         """종료 이벤트"""
         self.logger.info("프로그램 종료")
+        if self.tool_detect_worker is not None:
+            self.tool_detect_worker.wait()
+
+        # 실행/대기 중인 작업 취소 (외부 도구 프로세스가 남지 않도록 종료될 때까지 대기)
+        self.job_manager.cancel_jobs()
+        self.job_manager.wait_all()
+
+        # 예약된 설정 저장
+        self.config_manager.flush()
         event.accept()
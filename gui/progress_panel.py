@@ -0,0 +1,106 @@
+"""
+진행 상황 표시 위젯 (진행률 + 처리 속도 + 남은 시간)
+"""
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QProgressBar, QLabel
+from utils.i18n import t
+
+
+class ProgressPanel(QWidget):
+    """
+    워커가 보내는 ProgressEvent를 받아 단계별 진행 상황을 표시하는 위젯
+
+    전체 양을 아는 단계는 실제 진행률/초당 파일 수/남은 시간을,
+    모르는 단계(외부 도구 실행 등)는 바쁨 표시와 경과 시간을 보여줍니다.
+    """
+
+    def __init__(self, parent=None):
+        """
+        Args:
+            parent: 부모 위젯
+        """
+        super().__init__(parent)
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        self.bar = QProgressBar()
+        self.label = QLabel()
+        layout.addWidget(self.bar)
+        layout.addWidget(self.label)
+        self.reset()
+
+    def reset(self):
+        """초기 상태로 되돌리기"""
+        self.bar.setRange(0, 100)
+        self.bar.setValue(0)
+        self.bar.setFormat("%p%")
+        self.label.clear()
+
+    def set_busy(self, text=""):
+        """
+        진행률을 알 수 없는 작업 표시
+
+        Args:
+            text: 라벨에 표시할 문구
+        """
+        self.bar.setRange(0, 0)
+        self.label.setText(text)
+
+    def update_progress(self, event):
+        """
+        진행 상황 이벤트 반영
+
+        Args:
+            event: ProgressEvent
+        """
+        stage_name = self.stage_name(event.stage)
+        percent = event.percent
+
+        if event.finished:
+            self.bar.setRange(0, 100)
+            self.bar.setValue(100)
+            self.bar.setFormat(f"{stage_name} %p%")
+            self.label.setText(t("progress.status_done", stage=stage_name,
+                                 elapsed=self.format_seconds(event.elapsed)))
+            return
+
+        if percent is None:
+            self.bar.setRange(0, 0)
+            self.label.setText(t("progress.status_busy", stage=stage_name,
+                                 elapsed=self.format_seconds(event.elapsed)))
+            return
+
+        self.bar.setRange(0, 100)
+        self.bar.setValue(int(percent))
+        self.bar.setFormat(f"{stage_name} %p%")
+
+        eta = event.eta
+        self.label.setText(t("progress.status",
+                             processed=event.processed,
+                             total=event.total,
+                             rate=f"{event.rate:.1f}",
+                             elapsed=self.format_seconds(event.elapsed),
+                             eta=self.format_seconds(eta) if eta is not None else "-"))
+
+    def finish(self, success):
+        """
+        작업 종료 표시
+
+        Args:
+            success: 성공 여부
+        """
+        self.bar.setRange(0, 100)
+        self.bar.setValue(100 if success else 0)
+        self.bar.setFormat("%p%")
+
+    @staticmethod
+    def stage_name(stage):
+        """단계 이름 번역 (번역이 없으면 단계 키 그대로)"""
+        key = f"progress.stage_{stage}"
+        name = t(key)
+        return stage if name == key else name
+
+    @staticmethod
+    def format_seconds(seconds):
+        """초를 m:ss 형식으로 변환"""
+        seconds = int(round(seconds))
+        return f"{seconds // 60}:{seconds % 60:02d}"
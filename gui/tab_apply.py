@@ -4,11 +4,15 @@
 from pathlib import Path
 import shutil
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-                              QPushButton, QLineEdit, QTextEdit, QProgressBar,
+                              QPushButton, QLineEdit,
                               QCheckBox, QFileDialog, QGroupBox, QMessageBox,
                               QRadioButton, QButtonGroup)
 from PyQt6.QtCore import QThread, pyqtSignal
-from core.pac_handler import PACHandler
+from core.cancellation import CancellationToken, OperationCancelled, check_cancelled
+from core.progress import ProgressTracker
+from gui.job_manager import Job, get_job_manager
+from gui.log_widget import LogWidget
+from gui.progress_panel import ProgressPanel
 from utils.i18n import t
 
 
@@ -16,7 +20,7 @@ class ApplyWorker(QThread):
     """번역 적용 및 팩킹 작업을 수행하는 워커 스레드"""
 
     log_signal = pyqtSignal(str)
-    progress_signal = pyqtSignal(int)
+    progress_signal = pyqtSignal(object)  # ProgressEvent
     finished_signal = pyqtSignal(bool, str)
 
     def __init__(self, csv_folder, source_folder, output_pac, workflow_mode,
@@ -29,10 +33,24 @@ class ApplyWorker(QThread):
         self.delete_other = delete_other
         self.apply_yaml = apply_yaml
         self.apply_json = apply_json
+        self.cancel_token = CancellationToken()
+
+    def cancel(self):
+        """작업 취소 요청 (실행 중인 외부 도구 프로세스 종료)"""
+        self.cancel_token.cancel()
+
+    def _copy_file(self, src, dst):
+        """copytree용 복사 함수 (파일마다 취소 확인)"""
+        check_cancelled(self.cancel_token)
+        return shutil.copy2(src, dst)
 
     def run(self):
         """작업 실행"""
         try:
+            # 대기열에서 취소된 경우 바로 종료
+            check_cancelled(self.cancel_token)
+
+            from core.pac_handler import PACHandler
             pac_handler = PACHandler()
 
             # 콜백 함수로 로그 전송
@@ -58,7 +76,14 @@ class ApplyWorker(QThread):
                 if copy_folder.exists():
                     callback(t("tab_apply.copy_deleting_old"))
                     shutil.rmtree(copy_folder)
-                shutil.copytree(self.source_folder, copy_folder)
+                tracker = ProgressTracker('copy', 0, self.progress_signal.emit)
+                try:
+                    shutil.copytree(self.source_folder, copy_folder, copy_function=self._copy_file)
+                except OperationCancelled:
+                    # 일부만 복사된 폴더는 남기지 않음
+                    shutil.rmtree(copy_folder, ignore_errors=True)
+                    raise
+                tracker.finish()
                 working_folder = str(copy_folder)
                 callback(t("tab_apply.copy_complete"))
 
@@ -103,12 +128,12 @@ class ApplyWorker(QThread):
                 apply_json=self.apply_json,
                 skip_packing=skip_packing,
                 game='fft',
-                callback=callback
+                callback=callback,
+                progress=self.progress_signal.emit,
+                cancel_token=self.cancel_token
             )
 
             if success:
-                self.progress_signal.emit(100)
-
                 # 성공 메시지
                 if self.workflow_mode == 1:
                     self.finished_signal.emit(True, t("tab_apply.complete_with_pack_mode1", folder=working_folder, pac=self.output_pac))
@@ -121,6 +146,9 @@ class ApplyWorker(QThread):
             else:
                 self.finished_signal.emit(False, t("tab_apply.error_occurred"))
 
+        except OperationCancelled:
+            self.finished_signal.emit(False, t("common.cancelled"))
+
         except Exception as e:
             self.log_signal.emit(t("tab_apply.error_with_detail", error=str(e)))
             import traceback
@@ -151,7 +179,7 @@ class TabApply(QWidget):
 
     def __init__(self):
         super().__init__()
-        self.worker = None
+        self.job_manager = get_job_manager()
         self.init_ui()
 
     def init_ui(self):
@@ -166,9 +194,12 @@ class TabApply(QWidget):
         self.csv_folder_edit.setPlaceholderText(t("tab_apply.select_csv"))
         btn_select_csv = QPushButton(t("tab_apply.select_folder"))
         btn_select_csv.clicked.connect(self.select_csv_folder)
+        btn_select_db = QPushButton(t("tab_apply.select_db"))
+        btn_select_db.clicked.connect(self.select_csv_db)
         layout_csv.addWidget(QLabel(t("tab_apply.csv_folder_label")))
         layout_csv.addWidget(self.csv_folder_edit)
         layout_csv.addWidget(btn_select_csv)
+        layout_csv.addWidget(btn_select_db)
         group_csv.setLayout(layout_csv)
         layout.addWidget(group_csv)
 
@@ -270,12 +301,17 @@ class TabApply(QWidget):
         layout.addWidget(self.btn_start)
 
         # 진행 상태
-        self.progress_bar = QProgressBar()
-        layout.addWidget(self.progress_bar)
+        self.progress_panel = ProgressPanel()
+        layout.addWidget(self.progress_panel)
+
+        # 취소 버튼
+        self.btn_cancel = QPushButton(t("common.cancel"))
+        self.btn_cancel.setEnabled(False)
+        self.btn_cancel.clicked.connect(self.cancel_task)
+        layout.addWidget(self.btn_cancel)
 
         # 로그 출력
-        self.log_text = QTextEdit()
-        self.log_text.setReadOnly(True)
+        self.log_text = LogWidget("apply")
         self.log_text.setMaximumHeight(200)
         layout.addWidget(QLabel(t("tab_apply.log")))
         layout.addWidget(self.log_text)
@@ -305,6 +341,15 @@ class TabApply(QWidget):
             self.csv_folder_edit.setText(folder_path)
             self.add_log(t("tab_apply.folder_selected", path=folder_path))
 
+    def select_csv_db(self):
+        """프로젝트 DB 선택 (CSV 폴더 대신 사용)"""
+        file_path, _ = QFileDialog.getOpenFileName(
+            self, t("tab_apply.select_db"), "", "Project DB (*.db *.sqlite *.fftproj)"
+        )
+        if file_path:
+            self.csv_folder_edit.setText(file_path)
+            self.add_log(t("tab_apply.folder_selected", path=file_path))
+
     def select_source_folder(self):
         """원본 폴더 선택"""
         folder_path = QFileDialog.getExistingDirectory(self, t("tab_apply.source_folder"))
@@ -364,11 +409,11 @@ class TabApply(QWidget):
 
         # UI 상태 변경
         self.btn_start.setEnabled(False)
-        self.progress_bar.setValue(0)
+        self.progress_panel.reset()
         self.add_log(t("tab_apply.start_apply"))
 
-        # 워커 스레드 생성 및 시작
-        self.worker = ApplyWorker(
+        # 워커 스레드 생성
+        worker = ApplyWorker(
             csv_folder,
             source_folder,
             str(output_pac) if output_pac else None,
@@ -379,25 +424,35 @@ class TabApply(QWidget):
         )
 
         # 시그널 연결
-        self.worker.log_signal.connect(self.add_log)
-        self.worker.progress_signal.connect(self.progress_bar.setValue)
-        self.worker.finished_signal.connect(self.on_finished)
+        worker.log_signal.connect(self.add_log)
+        worker.progress_signal.connect(self.progress_panel.update_progress)
+        worker.finished_signal.connect(self.on_finished)
 
-        # 스레드 시작
-        self.worker.start()
+        # 작업 대기열에 등록
+        job = self.job_manager.submit(t("jobs.title_apply", name=Path(source_folder).name), worker, owner=self)
+        if job.status == Job.QUEUED:
+            self.add_log(t("jobs.queued_log", title=job.title))
+        self.btn_cancel.setEnabled(True)
 
     def on_finished(self, success, message):
         """작업 완료 시 호출"""
+        worker = self.sender()
         self.add_log(message)
+        self.progress_panel.finish(success)
         self.btn_start.setEnabled(True)
+        self.btn_cancel.setEnabled(False)
 
         if success:
             QMessageBox.information(self, t("common.completed"), message)
-        else:
+        elif not worker.cancel_token.is_cancelled():
             QMessageBox.critical(self, t("common.error"), message)
 
-        self.worker = None
+    def cancel_task(self):
+        """이 탭에서 시작한 작업 취소"""
+        if self.job_manager.cancel_jobs(self):
+            self.btn_cancel.setEnabled(False)
+            self.add_log(t("common.cancelling"))
 
     def add_log(self, message):
         """로그 추가"""
-        self.log_text.append(message)
+        self.log_text.append_message(message)
@@ -3,22 +3,41 @@ Tab 3: CSV Edit
 """
 from pathlib import Path
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-                              QPushButton, QLineEdit, QTextEdit, QCheckBox,
-                              QFileDialog, QGroupBox, QMessageBox)
+                              QPushButton, QLineEdit, QCheckBox,
+                              QFileDialog, QGroupBox, QMessageBox,
+                              QDoubleSpinBox, QSpinBox, QComboBox)
 from PyQt6.QtCore import QThread, pyqtSignal
 from core.validator import CSVValidator
-from core.csv_handler import CSVHandler
+from core.config_manager import get_config_manager
+from gui.validation_view import ValidationResultModel, ValidationResultView
+from gui.log_widget import LogWidget
 from utils.i18n import t
 
 class ValidationWorker(QThread):
     """Worker thread for validation tasks"""
 
     log_signal = pyqtSignal(str)
-    finished_signal = pyqtSignal(bool, list)
-
-    def __init__(self, csv_folder):
+    results_signal = pyqtSignal(list)
+    finished_signal = pyqtSignal(bool, dict)
+
+    def __init__(self, csv_folder, check_bytes=False, max_ratio=None, max_bytes=None,
+                 check_consistency=False, glossary_file=None):
+        """
+        Args:
+            csv_folder: CSV folder to validate
+            check_bytes: Whether to run the byte-length budget check
+            max_ratio: Allowed Translation/OriginalText byte ratio (None: unchecked)
+            max_bytes: Allowed absolute byte length (None: unchecked)
+            check_consistency: Whether to report inconsistent translations
+            glossary_file: Glossary CSV to enforce (None: unchecked)
+        """
         super().__init__()
         self.csv_folder = csv_folder
+        self.check_bytes = check_bytes
+        self.max_ratio = max_ratio
+        self.max_bytes = max_bytes
+        self.check_consistency = check_consistency
+        self.glossary_file = glossary_file
 
     def run(self):
         """Execute task"""
@@ -26,14 +45,40 @@ class ValidationWorker(QThread):
             validator = CSVValidator()
             self.log_signal.emit(t("tab_csv_edit.log_validation_start"))
 
-            results = validator.validate_csv(self.csv_folder)
+            # Results are streamed to the GUI one file at a time
+            validator.validate_csv(self.csv_folder, on_file_done=self.results_signal.emit)
+
+            byte_totals = {}
+            if self.check_bytes:
+                self.log_signal.emit(t("tab_csv_edit.log_byte_check_start"))
+                _, byte_totals = validator.validate_byte_length(
+                    self.csv_folder,
+                    max_ratio=self.max_ratio,
+                    max_bytes=self.max_bytes,
+                    budgets=get_config_manager().get_byte_budgets(),
+                    on_file_done=self.results_signal.emit
+                )
+
+            if self.check_consistency:
+                self.log_signal.emit(t("tab_csv_edit.log_consistency_start"))
+                validator.find_inconsistent_translations(
+                    self.csv_folder,
+                    on_file_done=self.results_signal.emit
+                )
+
+            if self.glossary_file:
+                from core.glossary import GlossaryChecker
+                checker = GlossaryChecker()
+                term_count = checker.load(self.glossary_file)
+                self.log_signal.emit(t("tab_csv_edit.log_glossary_start", count=term_count))
+                checker.check_folder(self.csv_folder, on_file_done=self.results_signal.emit)
 
             self.log_signal.emit(t("tab_csv_edit.log_validation_complete"))
-            self.finished_signal.emit(True, results)
+            self.finished_signal.emit(True, byte_totals)
 
         except Exception as e:
             self.log_signal.emit(t("tab_csv_edit.log_error", error=str(e)))
-            self.finished_signal.emit(False, [])
+            self.finished_signal.emit(False, {})
 
 
 class ReplaceWorker(QThread):
@@ -52,6 +97,7 @@ class ReplaceWorker(QThread):
     def run(self):
         """Execute task"""
         try:
+            from core.csv_handler import CSVHandler
             csv_handler = CSVHandler()
             self.log_signal.emit(t("tab_csv_edit.log_replace_start"))
 
@@ -70,6 +116,73 @@ class ReplaceWorker(QThread):
             self.finished_signal.emit(False, 0)
 
 
+class SuggestionWorker(QThread):
+    """Worker thread for translation memory suggestions"""
+
+    log_signal = pyqtSignal(str)
+    finished_signal = pyqtSignal(bool, int)
+
+    def __init__(self, csv_folder, min_score):
+        super().__init__()
+        self.csv_folder = csv_folder
+        self.min_score = min_score
+
+    def run(self):
+        """Execute task"""
+        try:
+            from core.translation_memory import TranslationMemory
+            memory = TranslationMemory()
+            self.log_signal.emit(t("tab_csv_edit.log_tm_build_start"))
+            pairs = memory.build_from_folder(self.csv_folder)
+            self.log_signal.emit(t("tab_csv_edit.log_tm_built", count=pairs))
+
+            count = memory.fill_folder(
+                self.csv_folder,
+                self.min_score,
+                callback=lambda name, filled: self.log_signal.emit(
+                    t("tab_csv_edit.log_tm_file_done", file=name, count=filled)
+                )
+            )
+
+            self.log_signal.emit(t("tab_csv_edit.log_tm_complete", count=count))
+            self.finished_signal.emit(True, count)
+
+        except Exception as e:
+            self.log_signal.emit(t("tab_csv_edit.log_error", error=str(e)))
+            self.finished_signal.emit(False, 0)
+
+
+class TermStatsWorker(QThread):
+    """Worker thread for glossary term candidate extraction"""
+
+    log_signal = pyqtSignal(str)
+    finished_signal = pyqtSignal(bool, int)
+
+    def __init__(self, csv_folder, output_file):
+        super().__init__()
+        self.csv_folder = csv_folder
+        self.output_file = output_file
+
+    def run(self):
+        """Execute task"""
+        try:
+            from core.term_stats import TermStatistics
+            term_stats = TermStatistics()
+            self.log_signal.emit(t("tab_csv_edit.log_term_stats_start"))
+
+            candidates = term_stats.analyze(self.csv_folder)
+            if not term_stats.save_candidates(candidates, self.output_file):
+                raise IOError(self.output_file)
+
+            self.log_signal.emit(t("tab_csv_edit.log_term_stats_complete", count=len(candidates),
+                                   path=self.output_file))
+            self.finished_signal.emit(True, len(candidates))
+
+        except Exception as e:
+            self.log_signal.emit(t("tab_csv_edit.log_error", error=str(e)))
+            self.finished_signal.emit(False, 0)
+
+
 class TabCSVEdit(QWidget):
     """CSV validation and edit tab"""
 
@@ -77,7 +190,11 @@ class TabCSVEdit(QWidget):
         super().__init__()
         self.validation_worker = None
         self.replace_worker = None
+        self.suggestion_worker = None
+        self.term_stats_worker = None
         self.validation_results = []
+        self._result_files = set()
+        self.validator = CSVValidator()
         self.init_ui()
 
     def init_ui(self):
@@ -99,28 +216,91 @@ class TabCSVEdit(QWidget):
         self.csv_folder_edit.setPlaceholderText(t("tab_csv_edit.select_folder"))
         btn_select_folder = QPushButton(t("common.select_folder"))
         btn_select_folder.clicked.connect(self.select_csv_folder)
+        btn_select_db = QPushButton(t("tab_csv_edit.select_db"))
+        btn_select_db.clicked.connect(self.select_csv_db)
         layout_folder.addWidget(QLabel(t("tab_csv_edit.csv_folder")))
         layout_folder.addWidget(self.csv_folder_edit)
         layout_folder.addWidget(btn_select_folder)
+        layout_folder.addWidget(btn_select_db)
         layout_validate.addLayout(layout_folder)
 
+        # Byte-length budget options
+        layout_bytes = QHBoxLayout()
+        self.check_byte_length = QCheckBox(t("tab_csv_edit.check_byte_length"))
+        self.spin_byte_ratio = QDoubleSpinBox()
+        self.spin_byte_ratio.setRange(0.0, 10.0)
+        self.spin_byte_ratio.setSingleStep(0.1)
+        self.spin_byte_ratio.setValue(1.0)
+        self.spin_byte_ratio.setSpecialValueText(t("tab_csv_edit.unlimited"))
+        self.spin_byte_max = QSpinBox()
+        self.spin_byte_max.setRange(0, 1000000)
+        self.spin_byte_max.setSpecialValueText(t("tab_csv_edit.unlimited"))
+        layout_bytes.addWidget(self.check_byte_length)
+        layout_bytes.addWidget(QLabel(t("tab_csv_edit.byte_ratio")))
+        layout_bytes.addWidget(self.spin_byte_ratio)
+        layout_bytes.addWidget(QLabel(t("tab_csv_edit.byte_max")))
+        layout_bytes.addWidget(self.spin_byte_max)
+        layout_bytes.addStretch()
+        layout_validate.addLayout(layout_bytes)
+
+        # Translation consistency option
+        self.check_consistency = QCheckBox(t("tab_csv_edit.check_consistency"))
+        layout_validate.addWidget(self.check_consistency)
+
+        # Glossary option
+        layout_glossary = QHBoxLayout()
+        self.check_glossary = QCheckBox(t("tab_csv_edit.check_glossary"))
+        self.glossary_edit = QLineEdit()
+        self.glossary_edit.setReadOnly(True)
+        self.glossary_edit.setPlaceholderText(t("tab_csv_edit.glossary_placeholder"))
+        self.glossary_edit.setText(get_config_manager().get_last_used_path('glossary'))
+        btn_select_glossary = QPushButton(t("common.select_file"))
+        btn_select_glossary.clicked.connect(self.select_glossary_file)
+        layout_glossary.addWidget(self.check_glossary)
+        layout_glossary.addWidget(self.glossary_edit)
+        layout_glossary.addWidget(btn_select_glossary)
+        self.btn_term_stats = QPushButton(t("tab_csv_edit.term_stats_button"))
+        self.btn_term_stats.setToolTip(t("tab_csv_edit.term_stats_tooltip"))
+        self.btn_term_stats.clicked.connect(self.extract_term_candidates)
+        layout_glossary.addWidget(self.btn_term_stats)
+        layout_validate.addLayout(layout_glossary)
+
         # Validation button
         self.btn_validate = QPushButton(t("tab_csv_edit.validate_button"))
         self.btn_validate.clicked.connect(self.validate_csv)
         layout_validate.addWidget(self.btn_validate)
 
         # Validation results (summary)
-        self.validate_summary = QTextEdit()
-        self.validate_summary.setReadOnly(True)
+        self.validate_summary = LogWidget("csv_edit")
         self.validate_summary.setMaximumHeight(100)
         layout_validate.addWidget(QLabel(t("tab_csv_edit.summary")))
         layout_validate.addWidget(self.validate_summary)
 
-        # Validation results (detail)
-        self.validate_detail = QTextEdit()
-        self.validate_detail.setReadOnly(True)
+        # Validation results (detail, virtualized table)
+        layout_filter = QHBoxLayout()
+        self.combo_filter_file = QComboBox()
+        self.combo_filter_file.setMinimumWidth(200)
+        self.combo_filter_file.addItem(t("tab_csv_edit.filter_all"), None)
+        self.combo_filter_file.currentIndexChanged.connect(self.on_result_filter_changed)
+        self.combo_filter_issue = QComboBox()
+        self.combo_filter_issue.addItem(t("tab_csv_edit.filter_all"), None)
+        for issue_type in self.validator.ISSUE_TYPES:
+            self.combo_filter_issue.addItem(issue_type, issue_type)
+        self.combo_filter_issue.currentIndexChanged.connect(self.on_result_filter_changed)
+        self.result_count_label = QLabel()
+        layout_filter.addWidget(QLabel(t("tab_csv_edit.detail")))
+        layout_filter.addStretch()
+        layout_filter.addWidget(QLabel(t("tab_csv_edit.filter_file")))
+        layout_filter.addWidget(self.combo_filter_file)
+        layout_filter.addWidget(QLabel(t("tab_csv_edit.filter_issue")))
+        layout_filter.addWidget(self.combo_filter_issue)
+        layout_filter.addWidget(self.result_count_label)
+        layout_validate.addLayout(layout_filter)
+
+        self.result_model = ValidationResultModel(self)
+        self.validate_detail = ValidationResultView(self.result_model)
+        self.validate_detail.setMinimumHeight(200)
         self.validate_detail.setMaximumHeight(300)
-        layout_validate.addWidget(QLabel(t("tab_csv_edit.detail")))
         layout_validate.addWidget(self.validate_detail)
 
         # Save result button
@@ -145,9 +325,12 @@ class TabCSVEdit(QWidget):
         self.replace_folder_edit.setPlaceholderText(t("tab_csv_edit.replace_folder"))
         btn_select_replace_folder = QPushButton(t("common.select_folder"))
         btn_select_replace_folder.clicked.connect(self.select_replace_folder)
+        btn_select_replace_db = QPushButton(t("tab_csv_edit.select_db"))
+        btn_select_replace_db.clicked.connect(self.select_replace_db)
         layout_replace_folder.addWidget(QLabel(t("tab_csv_edit.csv_folder")))
         layout_replace_folder.addWidget(self.replace_folder_edit)
         layout_replace_folder.addWidget(btn_select_replace_folder)
+        layout_replace_folder.addWidget(btn_select_replace_db)
         layout_replace.addLayout(layout_replace_folder)
 
         # Find text
@@ -177,8 +360,7 @@ class TabCSVEdit(QWidget):
         layout_replace.addWidget(self.btn_replace)
 
         # Replace log
-        self.replace_log = QTextEdit()
-        self.replace_log.setReadOnly(True)
+        self.replace_log = LogWidget("replace")
         self.replace_log.setMaximumHeight(100)
         layout_replace.addWidget(QLabel(t("tab_csv_edit.replace_log")))
         layout_replace.addWidget(self.replace_log)
@@ -186,6 +368,41 @@ class TabCSVEdit(QWidget):
         group_replace.setLayout(layout_replace)
         layout.addWidget(group_replace)
 
+        # Translation memory suggestions
+        group_suggest = QGroupBox(t("tab_csv_edit.suggestion"))
+        layout_suggest = QVBoxLayout()
+        info_label_3 = QLabel(t("tab_csv_edit.suggestion_info"))
+        info_label_3.setStyleSheet("color: #666; font-size: 10px;")
+        info_label_3.setWordWrap(True)
+        layout_suggest.addWidget(info_label_3)
+
+        layout_suggest_folder = QHBoxLayout()
+        self.suggest_folder_edit = QLineEdit()
+        self.suggest_folder_edit.setReadOnly(True)
+        self.suggest_folder_edit.setPlaceholderText(t("tab_csv_edit.select_folder"))
+        btn_select_suggest_folder = QPushButton(t("common.select_folder"))
+        btn_select_suggest_folder.clicked.connect(self.select_suggest_folder)
+        self.spin_min_score = QDoubleSpinBox()
+        self.spin_min_score.setRange(0.1, 1.0)
+        self.spin_min_score.setSingleStep(0.05)
+        self.spin_min_score.setValue(0.6)
+        self.btn_suggest = QPushButton(t("tab_csv_edit.suggest_button"))
+        self.btn_suggest.clicked.connect(self.fill_suggestions)
+        layout_suggest_folder.addWidget(QLabel(t("tab_csv_edit.csv_folder")))
+        layout_suggest_folder.addWidget(self.suggest_folder_edit)
+        layout_suggest_folder.addWidget(btn_select_suggest_folder)
+        layout_suggest_folder.addWidget(QLabel(t("tab_csv_edit.min_score")))
+        layout_suggest_folder.addWidget(self.spin_min_score)
+        layout_suggest_folder.addWidget(self.btn_suggest)
+        layout_suggest.addLayout(layout_suggest_folder)
+
+        self.suggest_log = LogWidget("suggest")
+        self.suggest_log.setMaximumHeight(80)
+        layout_suggest.addWidget(self.suggest_log)
+
+        group_suggest.setLayout(layout_suggest)
+        layout.addWidget(group_suggest)
+
         self.setLayout(layout)
 
     def select_csv_folder(self):
@@ -195,6 +412,71 @@ class TabCSVEdit(QWidget):
             self.csv_folder_edit.setText(folder_path)
             self.add_validate_log(t("tab_csv_edit.folder_selected", path=folder_path))
 
+    def select_glossary_file(self):
+        """Select glossary CSV (Source, Target columns)"""
+        file_path, _ = QFileDialog.getOpenFileName(
+            self, t("tab_csv_edit.dialog_select_glossary"), "", "CSV Files (*.csv)"
+        )
+        if file_path:
+            self.glossary_edit.setText(file_path)
+            self.check_glossary.setChecked(True)
+            get_config_manager().set_last_used_path('glossary', file_path)
+
+    def extract_term_candidates(self):
+        """Extract glossary term candidates from the validation folder"""
+        csv_folder = self.csv_folder_edit.text()
+
+        if not csv_folder or not Path(csv_folder).is_dir():
+            QMessageBox.warning(self, t("common.warning"), t("tab_csv_edit.error_no_folder"))
+            return
+
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, t("tab_csv_edit.dialog_save_terms"), "glossary_candidates.csv", "CSV Files (*.csv)"
+        )
+        if not file_path:
+            return
+
+        # Change UI state
+        self.btn_term_stats.setEnabled(False)
+
+        # Create and start worker thread
+        self.term_stats_worker = TermStatsWorker(csv_folder, file_path)
+        self.term_stats_worker.log_signal.connect(self.add_validate_log)
+        self.term_stats_worker.finished_signal.connect(self.on_term_stats_finished)
+        self.term_stats_worker.start()
+
+    def on_term_stats_finished(self, success, count):
+        """Called when term candidate extraction is finished"""
+        self.btn_term_stats.setEnabled(True)
+
+        if success:
+            QMessageBox.information(self, t("common.completed"), t("tab_csv_edit.term_stats_complete", count=count))
+        else:
+            QMessageBox.critical(self, t("common.error"), t("tab_csv_edit.term_stats_error"))
+
+        self.term_stats_worker = None
+
+    def select_csv_db(self):
+        """Select project DB for validation"""
+        file_path = self.get_project_db_path()
+        if file_path:
+            self.csv_folder_edit.setText(file_path)
+            self.add_validate_log(t("tab_csv_edit.folder_selected", path=file_path))
+
+    def select_replace_db(self):
+        """Select project DB for replace"""
+        file_path = self.get_project_db_path()
+        if file_path:
+            self.replace_folder_edit.setText(file_path)
+            self.add_replace_log(t("tab_csv_edit.folder_selected", path=file_path))
+
+    def get_project_db_path(self):
+        """Ask for a project DB file"""
+        file_path, _ = QFileDialog.getOpenFileName(
+            self, t("tab_csv_edit.dialog_select_db"), "", "Project DB (*.db *.sqlite *.fftproj)"
+        )
+        return file_path
+
     def select_replace_folder(self):
         """Select CSV folder for replace"""
         folder_path = QFileDialog.getExistingDirectory(self, t("tab_csv_edit.dialog_select_folder"))
@@ -214,41 +496,91 @@ class TabCSVEdit(QWidget):
             QMessageBox.warning(self, t("common.warning"), t("tab_csv_edit.error_folder_not_found", path=csv_folder))
             return
 
+        glossary_file = None
+        if self.check_glossary.isChecked():
+            glossary_file = self.glossary_edit.text()
+            if not glossary_file or not Path(glossary_file).exists():
+                QMessageBox.warning(self, t("common.warning"), t("tab_csv_edit.error_no_glossary"))
+                return
+
         # Change UI state
         self.btn_validate.setEnabled(False)
         self.validate_summary.clear()
-        self.validate_detail.clear()
-
-        # Create and start worker thread
-        self.validation_worker = ValidationWorker(csv_folder)
+        self.result_model.clear()
+        self.validation_results = self.result_model.results
+        self.combo_filter_file.blockSignals(True)
+        self.combo_filter_file.clear()
+        self.combo_filter_file.addItem(t("tab_csv_edit.filter_all"), None)
+        self.combo_filter_file.blockSignals(False)
+        self._result_files = set()
+        self.update_result_count()
+
+        # Create and start worker thread (0 means unlimited)
+        self.validation_worker = ValidationWorker(
+            csv_folder,
+            check_bytes=self.check_byte_length.isChecked(),
+            max_ratio=self.spin_byte_ratio.value() or None,
+            max_bytes=self.spin_byte_max.value() or None,
+            check_consistency=self.check_consistency.isChecked(),
+            glossary_file=glossary_file
+        )
 
         # Connect signals
         self.validation_worker.log_signal.connect(self.add_validate_log)
+        self.validation_worker.results_signal.connect(self.on_validation_results)
         self.validation_worker.finished_signal.connect(self.on_validation_finished)
 
         # Start thread
         self.validation_worker.start()
 
-    def on_validation_finished(self, success, results):
+    def on_validation_results(self, results):
+        """Called with each batch of results streamed from the worker"""
+        self.result_model.append_results(results)
+
+        for result in results:
+            if result['file'] not in self._result_files:
+                self._result_files.add(result['file'])
+                self.combo_filter_file.addItem(result['file'], result['file'])
+
+        self.update_result_count()
+
+    def on_result_filter_changed(self):
+        """Apply file / issue type filter to the result table"""
+        self.result_model.set_filter(
+            file_name=self.combo_filter_file.currentData(),
+            issue_type=self.combo_filter_issue.currentData()
+        )
+        self.update_result_count()
+
+    def update_result_count(self):
+        """Show the number of filtered / total results"""
+        self.result_count_label.setText(t(
+            "tab_csv_edit.result_count",
+            shown=self.result_model.visible_count(),
+            total=len(self.result_model.results)
+        ))
+
+    def on_validation_finished(self, success, byte_totals):
         """Called when validation is finished"""
         self.btn_validate.setEnabled(True)
-        self.validation_results = results
+        results = self.result_model.results
+        self.update_result_count()
 
         if success:
-            from core.validator import CSVValidator
-            validator = CSVValidator()
-
             # Show summary
-            summary = validator.get_validation_summary(results)
+            summary = self.validator.get_validation_summary(results)
+            if byte_totals:
+                summary += "\n" + self.validator.get_byte_length_summary(byte_totals)
             self.validate_summary.setPlainText(summary)
 
-            # Show detailed results
             if len(results) > 0:
-                detail = validator.get_detailed_validation_text(results)
-                self.validate_detail.setPlainText(detail)
+                # Re-apply the active sort to the streamed rows
+                self.result_model.sort(
+                    self.validate_detail.horizontalHeader().sortIndicatorSection(),
+                    self.validate_detail.horizontalHeader().sortIndicatorOrder()
+                )
                 QMessageBox.warning(self, t("tab_csv_edit.validation_complete"), t("tab_csv_edit.issues_found", count=len(results)))
             else:
-                self.validate_detail.setPlainText(t("tab_csv_edit.no_issues_detail"))
                 QMessageBox.information(self, t("tab_csv_edit.validation_complete"), t("tab_csv_edit.no_issues"))
         else:
             QMessageBox.critical(self, t("common.error"), t("tab_csv_edit.validation_error"))
@@ -256,18 +588,19 @@ class TabCSVEdit(QWidget):
         self.validation_worker = None
 
     def save_validation_result(self):
-        """Save validation result"""
+        """Save validation result (TXT, JSON or CSV by extension)"""
         if not self.validation_results:
             QMessageBox.warning(self, t("common.warning"), t("tab_csv_edit.save_error"))
             return
 
         file_path, _ = QFileDialog.getSaveFileName(
-            self, t("tab_csv_edit.dialog_save_result"), "", "Text Files (*.txt)"
+            self, t("tab_csv_edit.dialog_save_result"), "",
+            "Text Files (*.txt);;JSON Files (*.json);;CSV Files (*.csv)"
         )
         if file_path:
             try:
-                validator = CSVValidator()
-                validator.save_validation_result(self.validation_results, file_path)
+                if not self.validator.export_validation_result(self.validation_results, file_path):
+                    raise IOError(file_path)
                 QMessageBox.information(self, t("common.completed"), t("tab_csv_edit.save_complete", path=file_path))
                 self.add_validate_log(t("tab_csv_edit.log_result_saved", path=file_path))
             except Exception as e:
@@ -332,10 +665,54 @@ class TabCSVEdit(QWidget):
 
         self.replace_worker = None
 
+    def select_suggest_folder(self):
+        """Select CSV folder for suggestions"""
+        folder_path = QFileDialog.getExistingDirectory(self, t("tab_csv_edit.dialog_select_folder"))
+        if folder_path:
+            self.suggest_folder_edit.setText(folder_path)
+            self.add_suggest_log(t("tab_csv_edit.folder_selected", path=folder_path))
+
+    def fill_suggestions(self):
+        """Fill translation memory suggestions for untranslated rows"""
+        csv_folder = self.suggest_folder_edit.text()
+
+        if not csv_folder:
+            QMessageBox.warning(self, t("common.warning"), t("tab_csv_edit.error_no_folder"))
+            return
+
+        if not Path(csv_folder).exists():
+            QMessageBox.warning(self, t("common.warning"), t("tab_csv_edit.error_folder_not_found", path=csv_folder))
+            return
+
+        # Change UI state
+        self.btn_suggest.setEnabled(False)
+        self.suggest_log.clear()
+
+        # Create and start worker thread
+        self.suggestion_worker = SuggestionWorker(csv_folder, self.spin_min_score.value())
+        self.suggestion_worker.log_signal.connect(self.add_suggest_log)
+        self.suggestion_worker.finished_signal.connect(self.on_suggestion_finished)
+        self.suggestion_worker.start()
+
+    def on_suggestion_finished(self, success, count):
+        """Called when suggestion fill is finished"""
+        self.btn_suggest.setEnabled(True)
+
+        if success:
+            QMessageBox.information(self, t("common.completed"), t("tab_csv_edit.suggest_complete", count=count))
+        else:
+            QMessageBox.critical(self, t("common.error"), t("tab_csv_edit.suggest_error"))
+
+        self.suggestion_worker = None
+
     def add_validate_log(self, message):
         """Add validation log"""
-        self.validate_summary.append(message)
+        self.validate_summary.append_message(message)
 
     def add_replace_log(self, message):
         """Add replace log"""
-        self.replace_log.append(message)
+        self.replace_log.append_message(message)
+
+    def add_suggest_log(self, message):
+        """Add suggestion log"""
+        self.suggest_log.append_message(message)
@@ -0,0 +1,236 @@
+"""
+탭 6: 전문 검색
+"""
+import time
+from pathlib import Path
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
+                              QPushButton, QLineEdit, QTableView, QHeaderView,
+                              QAbstractItemView, QFileDialog, QGroupBox,
+                              QMessageBox, QCheckBox)
+from PyQt6.QtCore import Qt, QThread, QAbstractTableModel, QModelIndex, pyqtSignal
+from core.search_index import SearchIndex
+from utils.i18n import t
+
+
+class IndexWorker(QThread):
+    """검색 인덱스 로드 및 갱신을 수행하는 워커 스레드"""
+
+    finished_signal = pyqtSignal(bool, str)
+
+    def __init__(self, index):
+        super().__init__()
+        self.index = index
+
+    def run(self):
+        """작업 실행"""
+        try:
+            self.index.load()
+            updated, removed = self.index.update()
+            self.finished_signal.emit(True, t("tab_search.index_ready",
+                                              rows=self.index.row_count(),
+                                              updated=updated, removed=removed))
+        except Exception as e:
+            self.finished_signal.emit(False, t("tab_search.index_failed", error=str(e)))
+
+
+class SearchResultModel(QAbstractTableModel):
+    """검색 결과 테이블 모델"""
+
+    # (결과 키, 헤더 번역 키)
+    COLUMNS = [
+        ('file', 'tab_search.col_csv'),
+        ('row', 'tab_search.col_row'),
+        ('file_name', 'tab_search.col_file'),
+        ('entry_id', 'tab_search.col_entry'),
+        ('column', 'tab_search.col_column'),
+        ('text', 'tab_search.col_text'),
+    ]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.results = []
+        self._headers = [t(key) for _, key in self.COLUMNS]
+
+    def set_results(self, results):
+        """결과 교체"""
+        self.beginResetModel()
+        self.results = results
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        """행 수"""
+        if parent.isValid():
+            return 0
+        return len(self.results)
+
+    def columnCount(self, parent=QModelIndex()):
+        """열 수"""
+        if parent.isValid():
+            return 0
+        return len(self.COLUMNS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        """셀 데이터"""
+        if not index.isValid():
+            return None
+
+        value = str(self.results[index.row()][self.COLUMNS[index.column()][0]])
+        if role == Qt.ItemDataRole.DisplayRole:
+            return value.replace('\n', ' ')
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return value
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        """헤더 데이터"""
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self._headers[section]
+        return str(section + 1)
+
+
+class TabSearch(QWidget):
+    """원문/번역 전문 검색 탭"""
+
+    # 한 번에 표시할 최대 결과 수
+    RESULT_LIMIT = 5000
+
+    def __init__(self):
+        super().__init__()
+        self.index = None
+        self.worker = None
+        self.init_ui()
+
+    def init_ui(self):
+        """UI 초기화"""
+        layout = QVBoxLayout()
+
+        # CSV 폴더 선택
+        group_folder = QGroupBox(t("tab_search.group_folder"))
+        layout_folder = QHBoxLayout()
+        self.csv_folder_edit = QLineEdit()
+        self.csv_folder_edit.setReadOnly(True)
+        self.csv_folder_edit.setPlaceholderText(t("tab_search.select_folder"))
+        btn_select_folder = QPushButton(t("common.select_folder"))
+        btn_select_folder.clicked.connect(self.select_csv_folder)
+        self.btn_refresh = QPushButton(t("tab_search.refresh_index"))
+        self.btn_refresh.clicked.connect(self.refresh_index)
+        layout_folder.addWidget(QLabel(t("tab_search.csv_folder")))
+        layout_folder.addWidget(self.csv_folder_edit)
+        layout_folder.addWidget(btn_select_folder)
+        layout_folder.addWidget(self.btn_refresh)
+        group_folder.setLayout(layout_folder)
+        layout.addWidget(group_folder)
+
+        # 검색어
+        layout_query = QHBoxLayout()
+        self.query_edit = QLineEdit()
+        self.query_edit.setPlaceholderText(t("tab_search.query_placeholder"))
+        self.query_edit.returnPressed.connect(self.run_search)
+        self.check_original = QCheckBox(t("tab_search.in_original"))
+        self.check_original.setChecked(True)
+        self.check_translation = QCheckBox(t("tab_search.in_translation"))
+        self.check_translation.setChecked(True)
+        self.btn_search = QPushButton(t("tab_search.search_button"))
+        self.btn_search.clicked.connect(self.run_search)
+        layout_query.addWidget(QLabel(t("tab_search.query")))
+        layout_query.addWidget(self.query_edit)
+        layout_query.addWidget(self.check_original)
+        layout_query.addWidget(self.check_translation)
+        layout_query.addWidget(self.btn_search)
+        layout.addLayout(layout_query)
+
+        # 결과
+        self.model = SearchResultModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table.setWordWrap(False)
+        vertical_header = self.table.verticalHeader()
+        vertical_header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        vertical_header.setDefaultSectionSize(22)
+        self.table.horizontalHeader().setStretchLastSection(True)
+        self.table.setColumnWidth(0, 120)
+        self.table.setColumnWidth(1, 60)
+        self.table.setColumnWidth(2, 140)
+        self.table.setColumnWidth(3, 90)
+        self.table.setColumnWidth(4, 100)
+        layout.addWidget(self.table)
+
+        self.status_label = QLabel()
+        layout.addWidget(self.status_label)
+
+        self.setLayout(layout)
+
+    def select_csv_folder(self):
+        """CSV 폴더 선택 후 인덱스 준비"""
+        folder_path = QFileDialog.getExistingDirectory(self, t("tab_search.select_folder"))
+        if folder_path:
+            self.csv_folder_edit.setText(folder_path)
+            self.refresh_index()
+
+    def refresh_index(self):
+        """검색 인덱스 로드/갱신 (변경된 CSV만 다시 색인)"""
+        csv_folder = self.csv_folder_edit.text()
+
+        if not csv_folder:
+            QMessageBox.warning(self, t("common.warning"), t("tab_search.error_no_folder"))
+            return
+
+        if not Path(csv_folder).exists():
+            QMessageBox.warning(self, t("common.warning"), t("tab_search.error_folder_not_found", path=csv_folder))
+            return
+
+        if self.worker is not None:
+            return
+
+        # UI 상태 변경
+        self.btn_refresh.setEnabled(False)
+        self.btn_search.setEnabled(False)
+        self.status_label.setText(t("tab_search.indexing"))
+
+        # 같은 폴더면 메모리의 인덱스를 이어서 갱신
+        if self.index is None or self.index.csv_folder != Path(csv_folder):
+            self.index = SearchIndex(csv_folder)
+
+        self.worker = IndexWorker(self.index)
+        self.worker.finished_signal.connect(self.on_index_finished)
+        self.worker.start()
+
+    def on_index_finished(self, success, message):
+        """인덱스 준비 완료 시 호출"""
+        self.btn_refresh.setEnabled(True)
+        self.btn_search.setEnabled(True)
+        self.status_label.setText(message)
+
+        if not success:
+            QMessageBox.critical(self, t("common.error"), message)
+            self.index = None
+
+        self.worker = None
+
+    def run_search(self):
+        """검색 실행"""
+        query = self.query_edit.text()
+        if not query:
+            return
+
+        if self.index is None:
+            QMessageBox.warning(self, t("common.warning"), t("tab_search.error_no_index"))
+            return
+
+        columns = []
+        if self.check_original.isChecked():
+            columns.append('OriginalText')
+        if self.check_translation.isChecked():
+            columns.append('Translation')
+
+        start = time.perf_counter()
+        results = self.index.search(query, limit=self.RESULT_LIMIT, columns=columns)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        self.model.set_results(results)
+        self.status_label.setText(t("tab_search.result_status", count=len(results),
+                                    ms=f"{elapsed_ms:.1f}"))
@@ -3,11 +3,14 @@
 """
 from pathlib import Path
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-                              QPushButton, QLineEdit, QTextEdit, QProgressBar,
+                              QPushButton, QLineEdit, QProgressBar,
                               QFileDialog, QGroupBox, QRadioButton, QButtonGroup,
-                              QMessageBox)
+                              QMessageBox, QCheckBox)
 from PyQt6.QtCore import QThread, pyqtSignal
-from core.csv_handler import CSVHandler
+from core.cancellation import CancellationToken, OperationCancelled
+from core.project_db import ProjectDatabase
+from gui.job_manager import Job, get_job_manager
+from gui.log_widget import LogWidget
 from utils.i18n import t
 
 
@@ -19,41 +22,107 @@ class CSVConversionWorker(QThread):
     progress_signal = pyqtSignal(int)
     finished_signal = pyqtSignal(bool, str, int)
 
-    def __init__(self, input_folder, output_folder, recursive):
+    def __init__(self, input_folder, output_folder, recursive, deduplicate=False, regenerate=False,
+                 reference_folders=None):
         super().__init__()
         self.input_folder = input_folder
         self.output_folder = output_folder
         self.recursive = recursive
+        self.deduplicate = deduplicate
+        self.regenerate = regenerate
+        self.reference_folders = reference_folders or []
+        self.cancel_token = CancellationToken()
+
+    def cancel(self):
+        """작업 취소 요청 (실행 중인 외부 도구 프로세스 종료)"""
+        self.cancel_token.cancel()
 
     def run(self):
         """작업 실행"""
         try:
+            from core.csv_handler import CSVHandler
             csv_handler = CSVHandler()
 
             self.log_signal.emit(t("tab_to_csv.log_start"))
             self.progress_signal.emit(10)
 
-            # CSV 생성
-            csv_count = csv_handler.generate_csvs(
-                self.input_folder,
-                self.output_folder,
-                self.recursive
-            )
+            if self.regenerate:
+                # 기존 CSV 갱신 (번역 유지, 바뀐 소스만 파싱)
+                stats = csv_handler.regenerate_csvs(
+                    self.input_folder,
+                    self.output_folder,
+                    self.recursive,
+                    self.deduplicate,
+                    self.reference_folders,
+                    self.cancel_token
+                )
+                self.log_signal.emit(t("tab_to_csv.log_regenerate_stats", **stats))
+                csv_count = stats['csv_count']
+            else:
+                # CSV 생성
+                csv_count = csv_handler.generate_csvs(
+                    self.input_folder,
+                    self.output_folder,
+                    self.recursive,
+                    self.deduplicate,
+                    self.reference_folders,
+                    self.cancel_token
+                )
 
             self.progress_signal.emit(100)
             self.finished_signal.emit(True, t("tab_to_csv.log_complete"), csv_count)
 
+        except OperationCancelled:
+            self.finished_signal.emit(False, t("common.cancelled"), 0)
+
         except Exception as e:
             self.log_signal.emit(t("tab_to_csv.log_error", error=str(e)))
             self.finished_signal.emit(False, t("tab_to_csv.error_occurred", error=str(e)), 0)
 
 
+class ProjectDBWorker(QThread):
+    """프로젝트 DB 가져오기/내보내기 작업을 수행하는 워커 스레드"""
+
+    log_signal = pyqtSignal(str)
+    finished_signal = pyqtSignal(bool, str)
+
+    def __init__(self, mode, csv_folder, db_path):
+        """
+        Args:
+            mode: 'import' (CSV → DB) 또는 'export' (DB → CSV)
+            csv_folder: CSV 폴더 경로
+            db_path: 프로젝트 DB 파일 경로
+        """
+        super().__init__()
+        self.mode = mode
+        self.csv_folder = csv_folder
+        self.db_path = db_path
+
+    def run(self):
+        """작업 실행"""
+        try:
+            from core.csv_handler import CSVHandler
+            csv_handler = CSVHandler()
+
+            if self.mode == 'import':
+                count = csv_handler.import_to_project(self.csv_folder, self.db_path)
+                self.finished_signal.emit(True, t("tab_to_csv.db_import_complete", count=count, path=self.db_path))
+            else:
+                count = csv_handler.export_from_project(self.db_path, self.csv_folder)
+                self.finished_signal.emit(True, t("tab_to_csv.db_export_complete", count=count, path=self.csv_folder))
+
+        except Exception as e:
+            self.log_signal.emit(t("tab_to_csv.log_error", error=str(e)))
+            self.finished_signal.emit(False, t("tab_to_csv.error_occurred", error=str(e)))
+
+
 class TabToCSV(QWidget):
     """YAML/JSON → CSV 변환 탭"""
 
     def __init__(self):
         super().__init__()
-        self.worker = None
+        self.job_manager = get_job_manager()
+        self.reference_folders = []
         self.init_ui()
 
     def init_ui(self):
@@ -88,6 +157,32 @@ class TabToCSV(QWidget):
         layout_recursive.addWidget(self.radio_recursive)
         layout_input.addLayout(layout_recursive)
 
+        # 참조 언어 폴더 (예: 0004.en → Ref_en 열)
+        layout_reference = QHBoxLayout()
+        self.reference_edit = QLineEdit()
+        self.reference_edit.setReadOnly(True)
+        self.reference_edit.setPlaceholderText(t("tab_to_csv.reference_placeholder"))
+        self.reference_edit.setToolTip(t("tab_to_csv.reference_tooltip"))
+        btn_add_reference = QPushButton(t("tab_to_csv.reference_add"))
+        btn_add_reference.clicked.connect(self.add_reference_folder)
+        btn_clear_reference = QPushButton(t("tab_to_csv.reference_clear"))
+        btn_clear_reference.clicked.connect(self.clear_reference_folders)
+        layout_reference.addWidget(QLabel(t("tab_to_csv.reference_folders")))
+        layout_reference.addWidget(self.reference_edit)
+        layout_reference.addWidget(btn_add_reference)
+        layout_reference.addWidget(btn_clear_reference)
+        layout_input.addLayout(layout_reference)
+
+        # 중복 원문 통합 옵션
+        self.check_deduplicate = QCheckBox(t("tab_to_csv.deduplicate"))
+        self.check_deduplicate.setToolTip(t("tab_to_csv.deduplicate_tooltip"))
+        layout_input.addWidget(self.check_deduplicate)
+
+        # 기존 CSV 갱신 옵션
+        self.check_regenerate = QCheckBox(t("tab_to_csv.regenerate"))
+        self.check_regenerate.setToolTip(t("tab_to_csv.regenerate_tooltip"))
+        layout_input.addWidget(self.check_regenerate)
+
         group_input.setLayout(layout_input)
         layout.addWidget(group_input)
 
@@ -110,13 +205,35 @@ class TabToCSV(QWidget):
         self.btn_start.clicked.connect(self.start_conversion)
         layout.addWidget(self.btn_start)
 
+        # 프로젝트 DB
+        group_db = QGroupBox(t("tab_to_csv.group_db"))
+        layout_db = QVBoxLayout()
+        db_info = QLabel(t("tab_to_csv.db_info"))
+        db_info.setStyleSheet("color: #666; font-size: 10px;")
+        layout_db.addWidget(db_info)
+        layout_db_buttons = QHBoxLayout()
+        self.btn_db_import = QPushButton(t("tab_to_csv.db_import"))
+        self.btn_db_import.clicked.connect(self.import_project_db)
+        self.btn_db_export = QPushButton(t("tab_to_csv.db_export"))
+        self.btn_db_export.clicked.connect(self.export_project_db)
+        layout_db_buttons.addWidget(self.btn_db_import)
+        layout_db_buttons.addWidget(self.btn_db_export)
+        layout_db.addLayout(layout_db_buttons)
+        group_db.setLayout(layout_db)
+        layout.addWidget(group_db)
+
         # 진행 상태
         self.progress_bar = QProgressBar()
         layout.addWidget(self.progress_bar)
 
+        # 취소 버튼
+        self.btn_cancel = QPushButton(t("common.cancel"))
+        self.btn_cancel.setEnabled(False)
+        self.btn_cancel.clicked.connect(self.cancel_task)
+        layout.addWidget(self.btn_cancel)
+
         # 로그 출력
-        self.log_text = QTextEdit()
-        self.log_text.setReadOnly(True)
+        self.log_text = LogWidget("to_csv")
         self.log_text.setMaximumHeight(200)
         layout.addWidget(QLabel(t("tab_to_csv.log")))
         layout.addWidget(self.log_text)
@@ -130,6 +247,21 @@ class TabToCSV(QWidget):
             self.input_folder_edit.setText(folder_path)
             self.add_log(t("tab_to_csv.folder_selected", path=folder_path))
 
+    def add_reference_folder(self):
+        """참조 언어 폴더 추가"""
+        folder_path = QFileDialog.getExistingDirectory(self, t("tab_to_csv.reference_add"))
+        if folder_path and folder_path not in self.reference_folders:
+            from core.csv_handler import CSVHandler
+            self.reference_folders.append(folder_path)
+            self.reference_edit.setText('; '.join(self.reference_folders))
+            column = CSVHandler.REFERENCE_COLUMN_PREFIX + CSVHandler.reference_language(folder_path)
+            self.add_log(t("tab_to_csv.reference_added", path=folder_path, column=column))
+
+    def clear_reference_folders(self):
+        """참조 언어 폴더 목록 비우기"""
+        self.reference_folders = []
+        self.reference_edit.clear()
+
     def select_output_folder(self):
         """출력 폴더 선택"""
         folder_path = QFileDialog.getExistingDirectory(self, t("tab_to_csv.dialog_select_output"))
@@ -155,6 +287,10 @@ class TabToCSV(QWidget):
             QMessageBox.warning(self, t("common.warning"), t("tab_to_csv.error_folder_not_found", path=input_folder))
             return
 
+        if self.check_regenerate.isChecked() and ProjectDatabase.is_project_file(output_folder):
+            QMessageBox.warning(self, t("common.warning"), t("tab_to_csv.error_regenerate_db"))
+            return
+
         # UI 상태 변경
         self.btn_start.setEnabled(False)
         self.progress_bar.setValue(0)
@@ -163,31 +299,92 @@ class TabToCSV(QWidget):
         # 재귀 옵션 확인
         recursive = self.radio_recursive.isChecked()
 
-        # 워커 스레드 생성 및 시작
-        self.worker = CSVConversionWorker(input_folder, output_folder, recursive)
+        # 워커 스레드 생성
+        worker = CSVConversionWorker(input_folder, output_folder, recursive,
+                                     self.check_deduplicate.isChecked(),
+                                     self.check_regenerate.isChecked(),
+                                     list(self.reference_folders))
 
         # 시그널 연결
-        self.worker.log_signal.connect(self.add_log)
-        self.worker.progress_signal.connect(self.progress_bar.setValue)
-        self.worker.finished_signal.connect(self.on_finished)
+        worker.log_signal.connect(self.add_log)
+        worker.progress_signal.connect(self.progress_bar.setValue)
+        worker.finished_signal.connect(self.on_finished)
 
-        # 스레드 시작
-        self.worker.start()
+        # 작업 대기열에 등록
+        job = self.job_manager.submit(t("jobs.title_to_csv", name=Path(input_folder).name), worker, owner=self)
+        if job.status == Job.QUEUED:
+            self.add_log(t("jobs.queued_log", title=job.title))
+        self.btn_cancel.setEnabled(True)
 
     def on_finished(self, success, message, csv_count):
         """작업 완료 시 호출"""
+        worker = self.sender()
         self.add_log(message)
         if csv_count > 0:
             self.add_log(t("tab_to_csv.log_files_generated", count=csv_count))
         self.btn_start.setEnabled(True)
+        self.btn_cancel.setEnabled(False)
 
         if success:
             QMessageBox.information(self, t("common.completed"), t("tab_to_csv.complete_message", message=message, count=csv_count))
-        else:
+        elif not worker.cancel_token.is_cancelled():
             QMessageBox.critical(self, t("common.error"), message)
 
-        self.worker = None
+    def cancel_task(self):
+        """이 탭에서 시작한 작업 취소"""
+        if self.job_manager.cancel_jobs(self):
+            self.btn_cancel.setEnabled(False)
+            self.add_log(t("common.cancelling"))
+
+    def import_project_db(self):
+        """CSV 폴더를 프로젝트 DB로 가져오기"""
+        csv_folder = QFileDialog.getExistingDirectory(self, t("tab_to_csv.dialog_select_csv"))
+        if not csv_folder:
+            return
+
+        db_path, _ = QFileDialog.getSaveFileName(
+            self, t("tab_to_csv.dialog_save_db"), "", "Project DB (*.db)"
+        )
+        if db_path:
+            self.start_db_worker('import', csv_folder, db_path)
+
+    def export_project_db(self):
+        """프로젝트 DB를 CSV 폴더로 내보내기"""
+        db_path, _ = QFileDialog.getOpenFileName(
+            self, t("tab_to_csv.dialog_open_db"), "", "Project DB (*.db *.sqlite *.fftproj)"
+        )
+        if not db_path:
+            return
+
+        csv_folder = QFileDialog.getExistingDirectory(self, t("tab_to_csv.dialog_select_output"))
+        if csv_folder:
+            self.start_db_worker('export', csv_folder, db_path)
+
+    def start_db_worker(self, mode, csv_folder, db_path):
+        """프로젝트 DB 워커 시작"""
+        self.btn_db_import.setEnabled(False)
+        self.btn_db_export.setEnabled(False)
+        self.add_log(t("tab_to_csv.log_preparing"))
+
+        worker = ProjectDBWorker(mode, csv_folder, db_path)
+        worker.log_signal.connect(self.add_log)
+        worker.finished_signal.connect(self.on_db_finished)
+        title_key = "jobs.title_db_import" if mode == 'import' else "jobs.title_db_export"
+        job = self.job_manager.submit(t(title_key, name=Path(db_path).name), worker, owner=self)
+        if job.status == Job.QUEUED:
+            self.add_log(t("jobs.queued_log", title=job.title))
+
+    def on_db_finished(self, success, message):
+        """프로젝트 DB 작업 완료 시 호출"""
+        self.add_log(message)
+        self.btn_db_import.setEnabled(True)
+        self.btn_db_export.setEnabled(True)
+
+        if success:
+            QMessageBox.information(self, t("common.completed"), message)
+        else:
+            QMessageBox.critical(self, t("common.error"), message)
 
     def add_log(self, message):
         """로그 추가"""
-        self.log_text.append(message)
+        self.log_text.append_message(message)
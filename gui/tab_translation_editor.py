@@ -0,0 +1,321 @@
+"""
+탭 5: 번역 편집기
+"""
+from pathlib import Path
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
+                              QPushButton, QLineEdit, QTableView, QHeaderView,
+                              QAbstractItemView, QFileDialog, QGroupBox,
+                              QMessageBox, QSpinBox)
+from PyQt6.QtCore import Qt, QThread, QAbstractTableModel, QModelIndex, pyqtSignal
+from PyQt6.QtGui import QFont, QColor
+from core.csv_store import CSVStore
+from utils.i18n import t
+
+
+class StoreLoadWorker(QThread):
+    """CSV 폴더 인덱싱을 수행하는 워커 스레드"""
+
+    finished_signal = pyqtSignal(bool, str)
+
+    def __init__(self, store, csv_folder):
+        super().__init__()
+        self.store = store
+        self.csv_folder = csv_folder
+
+    def run(self):
+        """작업 실행"""
+        try:
+            self.store.open_folder(self.csv_folder)
+            self.store.build_key_index()
+            self.finished_signal.emit(True, "")
+        except Exception as e:
+            self.finished_signal.emit(False, str(e))
+
+
+class TranslationTableModel(QAbstractTableModel):
+    """CSVStore를 보여주는 테이블 모델 (화면에 보이는 행만 파싱)"""
+
+    # (행 데이터 키, 헤더 번역 키)
+    COLUMNS = [
+        ('_csv', 'tab_editor.col_csv'),
+        ('FileName', 'tab_editor.col_file'),
+        ('EntryID', 'tab_editor.col_entry'),
+        ('OriginalText', 'tab_editor.col_original'),
+        ('Translation', 'tab_editor.col_translation'),
+    ]
+    TRANSLATION_COLUMN = 4
+
+    def __init__(self, store, parent=None):
+        super().__init__(parent)
+        self.store = store
+        self._headers = [t(key) for _, key in self.COLUMNS]
+        self._bold = QFont()
+        self._bold.setBold(True)
+        self._dirty_color = QColor('#fff4c2')
+
+    def reload(self):
+        """저장소 내용이 바뀐 후 전체 갱신"""
+        self.beginResetModel()
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        """행 수"""
+        if parent.isValid():
+            return 0
+        return self.store.row_count()
+
+    def columnCount(self, parent=QModelIndex()):
+        """열 수"""
+        if parent.isValid():
+            return 0
+        return len(self.COLUMNS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        """셀 데이터"""
+        if not index.isValid():
+            return None
+
+        row = index.row()
+        key = self.COLUMNS[index.column()][0]
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            # 여러 줄 텍스트는 한 줄로 표시 (행 높이 고정)
+            return self.store.get_row(row)[key].replace('\n', ' ')
+        if role in (Qt.ItemDataRole.EditRole, Qt.ItemDataRole.ToolTipRole):
+            return self.store.get_row(row)[key]
+        if role == Qt.ItemDataRole.BackgroundRole and self.store.is_dirty(row):
+            return self._dirty_color
+        if role == Qt.ItemDataRole.FontRole and self.store.is_dirty(row):
+            return self._bold
+
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        """번역 열 편집"""
+        if role != Qt.ItemDataRole.EditRole or index.column() != self.TRANSLATION_COLUMN:
+            return False
+        if value == self.store.get_row(index.row())['Translation']:
+            return False
+
+        self.store.set_translation(index.row(), value)
+        self.dataChanged.emit(self.index(index.row(), 0),
+                              self.index(index.row(), len(self.COLUMNS) - 1))
+        return True
+
+    def flags(self, index):
+        """번역 열만 편집 가능"""
+        flags = super().flags(index)
+        if index.column() == self.TRANSLATION_COLUMN:
+            flags |= Qt.ItemFlag.ItemIsEditable
+        return flags
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        """헤더 데이터"""
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self._headers[section]
+        return str(section + 1)
+
+
+class TabTranslationEditor(QWidget):
+    """CSV 번역 편집 탭"""
+
+    def __init__(self):
+        super().__init__()
+        self.store = CSVStore()
+        self.worker = None
+        self.init_ui()
+
+    def init_ui(self):
+        """UI 초기화"""
+        layout = QVBoxLayout()
+
+        # CSV 폴더 선택
+        group_folder = QGroupBox(t("tab_editor.group_folder"))
+        layout_folder = QHBoxLayout()
+        self.csv_folder_edit = QLineEdit()
+        self.csv_folder_edit.setReadOnly(True)
+        self.csv_folder_edit.setPlaceholderText(t("tab_editor.select_folder"))
+        btn_select_folder = QPushButton(t("common.select_folder"))
+        btn_select_folder.clicked.connect(self.select_csv_folder)
+        self.btn_open = QPushButton(t("tab_editor.open_button"))
+        self.btn_open.clicked.connect(self.open_folder)
+        layout_folder.addWidget(QLabel(t("tab_editor.csv_folder")))
+        layout_folder.addWidget(self.csv_folder_edit)
+        layout_folder.addWidget(btn_select_folder)
+        layout_folder.addWidget(self.btn_open)
+        group_folder.setLayout(layout_folder)
+        layout.addWidget(group_folder)
+
+        # 검색 / 행 이동
+        layout_search = QHBoxLayout()
+        self.search_edit = QLineEdit()
+        self.search_edit.setPlaceholderText(t("tab_editor.search_placeholder"))
+        self.search_edit.returnPressed.connect(self.find_next)
+        btn_find_next = QPushButton(t("tab_editor.find_next"))
+        btn_find_next.clicked.connect(self.find_next)
+        self.spin_row = QSpinBox()
+        self.spin_row.setRange(1, 1)
+        btn_goto = QPushButton(t("tab_editor.goto_row"))
+        btn_goto.clicked.connect(self.goto_row)
+        self.entry_edit = QLineEdit()
+        self.entry_edit.setPlaceholderText(t("tab_editor.entry_placeholder"))
+        self.entry_edit.returnPressed.connect(self.goto_entry)
+        layout_search.addWidget(QLabel(t("tab_editor.search")))
+        layout_search.addWidget(self.search_edit)
+        layout_search.addWidget(btn_find_next)
+        layout_search.addWidget(QLabel(t("tab_editor.row")))
+        layout_search.addWidget(self.spin_row)
+        layout_search.addWidget(btn_goto)
+        layout_search.addWidget(self.entry_edit)
+        layout.addLayout(layout_search)
+
+        # 번역 테이블
+        self.model = TranslationTableModel(self.store, self)
+        self.model.dataChanged.connect(self.update_status)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.table.setWordWrap(False)
+        vertical_header = self.table.verticalHeader()
+        vertical_header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        vertical_header.setDefaultSectionSize(22)
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        header.setStretchLastSection(True)
+        self.table.setColumnWidth(0, 120)
+        self.table.setColumnWidth(1, 140)
+        self.table.setColumnWidth(2, 90)
+        self.table.setColumnWidth(3, 300)
+        layout.addWidget(self.table)
+
+        # 저장
+        layout_save = QHBoxLayout()
+        self.status_label = QLabel()
+        self.btn_save = QPushButton(t("tab_editor.save_button"))
+        self.btn_save.clicked.connect(self.save_changes)
+        layout_save.addWidget(self.status_label)
+        layout_save.addStretch()
+        layout_save.addWidget(self.btn_save)
+        layout.addLayout(layout_save)
+
+        self.setLayout(layout)
+        self.update_status()
+
+    def select_csv_folder(self):
+        """CSV 폴더 선택"""
+        folder_path = QFileDialog.getExistingDirectory(self, t("tab_editor.select_folder"))
+        if folder_path:
+            self.csv_folder_edit.setText(folder_path)
+            self.open_folder()
+
+    def open_folder(self):
+        """선택한 CSV 폴더 열기"""
+        csv_folder = self.csv_folder_edit.text()
+
+        if not csv_folder:
+            QMessageBox.warning(self, t("common.warning"), t("tab_editor.error_no_folder"))
+            return
+
+        if not Path(csv_folder).exists():
+            QMessageBox.warning(self, t("common.warning"), t("tab_editor.error_folder_not_found", path=csv_folder))
+            return
+
+        if self.store.dirty_count() and not self.confirm_discard():
+            return
+
+        # UI 상태 변경
+        self.btn_open.setEnabled(False)
+        self.model.beginResetModel()
+
+        # 워커 스레드 생성 및 시작
+        self.worker = StoreLoadWorker(self.store, csv_folder)
+        self.worker.finished_signal.connect(self.on_loaded)
+        self.worker.start()
+
+    def on_loaded(self, success, error):
+        """인덱싱 완료 시 호출"""
+        self.model.endResetModel()
+        self.btn_open.setEnabled(True)
+        self.spin_row.setRange(1, max(1, self.store.row_count()))
+        self.update_status()
+
+        if not success:
+            QMessageBox.critical(self, t("common.error"), t("tab_editor.load_failed", error=error))
+
+        self.worker = None
+
+    def confirm_discard(self):
+        """저장되지 않은 변경 사항 폐기 확인"""
+        reply = QMessageBox.question(
+            self,
+            t("tab_editor.dialog_confirm"),
+            t("tab_editor.discard_confirm", count=self.store.dirty_count()),
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        )
+        return reply == QMessageBox.StandardButton.Yes
+
+    def find_next(self):
+        """현재 행 다음부터 검색"""
+        text = self.search_edit.text()
+        if not text or self.worker is not None:
+            return
+
+        current = self.table.currentIndex()
+        start = current.row() + 1 if current.isValid() else 0
+        row = self.store.search(text, start)
+        if row is None and start > 0:
+            # 끝까지 찾지 못하면 처음부터 다시 검색
+            row = self.store.search(text, 0)
+
+        if row is None:
+            self.status_label.setText(t("tab_editor.not_found", text=text))
+            return
+
+        self.select_row(row)
+
+    def goto_row(self):
+        """행 번호로 이동"""
+        if self.store.row_count():
+            self.select_row(self.spin_row.value() - 1)
+
+    def goto_entry(self):
+        """EntryID로 이동"""
+        entry_id = self.entry_edit.text().strip()
+        if not entry_id or self.worker is not None:
+            return
+
+        row = self.store.find_entry(entry_id)
+        if row is None:
+            self.status_label.setText(t("tab_editor.not_found", text=entry_id))
+            return
+
+        self.select_row(row)
+
+    def select_row(self, row):
+        """행 선택 및 스크롤"""
+        index = self.model.index(row, TranslationTableModel.TRANSLATION_COLUMN)
+        self.table.setCurrentIndex(index)
+        self.table.scrollTo(index, QAbstractItemView.ScrollHint.PositionAtCenter)
+        self.update_status()
+
+    def save_changes(self):
+        """변경된 행만 저장"""
+        if not self.store.dirty_count():
+            return
+
+        saved = self.store.save()
+        self.model.reload()
+        self.update_status()
+        QMessageBox.information(self, t("common.completed"), t("tab_editor.save_complete", count=saved))
+
+    def update_status(self, *args):
+        """상태 표시 갱신"""
+        self.status_label.setText(t(
+            "tab_editor.status",
+            rows=self.store.row_count(),
+            files=len(self.store.files),
+            dirty=self.store.dirty_count()
+        ))
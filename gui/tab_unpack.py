@@ -1,9 +1,13 @@
 from pathlib import Path
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-                              QPushButton, QLineEdit, QCheckBox, QTextEdit,
-                              QProgressBar, QFileDialog, QGroupBox, QMessageBox)
+                              QPushButton, QLineEdit, QCheckBox,
+                              QFileDialog, QGroupBox, QMessageBox)
 from PyQt6.QtCore import Qt, QThread, pyqtSignal
-from core.pac_handler import PACHandler
+from core.cancellation import CancellationToken, OperationCancelled
+from core.manifest import TreeManifest
+from gui.job_manager import Job, get_job_manager
+from gui.log_widget import LogWidget
+from gui.progress_panel import ProgressPanel
 from utils.i18n import t
 
 
@@ -12,7 +16,7 @@ class UnpackWorker(QThread):
     """언팩 작업을 수행하는 워커 스레드"""
 
     log_signal = pyqtSignal(str)
-    progress_signal = pyqtSignal(int)
+    progress_signal = pyqtSignal(object)  # ProgressEvent
     finished_signal = pyqtSignal(bool, str)
 
     def __init__(self, pac_file, output_folder, convert_nxd, convert_pzd):
@@ -21,53 +25,38 @@ class UnpackWorker(QThread):
         self.output_folder = output_folder
         self.convert_nxd = convert_nxd
         self.convert_pzd = convert_pzd
+        self.cancel_token = CancellationToken()
+
+    def cancel(self):
+        """작업 취소 요청 (실행 중인 외부 도구 프로세스 종료)"""
+        self.cancel_token.cancel()
 
     def run(self):
         """작업 실행"""
         try:
+            from core.pac_handler import PACHandler
             pac_handler = PACHandler()
 
-            # 진행률 추적
-            self.current_progress = 0
-
-            # 콜백 함수로 로그 전송 및 진행률 업데이트
-            def callback(msg):
-                self.log_signal.emit(msg)
-
-                # 메시지에 따라 진행률 업데이트
-                if "언팩 중" in msg:
-                    self.progress_signal.emit(20)
-                elif "언팩 완료" in msg:
-                    self.progress_signal.emit(40)
-                elif "NXD" in msg and "변환 중" in msg:
-                    self.progress_signal.emit(60)
-                elif "NXD" in msg and "완료" in msg:
-                    self.progress_signal.emit(75)
-                elif "PZD" in msg and "변환 중" in msg:
-                    self.progress_signal.emit(80)
-                elif "PZD" in msg and "완료" in msg:
-                    self.progress_signal.emit(95)
-                elif "모든 작업 완료" in msg:
-                    self.progress_signal.emit(100)
-
-            self.progress_signal.emit(5)
-
-            # 언팩 및 변환 실행
+            # 언팩 및 변환 실행 (진행 상황은 단계별 ProgressEvent로 전달)
             success = pac_handler.unpack_and_convert(
                 self.pac_file,
                 self.output_folder,
                 convert_nxd=self.convert_nxd,
                 convert_pzd=self.convert_pzd,
                 game='fft',
-                callback=callback
+                callback=self.log_signal.emit,
+                progress=self.progress_signal.emit,
+                cancel_token=self.cancel_token
             )
 
             if success:
-                self.progress_signal.emit(100)
                 self.finished_signal.emit(True, "작업이 성공적으로 완료되었습니다!")
             else:
                 self.finished_signal.emit(False, "작업 중 오류가 발생했습니다.")
 
+        except OperationCancelled:
+            self.finished_signal.emit(False, t("common.cancelled"))
+
         except Exception as e:
             self.log_signal.emit(f"오류 발생: {str(e)}")
             self.finished_signal.emit(False, f"오류: {str(e)}")
@@ -77,18 +66,28 @@ class ConvertWorker(QThread):
     """파일 변환 작업을 수행하는 워커 스레드"""
 
     log_signal = pyqtSignal(str)
-    progress_signal = pyqtSignal(int)
+    progress_signal = pyqtSignal(object)  # ProgressEvent
     finished_signal = pyqtSignal(bool, str, int)
 
-    def __init__(self, folder_path, convert_type):
+    # 변환 종류별 원본 확장자
+    SOURCE_EXTENSIONS = {'pzd_to_yaml': '.pzd', 'nxd_to_json': '.nxd'}
+
+    def __init__(self, folder_path, convert_type, changed_only=False):
         """
         Args:
             folder_path: 변환할 파일이 있는 폴더
             convert_type: 'pzd_to_yaml', 'nxd_to_json'
+            changed_only: 지난 변환 이후 추가/변경된 파일만 변환
         """
         super().__init__()
         self.folder_path = folder_path
         self.convert_type = convert_type
+        self.changed_only = changed_only
+        self.cancel_token = CancellationToken()
+
+    def cancel(self):
+        """작업 취소 요청 (실행 중인 외부 도구 프로세스 종료)"""
+        self.cancel_token.cancel()
 
     def run(self):
         """작업 실행"""
@@ -96,32 +95,118 @@ class ConvertWorker(QThread):
             from core.converter import Converter
             converter = Converter()
 
-            self.progress_signal.emit(10)
+            files = None
+            current = None
+            if self.changed_only:
+                # 변환 종류마다 별도 매니페스트를 기준으로 비교
+                extension = self.SOURCE_EXTENSIONS[self.convert_type]
+                manifest_file = Path(self.folder_path) / f"{TreeManifest.MANIFEST_PREFIX}{extension}.json"
+                files, current = TreeManifest.changed_files(self.folder_path, (extension,), manifest_file)
+                if files is None:
+                    self.log_signal.emit(t("tab_unpack.changed_no_manifest"))
+                else:
+                    self.log_signal.emit(t("tab_unpack.changed_files_count", count=len(files)))
 
             if self.convert_type == 'pzd_to_yaml':
                 self.log_signal.emit("PZD → YAML 변환 시작...")
-                count = converter.convert_pzd_to_yaml(self.folder_path, recursive=True)
+                count = converter.convert_pzd_to_yaml(self.folder_path, recursive=True, files=files,
+                                                       progress=self.progress_signal.emit,
+                                                       cancel_token=self.cancel_token)
                 self.log_signal.emit(f"PZD → YAML 변환 완료: {count}개 파일")
 
             elif self.convert_type == 'nxd_to_json':
                 self.log_signal.emit("NXD → JSON 변환 시작...")
-                count = converter.convert_nxd_to_json(self.folder_path, recursive=True)
+                count = converter.convert_nxd_to_json(self.folder_path, recursive=True, files=files,
+                                                       progress=self.progress_signal.emit,
+                                                       cancel_token=self.cancel_token)
                 self.log_signal.emit(f"NXD → JSON 변환 완료: {count}개 파일")
 
-            self.progress_signal.emit(100)
+            # 변환이 끝난 뒤에만 기준 매니페스트 갱신
+            if current is not None:
+                current.save(manifest_file)
+
             self.finished_signal.emit(True, "변환 완료!", count)
 
+        except OperationCancelled:
+            self.finished_signal.emit(False, t("common.cancelled"), 0)
+
         except Exception as e:
             self.log_signal.emit(f"오류 발생: {str(e)}")
             self.finished_signal.emit(False, f"오류: {str(e)}", 0)
 
 
+class CompareWorker(QThread):
+    """두 언팩 폴더의 매니페스트를 만들어 비교하는 워커 스레드"""
+
+    log_signal = pyqtSignal(str)
+    finished_signal = pyqtSignal(bool, str)
+
+    # 로그에 표시할 분류별 최대 파일 수
+    LIST_LIMIT = 200
+
+    def __init__(self, old_folder, new_folder):
+        """
+        Args:
+            old_folder: 이전 버전 언팩 폴더
+            new_folder: 새 버전 언팩 폴더
+        """
+        super().__init__()
+        self.old_folder = old_folder
+        self.new_folder = new_folder
+        self.cancel_token = CancellationToken()
+
+    def cancel(self):
+        """작업 취소 요청 (폴더 스캔 사이에서 확인)"""
+        self.cancel_token.cancel()
+
+    def _build(self, folder):
+        """저장된 매니페스트를 재사용해 매니페스트 생성 후 저장"""
+        manifest = TreeManifest.build(folder, previous=TreeManifest.load(folder))
+        try:
+            manifest.save()
+        except OSError as e:
+            self.log_signal.emit(t("tab_unpack.manifest_save_failed", path=folder, error=str(e)))
+        return manifest
+
+    def run(self):
+        """작업 실행"""
+        try:
+            self.cancel_token.raise_if_cancelled()
+            self.log_signal.emit(t("tab_unpack.compare_scanning", path=self.old_folder))
+            old_manifest = self._build(self.old_folder)
+            self.cancel_token.raise_if_cancelled()
+            self.log_signal.emit(t("tab_unpack.compare_scanning", path=self.new_folder))
+            new_manifest = self._build(self.new_folder)
+
+            changes = old_manifest.diff(new_manifest)
+            for kind in ('added', 'removed', 'modified'):
+                paths = changes[kind]
+                self.log_signal.emit(t(f"tab_unpack.compare_{kind}", count=len(paths)))
+                for path in paths[:self.LIST_LIMIT]:
+                    self.log_signal.emit(f"  {path}")
+                if len(paths) > self.LIST_LIMIT:
+                    self.log_signal.emit(t("tab_unpack.compare_more", count=len(paths) - self.LIST_LIMIT))
+
+            self.finished_signal.emit(True, t("tab_unpack.compare_result",
+                                              added=len(changes['added']),
+                                              removed=len(changes['removed']),
+                                              modified=len(changes['modified'])))
+
+        except OperationCancelled:
+            self.finished_signal.emit(False, t("common.cancelled"))
+
+        except Exception as e:
+            self.log_signal.emit(f"오류 발생: {str(e)}")
+            self.finished_signal.emit(False, f"오류: {str(e)}")
+
+
 class TabUnpack(QWidget):
     """PAC 언팩 및 변환 탭"""
 
     def __init__(self):
         super().__init__()
-        self.worker = None
+        self.job_manager = get_job_manager()
+        self.progress_worker = None  # 진행 상황을 표시할 워커
         self.init_ui()
 
     def init_ui(self):
@@ -194,24 +279,38 @@ class TabUnpack(QWidget):
         group_standalone = QGroupBox("독립 변환 기능 (언팩 없이 변환만 수행)\n(출력 폴더로 지정된 곳에서 변환합니다.)")
         layout_standalone = QHBoxLayout()
 
+        self.check_changed_only = QCheckBox(t("tab_unpack.changed_only"))
+        self.check_changed_only.setToolTip(t("tab_unpack.changed_only_tooltip"))
+
         self.btn_pzd_to_yaml = QPushButton(t("tab_unpack.convert_pzd"))
         self.btn_pzd_to_yaml.clicked.connect(self.convert_pzd_to_yaml)
 
         self.btn_nxd_to_json = QPushButton(t("tab_unpack.convert_nxd"))
         self.btn_nxd_to_json.clicked.connect(self.convert_nxd_to_json)
 
+        self.btn_compare = QPushButton(t("tab_unpack.compare_versions"))
+        self.btn_compare.setToolTip(t("tab_unpack.compare_tooltip"))
+        self.btn_compare.clicked.connect(self.compare_versions)
+
+        layout_standalone.addWidget(self.check_changed_only)
         layout_standalone.addWidget(self.btn_pzd_to_yaml)
         layout_standalone.addWidget(self.btn_nxd_to_json)
+        layout_standalone.addWidget(self.btn_compare)
         group_standalone.setLayout(layout_standalone)
         layout.addWidget(group_standalone)
 
         # 진행 상태
-        self.progress_bar = QProgressBar()
-        layout.addWidget(self.progress_bar)
+        self.progress_panel = ProgressPanel()
+        layout.addWidget(self.progress_panel)
+
+        # 취소 버튼
+        self.btn_cancel = QPushButton(t("common.cancel"))
+        self.btn_cancel.setEnabled(False)
+        self.btn_cancel.clicked.connect(self.cancel_task)
+        layout.addWidget(self.btn_cancel)
 
         # 로그 출력
-        self.log_text = QTextEdit()
-        self.log_text.setReadOnly(True)
+        self.log_text = LogWidget("unpack")
         self.log_text.setMaximumHeight(200)
         layout.addWidget(QLabel(t("tab_unpack.log")))
         layout.addWidget(self.log_text)
@@ -266,11 +365,11 @@ class TabUnpack(QWidget):
 
         # UI 상태 변경
         self.btn_start.setEnabled(False)
-        self.progress_bar.setValue(0)
+        self.progress_panel.reset()
         self.add_log(t("tab_unpack.start_unpack"))
 
-        # 워커 스레드 생성 및 시작
-        self.worker = UnpackWorker(
+        # 워커 스레드 생성
+        worker = UnpackWorker(
             pac_file,
             output_folder,
             self.check_convert_nxd.isChecked(),
@@ -278,24 +377,56 @@ class TabUnpack(QWidget):
         )
 
         # 시그널 연결
-        self.worker.log_signal.connect(self.add_log)
-        self.worker.progress_signal.connect(self.progress_bar.setValue)
-        self.worker.finished_signal.connect(self.on_finished)
+        worker.log_signal.connect(self.add_log)
+        worker.progress_signal.connect(self.on_progress)
+        worker.finished_signal.connect(self.on_finished)
 
-        # 스레드 시작
-        self.worker.start()
+        # 작업 대기열에 등록
+        self.submit_job(t("jobs.title_unpack", name=Path(pac_file).name), worker)
 
     def on_finished(self, success, message):
         """작업 완료 시 호출"""
+        worker = self.on_job_finished(success)
         self.add_log(message)
         self.btn_start.setEnabled(True)
 
         if success:
             QMessageBox.information(self, t("common.completed"), message)
-        else:
+        elif not worker.cancel_token.is_cancelled():
             QMessageBox.critical(self, t("common.error"), message)
 
-        self.worker = None
+    def submit_job(self, title, worker):
+        """
+        작업 관리자에 워커 등록 (실행 슬롯이 없으면 대기열에서 기다림)
+
+        Args:
+            title: 작업 대기열에 표시할 이름
+            worker: 워커 스레드
+        """
+        self.progress_worker = worker
+        job = self.job_manager.submit(title, worker, owner=self)
+        if job.status == Job.QUEUED:
+            self.add_log(t("jobs.queued_log", title=title))
+        self.btn_cancel.setEnabled(True)
+
+    def on_progress(self, event):
+        """진행 상황 표시 (여러 작업이 실행 중이면 마지막에 시작한 작업만)"""
+        if self.sender() is self.progress_worker:
+            self.progress_panel.update_progress(event)
+
+    def on_job_finished(self, success):
+        """작업 종료 공통 처리 (완료 시그널을 보낸 워커 반환)"""
+        worker = self.sender()
+        if worker is self.progress_worker:
+            self.progress_panel.finish(success)
+        self.btn_cancel.setEnabled(self.job_manager.has_active(self))
+        return worker
+
+    def cancel_task(self):
+        """이 탭에서 시작한 작업 모두 취소"""
+        if self.job_manager.cancel_jobs(self):
+            self.btn_cancel.setEnabled(False)
+            self.add_log(t("common.cancelling"))
 
     def _auto_set_output_folder(self, pac_file_path):
         """
@@ -326,19 +457,19 @@ class TabUnpack(QWidget):
 
         # UI 상태 변경
         self.btn_pzd_to_yaml.setEnabled(False)
-        self.progress_bar.setValue(0)
+        self.progress_panel.reset()
         self.add_log("PZD → YAML 변환 준비 중...")
 
-        # 워커 스레드 생성 및 시작
-        self.worker = ConvertWorker(folder_path, 'pzd_to_yaml')
+        # 워커 스레드 생성
+        worker = ConvertWorker(folder_path, 'pzd_to_yaml', self.check_changed_only.isChecked())
 
         # 시그널 연결
-        self.worker.log_signal.connect(self.add_log)
-        self.worker.progress_signal.connect(self.progress_bar.setValue)
-        self.worker.finished_signal.connect(self.on_convert_finished)
+        worker.log_signal.connect(self.add_log)
+        worker.progress_signal.connect(self.on_progress)
+        worker.finished_signal.connect(self.on_convert_finished)
 
-        # 스레드 시작
-        self.worker.start()
+        # 작업 대기열에 등록
+        self.submit_job(t("jobs.title_pzd_to_yaml", name=Path(folder_path).name), worker)
 
     def convert_nxd_to_json(self):
         """NXD → JSON 독립 변환"""
@@ -354,36 +485,67 @@ class TabUnpack(QWidget):
 
         # UI 상태 변경
         self.btn_nxd_to_json.setEnabled(False)
-        self.progress_bar.setValue(0)
+        self.progress_panel.reset()
         self.add_log("NXD → JSON 변환 준비 중...")
 
-        # 워커 스레드 생성 및 시작
-        self.worker = ConvertWorker(folder_path, 'nxd_to_json')
+        # 워커 스레드 생성
+        worker = ConvertWorker(folder_path, 'nxd_to_json', self.check_changed_only.isChecked())
 
         # 시그널 연결
-        self.worker.log_signal.connect(self.add_log)
-        self.worker.progress_signal.connect(self.progress_bar.setValue)
-        self.worker.finished_signal.connect(self.on_convert_finished)
+        worker.log_signal.connect(self.add_log)
+        worker.progress_signal.connect(self.on_progress)
+        worker.finished_signal.connect(self.on_convert_finished)
 
-        # 스레드 시작
-        self.worker.start()
+        # 작업 대기열에 등록
+        self.submit_job(t("jobs.title_nxd_to_json", name=Path(folder_path).name), worker)
 
     def on_convert_finished(self, success, message, count):
         """변환 완료 시 호출"""
+        worker = self.on_job_finished(success)
         self.add_log(message)
         if count > 0:
             self.add_log("총 {0}개의 파일이 변환되었습니다.".format(count))
 
-        self.btn_pzd_to_yaml.setEnabled(True)
-        self.btn_nxd_to_json.setEnabled(True)
+        # 끝난 변환 종류의 버튼만 다시 활성화 (다른 변환은 아직 실행 중일 수 있음)
+        if worker.convert_type == 'pzd_to_yaml':
+            self.btn_pzd_to_yaml.setEnabled(True)
+        else:
+            self.btn_nxd_to_json.setEnabled(True)
 
         if success:
             QMessageBox.information(self, t("common.completed"), "{0}\n총 {1}개 파일 변환".format(message, count))
-        else:
+        elif not worker.cancel_token.is_cancelled():
             QMessageBox.critical(self, t("common.error"), message)
 
-        self.worker = None
+    def compare_versions(self):
+        """두 언팩 폴더 비교 (추가/삭제/변경된 파일 목록)"""
+        old_folder = QFileDialog.getExistingDirectory(self, t("tab_unpack.select_old_version"))
+        if not old_folder:
+            return
+        new_folder = QFileDialog.getExistingDirectory(self, t("tab_unpack.select_new_version"))
+        if not new_folder:
+            return
+
+        # UI 상태 변경
+        self.btn_compare.setEnabled(False)
+        self.progress_panel.set_busy(t("progress.stage_compare"))
+        self.add_log(t("tab_unpack.compare_start", old=old_folder, new=new_folder))
+
+        # 워커 스레드 생성 및 작업 대기열에 등록
+        worker = CompareWorker(old_folder, new_folder)
+        worker.log_signal.connect(self.add_log)
+        worker.finished_signal.connect(self.on_compare_finished)
+        self.submit_job(t("jobs.title_compare", old=Path(old_folder).name, new=Path(new_folder).name), worker)
+
+    def on_compare_finished(self, success, message):
+        """버전 비교 완료 시 호출"""
+        worker = self.on_job_finished(success)
+        self.add_log(message)
+        self.btn_compare.setEnabled(True)
+
+        if not success and not worker.cancel_token.is_cancelled():
+            QMessageBox.critical(self, t("common.error"), message)
 
     def add_log(self, message):
         """로그 추가"""
-        self.log_text.append(message)
+        self.log_text.append_message(message)
@@ -0,0 +1,198 @@
+"""
+검증 결과 테이블 뷰 (가상화 모델)
+"""
+from PyQt6.QtWidgets import QTableView, QHeaderView, QAbstractItemView
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from utils.i18n import t
+
+
+class ValidationResultModel(QAbstractTableModel):
+    """
+    검증 결과를 페이지 단위로 지연 표시하는 테이블 모델
+
+    결과 딕셔너리를 그대로 보관하고, 필터/정렬은 결과 인덱스 리스트만 재구성합니다.
+    뷰에는 스크롤에 따라 PAGE_SIZE 행씩만 노출됩니다 (canFetchMore/fetchMore).
+    """
+
+    PAGE_SIZE = 500
+
+    # (결과 키, 헤더 번역 키)
+    COLUMNS = [
+        ('file', 'tab_csv_edit.col_file'),
+        ('row', 'tab_csv_edit.col_row'),
+        ('issues', 'tab_csv_edit.col_issues'),
+        ('bytes', 'tab_csv_edit.col_bytes'),
+        ('text', 'tab_csv_edit.col_text'),
+    ]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.results = []
+        self._visible = []  # 필터/정렬이 적용된 결과 인덱스
+        self._loaded = 0  # 뷰에 노출된 행 수
+        self._file_filter = None
+        self._issue_filter = None
+        self._sort_column = None
+        self._sort_order = Qt.SortOrder.AscendingOrder
+        self._headers = [t(key) for _, key in self.COLUMNS]
+
+    def rowCount(self, parent=QModelIndex()):
+        """표시 중인 행 수"""
+        if parent.isValid():
+            return 0
+        return self._loaded
+
+    def columnCount(self, parent=QModelIndex()):
+        """열 수"""
+        if parent.isValid():
+            return 0
+        return len(self.COLUMNS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        """셀 데이터 (요청된 셀만 문자열로 변환)"""
+        if not index.isValid():
+            return None
+
+        result = self.results[self._visible[index.row()]]
+        key = self.COLUMNS[index.column()][0]
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if key == 'bytes':
+                if 'translated_bytes' in result:
+                    return f"{result['original_bytes']} → {result['translated_bytes']}"
+                return ""
+            if key == 'text':
+                # 여러 줄 텍스트는 한 줄로 표시 (행 높이 고정)
+                return result['text'].replace('\n', ' ')
+            return str(result[key])
+
+        if role == Qt.ItemDataRole.ToolTipRole and key == 'text':
+            return result['text']
+
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        """헤더 데이터"""
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self._headers[section]
+        return str(section + 1)
+
+    def canFetchMore(self, parent=QModelIndex()):
+        """아직 노출되지 않은 행이 있는지"""
+        if parent.isValid():
+            return False
+        return self._loaded < len(self._visible)
+
+    def fetchMore(self, parent=QModelIndex()):
+        """다음 페이지 노출"""
+        if parent.isValid():
+            return
+        self._expose(min(len(self._visible), self._loaded + self.PAGE_SIZE))
+
+    def _expose(self, target):
+        """target 행까지 뷰에 노출"""
+        if target <= self._loaded:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, target - 1)
+        self._loaded = target
+        self.endInsertRows()
+
+    def clear(self):
+        """모든 결과 제거"""
+        self.beginResetModel()
+        self.results = []
+        self._visible = []
+        self._loaded = 0
+        self.endResetModel()
+
+    def append_results(self, results):
+        """
+        결과 일괄 추가 (스트리밍)
+
+        Args:
+            results: 추가할 검증 결과 리스트
+        """
+        start = len(self.results)
+        self.results.extend(results)
+        self._visible.extend(i for i in range(start, len(self.results))
+                             if self._matches(self.results[i]))
+
+        # 첫 페이지가 다 차지 않았으면 바로 노출
+        self._expose(min(len(self._visible), max(self._loaded, self.PAGE_SIZE)))
+
+    def set_filter(self, file_name=None, issue_type=None):
+        """
+        파일/문제 유형 필터 설정
+
+        Args:
+            file_name: 표시할 파일명 (None이면 전체)
+            issue_type: 표시할 문제 유형 (None이면 전체)
+        """
+        self._file_filter = file_name
+        self._issue_filter = issue_type
+        self._rebuild()
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        """열 기준 정렬 (결과 인덱스만 정렬)"""
+        self._sort_column = column if column >= 0 else None
+        self._sort_order = order
+        self._rebuild()
+
+    def _rebuild(self):
+        """필터/정렬을 적용하여 인덱스 리스트 재구성 후 첫 페이지만 노출"""
+        self.beginResetModel()
+        self._visible = [i for i, result in enumerate(self.results) if self._matches(result)]
+
+        if self._sort_column is not None:
+            key = self.COLUMNS[self._sort_column][0]
+            results = self.results
+            if key == 'bytes':
+                sort_key = lambda i: results[i].get('translated_bytes', -1)
+            elif key == 'file':
+                sort_key = lambda i: (results[i]['file'], results[i]['row'])
+            else:
+                sort_key = lambda i: results[i][key]
+            self._visible.sort(key=sort_key,
+                               reverse=self._sort_order == Qt.SortOrder.DescendingOrder)
+
+        self._loaded = min(len(self._visible), self.PAGE_SIZE)
+        self.endResetModel()
+
+    def _matches(self, result):
+        """결과가 현재 필터에 해당하는지"""
+        if self._file_filter is not None and result['file'] != self._file_filter:
+            return False
+        if self._issue_filter is not None and self._issue_filter not in result['issues'].split(', '):
+            return False
+        return True
+
+    def visible_count(self):
+        """필터가 적용된 전체 결과 수 (미노출 행 포함)"""
+        return len(self._visible)
+
+
+class ValidationResultView(QTableView):
+    """검증 결과 테이블 뷰"""
+
+    def __init__(self, model, parent=None):
+        super().__init__(parent)
+        self.setModel(model)
+        self.setSortingEnabled(True)
+        self.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.setWordWrap(False)
+
+        # 행 높이 고정 (행 수와 무관하게 렌더링 비용 일정)
+        vertical_header = self.verticalHeader()
+        vertical_header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        vertical_header.setDefaultSectionSize(22)
+
+        header = self.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        header.setStretchLastSection(True)
+        self.setColumnWidth(0, 160)
+        self.setColumnWidth(1, 60)
+        self.setColumnWidth(2, 160)
+        self.setColumnWidth(3, 90)
@@ -1,38 +1,75 @@
 """
 FFT/FF16 번역 도구 메인 실행 파일
 """
+import time
+
+# 시작 시간 추적 기준점 (무거운 모듈을 가져오기 전)
+_START_TIME = time.perf_counter()
+
 import sys
+from utils.profiler import start_startup_profiler
+
+# 시작 단계는 항상 기록 (로그 요약), --profile-startup 또는 FFT_PROFILE_STARTUP=1 이면 이후 import도 측정
+_PROFILER = start_startup_profiler(origin=_START_TIME)
+_PROFILER.begin("imports", 'phase')
+
+import multiprocessing
 from PyQt6.QtWidgets import QApplication
-from gui.main_window import MainWindow
+from PyQt6.QtCore import QTimer
 from utils.logger import get_logger
 from utils.i18n import set_language, t
 from core.config_manager import get_config_manager
 
 
+def write_startup_profile():
+    """시작 프로파일 저장 (프로파일러가 켜져 있을 때만)"""
+    _PROFILER.stop()
+    logger = get_logger()
+    paths = _PROFILER.write(logger.log_dir)
+    if paths:
+        logger.info(f"시작 프로파일 저장: {paths[0]}, {paths[1]}")
+
+
 def main():
     """메인 함수"""
-    logger = get_logger()
+    _PROFILER.end()  # imports
+
+    with _PROFILER.phase("Logger"):
+        logger = get_logger()
     logger.info("=" * 50)
     logger.info("FFT/FF16 Translation Tool Starting")
     logger.info("=" * 50)
 
     # 저장된 언어 설정 로드
-    config = get_config_manager()
-    lang_code = config.get_language()
-    set_language(lang_code)
+    # 외부 도구 탐지는 메인 윈도우가 백그라운드 스레드에서 수행
+    with _PROFILER.phase("ConfigManager"):
+        config = get_config_manager(auto_detect=False)
+        lang_code = config.get_language()
+    with _PROFILER.phase("I18n"):
+        set_language(lang_code)
     logger.info(f"Language: {lang_code}")
 
-    app = QApplication(sys.argv)
-    app.setApplicationName(t("app.name"))
-    app.setOrganizationName(t("app.organization"))
+    with _PROFILER.phase("QApplication"):
+        app = QApplication(sys.argv)
+        app.setApplicationName(t("app.name"))
+        app.setOrganizationName(t("app.organization"))
 
-    window = MainWindow()
-    window.show()
+    with _PROFILER.phase("MainWindow"):
+        from gui.main_window import MainWindow
+        window = MainWindow()
+    with _PROFILER.phase("show"):
+        window.show()
 
     logger.info("Main window displayed")
+    logger.info(_PROFILER.summary())
+
+    # 첫 이벤트 루프 진입 후 프로파일 저장 (외부 도구 탐지가 끝나면 다시 저장)
+    QTimer.singleShot(0, write_startup_profile)
 
     sys.exit(app.exec())
 
 
 if __name__ == "__main__":
+    # PyInstaller 빌드에서 프로세스 풀(용어 통계) 자식 프로세스 지원
+    multiprocessing.freeze_support()
     main()
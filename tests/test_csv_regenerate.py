@@ -0,0 +1,171 @@
+"""
+CSVHandler.regenerate_csvs / deduplicate_rows 테스트
+"""
+import csv
+import json
+from core.csv_handler import CSVHandler
+
+
+def write_json(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding='utf-8')
+
+
+def read_rows(csv_file):
+    with open(csv_file, 'r', encoding='utf-8-sig', newline='') as f:
+        return {row['EntryID']: row for row in csv.DictReader(f)}
+
+
+def write_rows(csv_file, rows):
+    fieldnames = list(next(iter(rows.values())).keys())
+    with open(csv_file, 'w', encoding='utf-8-sig', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(rows.values())
+
+
+def translate(csv_file, translations):
+    rows = read_rows(csv_file)
+    for entry_id, translation in translations.items():
+        rows[entry_id]['Translation'] = translation
+    write_rows(csv_file, rows)
+
+
+def test_regenerate_kept_changed_new_removed(tmp_path):
+    source = tmp_path / 'source'
+    csv_folder = tmp_path / 'csv'
+    write_json(source / 'menu.json', {'a': 'Sword', 'b': 'Shield', 'c': 'Potion'})
+
+    handler = CSVHandler()
+    stats = handler.regenerate_csvs(source, csv_folder)
+    assert stats['new'] == 3
+    translate(csv_folder / 'menu.csv', {'a': '검', 'b': '방패', 'c': '포션'})
+
+    # a 유지, b 원문 변경, c 삭제, d 추가
+    write_json(source / 'menu.json', {'a': 'Sword', 'b': 'Great Shield', 'd': 'Ether'})
+    stats = handler.regenerate_csvs(source, csv_folder)
+
+    assert (stats['kept'], stats['changed'], stats['new'], stats['removed']) == (1, 1, 1, 1)
+    rows = read_rows(csv_folder / 'menu.csv')
+    assert set(rows) == {'a', 'b', 'd'}
+    assert rows['a']['Translation'] == '검' and rows['a']['Status'] == ''
+    assert rows['b']['Translation'] == '' and rows['b']['Status'] == 'changed'
+    assert rows['b']['PreviousTranslation'] == '방패'
+    assert rows['d']['Status'] == 'new'
+
+
+def test_regenerate_marks_orphaned_csvs(tmp_path):
+    source = tmp_path / 'source'
+    csv_folder = tmp_path / 'csv'
+    write_json(source / 'menu.json', {'a': 'Sword'})
+    write_json(source / 'old.json', {'x': 'Old line'})
+
+    handler = CSVHandler()
+    handler.regenerate_csvs(source, csv_folder)
+    translate(csv_folder / 'old.csv', {'x': '예전 문장'})
+
+    (source / 'old.json').unlink()
+    stats = handler.regenerate_csvs(source, csv_folder)
+
+    assert stats['orphaned'] == 1
+    assert not (csv_folder / 'old.csv').exists()
+    assert (csv_folder / 'old.csv.orphaned').exists()
+    translations = handler.load_all_translations(csv_folder)
+    assert ('old.json', 'x') not in translations
+    assert ('menu.json', 'a') in translations
+
+
+def test_regenerate_leaves_unrelated_csvs_alone(tmp_path):
+    source = tmp_path / 'source'
+    csv_folder = tmp_path / 'csv'
+    write_json(source / 'menu.json', {'a': 'Sword'})
+    csv_folder.mkdir()
+    (csv_folder / 'glossary.csv').write_text('Source,Target\nSword,검\n', encoding='utf-8')
+
+    handler = CSVHandler()
+    handler.regenerate_csvs(source, csv_folder)
+    stats = handler.regenerate_csvs(source, csv_folder)
+
+    assert stats['orphaned'] == 0
+    assert (csv_folder / 'glossary.csv').exists()
+
+
+def test_regenerate_does_not_overwrite_orphaned_csv(tmp_path):
+    source = tmp_path / 'source'
+    csv_folder = tmp_path / 'csv'
+    write_json(source / 'menu.json', {'a': 'Sword'})
+    write_json(source / 'old.json', {'x': 'Old line'})
+
+    handler = CSVHandler()
+    handler.regenerate_csvs(source, csv_folder)
+    (csv_folder / 'old.csv.orphaned').write_text('earlier', encoding='utf-8')
+
+    (source / 'old.json').unlink()
+    stats = handler.regenerate_csvs(source, csv_folder)
+
+    assert stats['orphaned'] == 1
+    assert (csv_folder / 'old.csv.orphaned').read_text(encoding='utf-8') == 'earlier'
+    assert 'Old line' in (csv_folder / 'old.csv.orphaned.1').read_text(encoding='utf-8-sig')
+
+
+def test_regenerate_keeps_csvs_when_source_is_empty(tmp_path):
+    csv_folder = tmp_path / 'csv'
+    write_json(tmp_path / 'source' / 'menu.json', {'a': 'Sword'})
+    handler = CSVHandler()
+    handler.regenerate_csvs(tmp_path / 'source', csv_folder)
+
+    (tmp_path / 'empty').mkdir()
+    stats = handler.regenerate_csvs(tmp_path / 'empty', csv_folder)
+    assert stats['orphaned'] == 0
+    assert (csv_folder / 'menu.csv').exists()
+
+
+def row(file_name, entry_id, original, translation=''):
+    return {'Tag': '', 'FileName': file_name, 'EntryID': entry_id,
+            'OriginalText': original, 'Translation': translation}
+
+
+def test_deduplicate_merges_untranslated_into_translated():
+    handler = CSVHandler()
+    outputs = [('a.csv', [row('a.json', '1', 'Sword'), row('a.json', '2', 'Sword', '검')]),
+               ('b.csv', [row('b.json', '1', 'Sword')])]
+
+    result = handler.deduplicate_rows(outputs)
+
+    assert [name for name, _ in result] == ['a.csv']
+    (kept,) = result[0][1]
+    assert kept['Translation'] == '검'
+    assert json.loads(kept['Occurrences']) == [['a.json', '2'], ['b.json', '1']]
+    assert kept.get('Status', '') != 'conflict'
+
+
+def test_deduplicate_flags_conflicting_translations():
+    handler = CSVHandler()
+    outputs = [('a.csv', [row('a.json', '1', 'Sword', '검'), row('a.json', '2', 'Sword', '칼'),
+                          row('a.json', '3', 'Sword', '검'), row('a.json', '4', 'Sword')])]
+
+    result = handler.deduplicate_rows(outputs)
+
+    rows = {r['EntryID']: r for r in result[0][1]}
+    # 번역이 다른 행은 합치지 않고 둘 다 남김
+    assert set(rows) == {'1', '2'}
+    assert rows['1']['Status'] == rows['2']['Status'] == 'conflict'
+    assert json.loads(rows['1']['Occurrences']) == [['a.json', '3'], ['a.json', '4']]
+    assert rows['2']['Occurrences'] == ''
+
+
+def test_regenerate_dedup_conflict_keeps_both_translations(tmp_path):
+    source = tmp_path / 'source'
+    csv_folder = tmp_path / 'csv'
+    write_json(source / 'menu.json', {'a': 'Sword', 'b': 'Sword'})
+
+    handler = CSVHandler()
+    handler.regenerate_csvs(source, csv_folder)
+    translate(csv_folder / 'menu.csv', {'a': '검', 'b': '칼'})
+
+    stats = handler.regenerate_csvs(source, csv_folder, deduplicate=True)
+
+    assert stats['conflicts'] == 2
+    translations = handler.load_all_translations(csv_folder)
+    assert translations[('menu.json', 'a')] == '검'
+    assert translations[('menu.json', 'b')] == '칼'
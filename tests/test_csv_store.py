@@ -0,0 +1,94 @@
+"""
+CSVStore 읽기/편집/저장 테스트
+"""
+import csv
+from core.csv_store import CSVStore
+
+HEADER = ['Tag', 'FileName', 'EntryID', 'OriginalText', 'Translation']
+
+
+def write_csv(path, rows, lineterminator='\r\n'):
+    with open(path, 'w', encoding='utf-8-sig', newline='') as f:
+        writer = csv.writer(f, lineterminator=lineterminator)
+        writer.writerow(HEADER)
+        writer.writerows(rows)
+
+
+def read_csv(path):
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        return list(csv.reader(f))
+
+
+ROWS_A = [
+    ['<text1>', 'a.json', '1', 'Sword', ''],
+    ['<text2>', 'a.json', '2', 'Line one\nline "two"', ''],
+    ['<text3>', 'a.json', '3', 'Comma, inside', '쉼표, 안'],
+]
+ROWS_B = [
+    ['<text1>', 'b.yaml', '10', '魔法', ''],
+    ['<text2>', 'b.yaml', '11', '剣', ''],
+]
+
+
+def open_store(tmp_path):
+    write_csv(tmp_path / 'a.csv', ROWS_A)
+    write_csv(tmp_path / 'b.csv', ROWS_B, lineterminator='\n')
+    store = CSVStore()
+    store.open_folder(tmp_path)
+    return store
+
+
+def test_rows_are_read_across_files(tmp_path):
+    store = open_store(tmp_path)
+    try:
+        assert store.row_count() == 5
+        assert store.get_row(1)['OriginalText'] == 'Line one\nline "two"'
+        assert store.get_row(2)['Translation'] == '쉼표, 안'
+        assert store.get_row(3)['_csv'] == 'b.csv'
+        assert store.find_entry('11', 'b.yaml') == 4
+        assert store.find_entry(2) == 1
+        assert store.search('"two"') == 1
+        assert store.search('剣', start_row=4) == 4
+    finally:
+        store.close()
+
+
+def test_save_round_trip_rewrites_only_edited_rows(tmp_path):
+    store = open_store(tmp_path)
+    original_b = (tmp_path / 'b.csv').read_bytes()
+    try:
+        store.set_translation(1, '첫 줄\n"둘째" 줄')
+        store.set_translation(2, '')
+        assert store.dirty_count() == 2
+        assert store.search('둘째') == 1
+
+        assert store.save() == 2
+        assert store.dirty_count() == 0
+        assert store.get_row(1)['Translation'] == '첫 줄\n"둘째" 줄'
+    finally:
+        store.close()
+
+    rows = read_csv(tmp_path / 'a.csv')
+    assert rows[0] == HEADER
+    assert rows[1] == ROWS_A[0]
+    assert rows[2] == ROWS_A[1][:4] + ['첫 줄\n"둘째" 줄']
+    assert rows[3] == ROWS_A[2][:4] + ['']
+    # 편집하지 않은 파일은 바이트 단위로 그대로
+    assert (tmp_path / 'b.csv').read_bytes() == original_b
+    assert (tmp_path / 'a.csv').read_bytes().startswith(b'\xef\xbb\xbf')
+
+
+def test_reopen_after_save_sees_new_text(tmp_path):
+    store = open_store(tmp_path)
+    store.set_translation(3, '마법')
+    store.save()
+    store.close()
+
+    reopened = CSVStore()
+    try:
+        reopened.open_folder(tmp_path)
+        assert reopened.row_count() == 5
+        assert reopened.get_row(3)['Translation'] == '마법'
+        assert reopened.get_row(4)['OriginalText'] == '剣'
+    finally:
+        reopened.close()
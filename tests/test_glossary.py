@@ -0,0 +1,54 @@
+"""
+AhoCorasick / GlossaryChecker 테스트
+"""
+import random
+from core.glossary import AhoCorasick, GlossaryChecker
+
+
+def naive_matches(text, patterns):
+    return sorted((start + len(pattern) - 1, value)
+                  for value, pattern in enumerate(patterns)
+                  for start in range(len(text) - len(pattern) + 1)
+                  if text.startswith(pattern, start))
+
+
+def test_overlapping_and_nested_patterns():
+    patterns = ['he', 'she', 'his', 'hers']
+    automaton = AhoCorasick()
+    for value, pattern in enumerate(patterns):
+        automaton.add(pattern, value)
+
+    matches = sorted(automaton.iter_matches('ushers'))
+
+    # she(1..3), he(2..3), hers(2..5)
+    assert matches == [(3, 0), (3, 1), (5, 3)]
+
+
+def test_matches_agree_with_naive_search():
+    rng = random.Random(35)
+    patterns = sorted({''.join(rng.choice('abc') for _ in range(rng.randint(1, 5))) for _ in range(40)})
+    automaton = AhoCorasick()
+    for value, pattern in enumerate(patterns):
+        automaton.add(pattern, value)
+
+    for _ in range(20):
+        text = ''.join(rng.choice('abcd') for _ in range(200))
+        assert sorted(automaton.iter_matches(text)) == naive_matches(text, patterns)
+
+
+def test_patterns_added_after_build_are_found():
+    automaton = AhoCorasick()
+    automaton.add('剣', 'sword')
+    automaton.build()
+    automaton.add('魔法', 'magic')
+
+    assert sorted(value for _, value in automaton.iter_matches('魔法の剣')) == ['magic', 'sword']
+
+
+def test_glossary_reports_missing_targets_once():
+    checker = GlossaryChecker()
+    checker.add_term('クリスタル', ['크리스탈', '수정'])
+    checker.add_term('剣', ['검'])
+
+    assert checker.check_text('クリスタルとクリスタルの剣', '크리스탈과 검') == []
+    assert checker.check_text('クリスタルとクリスタル', '보석과 보석') == [('クリスタル', ['크리스탈', '수정'])]
@@ -0,0 +1,54 @@
+"""
+TreeManifest 생성/비교 테스트
+"""
+import os
+from core.manifest import TreeManifest
+
+
+def write(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+
+
+def test_diff_reports_added_removed_and_modified(tmp_path):
+    write(tmp_path / 'a.nxd', b'a')
+    write(tmp_path / 'sub' / 'b.json', b'{}')
+    write(tmp_path / 'sub' / 'c.yaml', b'- 1')
+    write(tmp_path / 'ignored.txt', b'x')
+    old = TreeManifest.build(tmp_path)
+
+    write(tmp_path / 'sub' / 'b.json', b'{"k": 1}')
+    (tmp_path / 'sub' / 'c.yaml').unlink()
+    write(tmp_path / 'd.pzd', b'd')
+    new = TreeManifest.build(tmp_path, previous=old)
+
+    assert sorted(old.files) == ['a.nxd', 'sub/b.json', 'sub/c.yaml']
+    assert old.diff(new) == {'added': ['d.pzd'], 'removed': ['sub/c.yaml'], 'modified': ['sub/b.json']}
+
+
+def test_same_content_is_not_modified(tmp_path):
+    write(tmp_path / 'a.nxd', b'same')
+    old = TreeManifest.build(tmp_path)
+
+    # 수정 시각만 바뀐 파일은 해시를 다시 계산하지만 변경으로 보지 않음
+    stat = os.stat(tmp_path / 'a.nxd')
+    os.utime(tmp_path / 'a.nxd', ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    new = TreeManifest.build(tmp_path, previous=old)
+
+    assert new.files['a.nxd']['mtime_ns'] != old.files['a.nxd']['mtime_ns']
+    assert old.diff(new) == {'added': [], 'removed': [], 'modified': []}
+
+
+def test_changed_files_uses_saved_manifest(tmp_path):
+    write(tmp_path / 'a.nxd', b'a')
+    changed, manifest = TreeManifest.changed_files(tmp_path)
+    assert changed is None
+    manifest.save()
+
+    write(tmp_path / 'a.nxd', b'aa')
+    write(tmp_path / 'b.nxd', b'b')
+    changed, _ = TreeManifest.changed_files(tmp_path)
+
+    assert sorted(changed) == ['a.nxd', 'b.nxd']
+    # 매니페스트 파일 자체는 추적하지 않음
+    assert TreeManifest.MANIFEST_FILE not in TreeManifest.load(tmp_path).files
@@ -0,0 +1,83 @@
+"""
+ProjectDatabase 가져오기/내보내기 테스트
+"""
+import csv
+import sqlite3
+from core.project_db import ProjectDatabase
+
+HEADER = ['Tag', 'FileName', 'EntryID', 'OriginalText', 'Translation', 'Status']
+
+
+def write_csv(path, rows):
+    with open(path, 'w', encoding='utf-8-sig', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(HEADER)
+        writer.writerows(rows)
+
+
+def read_csv(path):
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        return list(csv.reader(f))
+
+
+def test_round_trip_keeps_duplicate_and_blank_keys(tmp_path):
+    source = tmp_path / 'csv'
+    source.mkdir()
+    rows_a = [
+        ['<text1>', 'x', '1', 'Sword', '검', ''],
+        ['<text2>', 'x', '2', 'Shield', '방패', 'new'],
+    ]
+    rows_b = [
+        ['<text1>', 'x', '1', 'Sword (b)', '칼', ''],
+        ['<text2>', '', '', 'Note one', '메모 1', ''],
+        ['<text3>', '', '', 'Note two', '메모 2', 'changed'],
+    ]
+    write_csv(source / 'a.csv', rows_a)
+    write_csv(source / 'b.csv', rows_b)
+
+    output = tmp_path / 'out'
+    with ProjectDatabase(tmp_path / 'project.db') as project_db:
+        assert project_db.import_csv_folder(source) == 5
+        assert project_db.row_count() == 5
+        assert project_db.export_csv_folder(output) == 2
+
+    assert read_csv(output / 'a.csv') == [HEADER] + rows_a
+    assert read_csv(output / 'b.csv') == [HEADER] + rows_b
+
+
+def test_reimport_replaces_only_that_csv(tmp_path):
+    source = tmp_path / 'csv'
+    source.mkdir()
+    write_csv(source / 'a.csv', [['<text1>', 'x', '1', 'Sword', '', '']])
+    write_csv(source / 'b.csv', [['<text1>', 'x', '1', 'Sword', '', '']])
+
+    with ProjectDatabase(tmp_path / 'project.db') as project_db:
+        project_db.import_csv_folder(source)
+        project_db.import_records('a.csv', [{'FileName': 'x', 'EntryID': '1', 'OriginalText': 'Sword',
+                                             'Translation': '검'}])
+        assert project_db.row_count() == 2
+        assert project_db.load_all_translations() == {('x', '1'): 'Sword'}
+
+
+def test_old_schema_is_migrated(tmp_path):
+    db_path = tmp_path / 'old.db'
+    conn = sqlite3.connect(str(db_path))
+    conn.executescript("""
+        CREATE TABLE entries (
+            file_name TEXT NOT NULL, entry_id TEXT NOT NULL, csv_name TEXT NOT NULL, row_no INTEGER NOT NULL,
+            tag TEXT NOT NULL DEFAULT '', original_text TEXT NOT NULL DEFAULT '',
+            translation TEXT NOT NULL DEFAULT '', extra TEXT NOT NULL DEFAULT '{}',
+            PRIMARY KEY (file_name, entry_id)
+        );
+        CREATE INDEX idx_entries_csv ON entries (csv_name, row_no);
+        CREATE TABLE csv_files (csv_name TEXT PRIMARY KEY, columns TEXT NOT NULL);
+        INSERT INTO entries VALUES ('x', '1', 'a.csv', 0, '<text1>', 'Sword', '검', '{}');
+    """)
+    conn.commit()
+    conn.close()
+
+    with ProjectDatabase(db_path) as project_db:
+        assert project_db.row_count() == 1
+        project_db.import_records('b.csv', [{'FileName': 'x', 'EntryID': '1', 'OriginalText': 'Sword'}])
+        assert project_db.row_count() == 2
+        assert project_db.conn.execute("PRAGMA user_version").fetchone()[0] == ProjectDatabase.SCHEMA_VERSION
@@ -0,0 +1,58 @@
+"""
+TranslationMemory 유사 원문 검색 테스트
+"""
+import random
+from core.translation_memory import TranslationMemory
+
+
+def dice(a, b):
+    grams_a = TranslationMemory._grams(a)
+    grams_b = TranslationMemory._grams(b)
+    return 2 * len(grams_a & grams_b) / (len(grams_a) + len(grams_b))
+
+
+def test_exact_match_scores_one_and_ranks_first():
+    tm = TranslationMemory()
+    tm.add('魔法の剣を手に入れた', '마법 검을 손에 넣었다')
+    tm.add('魔法の盾を手に入れた', '마법 방패를 손에 넣었다')
+
+    suggestions = tm.suggest('魔法の剣を手に入れた', k=2)
+
+    assert suggestions[0]['translation'] == '마법 검을 손에 넣었다'
+    assert suggestions[0]['score'] == 1.0
+    assert suggestions[1]['translation'] == '마법 방패를 손에 넣었다'
+    assert 0.5 <= suggestions[1]['score'] < 1.0
+
+
+def test_min_score_filters_dissimilar_pairs():
+    tm = TranslationMemory()
+    tm.add('Potion', '포션')
+    assert tm.suggest('Phoenix Down', min_score=0.5) == []
+
+
+def test_first_translation_is_kept_for_duplicate_original():
+    tm = TranslationMemory()
+    assert tm.add('Sword', '검')
+    assert not tm.add('Sword', '칼')
+    assert tm.suggest('Sword', k=1)[0]['translation'] == '검'
+
+
+def test_scores_match_brute_force_dice():
+    rng = random.Random(1234)
+    alphabet = 'abcdefgh'
+    originals = {''.join(rng.choice(alphabet) for _ in range(rng.randint(4, 12))) for _ in range(1500)}
+
+    tm = TranslationMemory()
+    for original in originals:
+        tm.add(original, original.upper())
+
+    for _ in range(30):
+        query = ''.join(rng.choice(alphabet) for _ in range(rng.randint(4, 12)))
+        expected = sorted((dice(query, original) for original in tm.originals), reverse=True)
+        expected = [score for score in expected if score >= 0.6][:5]
+
+        suggestions = tm.suggest(query, k=5, min_score=0.6)
+
+        assert [round(item['score'], 4) for item in suggestions] == [round(score, 4) for score in expected]
+        for item in suggestions:
+            assert item['score'] == round(dice(query, item['original']), 4)
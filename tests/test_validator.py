@@ -0,0 +1,37 @@
+"""
+CSVValidator 바이트 길이 검증 테스트
+"""
+import csv
+from core.csv_handler import CSVHandler
+from core.validator import CSVValidator
+
+
+def write_csv(path, rows):
+    with open(path, 'w', encoding='utf-8-sig', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['Tag', 'FileName', 'EntryID', 'OriginalText', 'Translation'])
+        writer.writerows(rows)
+
+
+def test_byte_length_matches_for_csv_folder_and_project_db(tmp_path):
+    csv_folder = tmp_path / 'csv'
+    csv_folder.mkdir()
+    write_csv(csv_folder / 'menu.csv', [
+        ['<text1>', 'menu.json', '1', 'Sword', '검'],
+        ['<text2>', 'menu.json', '2', 'Shield', '아주 긴 방패 이름'],
+        ['<text3>', 'menu.json', '3', 'Potion', ''],
+    ])
+    write_csv(csv_folder / 'battle.csv', [
+        ['<text1>', 'battle.yaml', '7', 'Hit', '명중했습니다'],
+    ])
+    db_path = tmp_path / 'project.db'
+    CSVHandler().import_to_project(csv_folder, db_path)
+
+    validator = CSVValidator()
+    csv_results, csv_totals = validator.validate_byte_length(csv_folder, max_ratio=1.5)
+    db_results, db_totals = validator.validate_byte_length(db_path, max_ratio=1.5)
+
+    key = lambda result: (result['file'], result['row'])
+    assert sorted(db_results, key=key) == sorted(csv_results, key=key)
+    assert db_totals == csv_totals
+    assert sorted((r['file'], r['row']) for r in db_results) == [('battle.csv', 2), ('menu.csv', 3)]
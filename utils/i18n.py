@@ -2,16 +2,24 @@
 다국어 지원 모듈 (Internationalization)
 """
 import json
+import atexit
+import threading
+from string import Formatter
 from pathlib import Path
 from utils.logger import get_logger
 
 
 class I18n:
-    """다국어 지원 클래스"""
+    """
+    다국어 지원 클래스
+
+    언어 파일은 로드할 때 한 번 "점 표기법 키 → 템플릿" 평탄 카탈로그로 컴파일됩니다.
+    선택한 언어에 없는 키는 기본 언어(ko) 값으로 채워지고, 어느 언어에도 없는 키는
+    언어별로 한 번만 경고한 뒤 missing_report()로 모아 볼 수 있습니다.
+    """
 
     _instance = None
-    _current_language = "ko"  # 기본 언어: 한국어
-    _translations = {}
+    FALLBACK_LANGUAGE = "ko"  # 기본 언어: 한국어
 
     def __new__(cls):
         """싱글톤 패턴"""
@@ -20,58 +28,131 @@ class I18n:
         return cls._instance
 
     def __init__(self):
-        """초기화"""
+        """초기화 (언어 파일은 처음 사용할 때 로드)"""
         if not hasattr(self, 'initialized'):
             self.logger = get_logger()
             self.lang_dir = Path(__file__).parent.parent / "languages"
             self.lang_dir.mkdir(exist_ok=True)
 
-            # config.json에서 언어 설정 로드
-            initial_lang = self._load_language_from_config()
-            self.load_language(initial_lang)
+            self._lock = threading.RLock()
+            self._current_language = None
+            self._catalog = {}      # {키: (텍스트, 포맷 함수 또는 None)}
+            self._sources = {}      # {언어 코드: 언어 파일을 평탄화한 {키: 텍스트}}
+            self._fallback_keys = set()  # 현재 언어에 없어 기본 언어 값을 쓰는 키
+            self._missing = {}      # {언어 코드: 어느 언어에도 없어 키를 그대로 반환한 키}
             self.initialized = True
 
+            atexit.register(self._log_missing_report)
+
+    def _ensure_loaded(self):
+        """아직 언어를 로드하지 않았으면 설정 관리자의 언어 설정으로 로드"""
+        if self._current_language is None:
+            self.load_language(self._load_language_from_config())
+
     def _load_language_from_config(self):
-        """config.json에서 언어 설정 로드"""
+        """설정 관리자에서 언어 설정 로드 (config.json을 따로 읽지 않음)"""
         try:
-            config_file = Path(__file__).parent.parent / "config.json"
-            if config_file.exists():
-                import json
-                with open(config_file, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
-                    lang = config.get('language', 'ko')
-                    self.logger.info(f"config.json에서 언어 설정 로드: {lang}")
-                    return lang
+            from core.config_manager import get_config_manager
+            # GUI는 외부 도구 탐지를 백그라운드에서 하므로 여기서 탐지를 시작하지 않음
+            return get_config_manager(auto_detect=False).get_language()
         except Exception as e:
-            self.logger.warning(f"config.json 언어 설정 로드 실패: {e}")
+            self.logger.warning(f"언어 설정 로드 실패: {e}")
+            return self.FALLBACK_LANGUAGE
 
-        # 기본값 반환
-        return self._current_language
-
-    def load_language(self, lang_code):
+    def _read_source(self, lang_code):
         """
-        언어 파일 로드
+        언어 파일을 읽어 평탄화 (언어별로 한 번만 읽음)
 
         Args:
-            lang_code: 언어 코드 (ko, en 등)
+            lang_code: 언어 코드
+
+        Returns:
+            {점 표기법 키: 텍스트}, 파일이 없거나 읽지 못하면 None
         """
-        lang_file = self.lang_dir / f"{lang_code}.json"
+        if lang_code in self._sources:
+            return self._sources[lang_code]
 
+        lang_file = self.lang_dir / f"{lang_code}.json"
         if not lang_file.exists():
             self.logger.warning(f"언어 파일을 찾을 수 없음: {lang_file}")
-            # 기본 언어로 폴백
-            if lang_code != "ko":
-                self.load_language("ko")
-            return
+            return None
 
         try:
             with open(lang_file, "r", encoding="utf-8") as f:
-                self._translations = json.load(f)
-                self._current_language = lang_code
-                self.logger.info(f"언어 로드됨: {lang_code}")
+                source = self._flatten(json.load(f))
         except Exception as e:
             self.logger.error(f"언어 파일 로드 실패: {e}")
-            self._translations = {}
+            return None
+
+        self._sources[lang_code] = source
+        return source
+
+    @staticmethod
+    def _flatten(data, prefix=""):
+        """
+        중첩 딕셔너리를 점 표기법 키의 평탄 딕셔너리로 변환 (문자열 값만 유지)
+
+        Args:
+            data: 언어 파일 딕셔너리
+            prefix: 상위 키
+
+        Returns:
+            {점 표기법 키: 텍스트}
+        """
+        flat = {}
+        for key, value in data.items():
+            full_key = f"{prefix}{key}"
+            if isinstance(value, dict):
+                flat.update(I18n._flatten(value, f"{full_key}."))
+            elif isinstance(value, str):
+                flat[full_key] = value
+        return flat
+
+    @staticmethod
+    def _compile(text):
+        """
+        템플릿 미리 분석
+
+        Args:
+            text: 번역 텍스트
+
+        Returns:
+            (텍스트, 포맷 함수) - 치환할 자리가 없으면 포맷 함수는 None
+        """
+        try:
+            needs_format = any(field is not None for _, field, _, _ in Formatter().parse(text))
+            # 치환할 자리가 없어도 {{ }} 이스케이프는 format으로 풀어야 함
+            needs_format = needs_format or '{{' in text or '}}' in text
+        except ValueError:
+            # 중괄호 짝이 맞지 않는 텍스트는 그대로 사용
+            return text, None
+        return text, (text.format if needs_format else None)
+
+    def load_language(self, lang_code):
+        """
+        언어 파일 로드 (기본 언어 카탈로그 위에 선택한 언어를 덮어 컴파일)
+
+        Args:
+            lang_code: 언어 코드 (ko, en 등)
+        """
+        with self._lock:
+            fallback = self._read_source(self.FALLBACK_LANGUAGE) or {}
+            source = self._read_source(lang_code) if lang_code != self.FALLBACK_LANGUAGE else fallback
+            if source is None:
+                # 기본 언어로 폴백
+                lang_code = self.FALLBACK_LANGUAGE
+                source = fallback
+
+            merged = dict(fallback)
+            merged.update(source)
+            self._catalog = {key: self._compile(text) for key, text in merged.items()}
+            self._fallback_keys = set(fallback) - set(source)
+            self._current_language = lang_code
+
+        self.logger.info(f"언어 로드됨: {lang_code} ({len(self._catalog)}개 키)")
+        if self._fallback_keys:
+            self.logger.warning(f"{lang_code}: 번역 {len(self._fallback_keys)}개가 없어 "
+                                f"{self.FALLBACK_LANGUAGE} 값 사용")
 
     def set_language(self, lang_code):
         """
@@ -84,6 +165,7 @@ class I18n:
 
     def get_language(self):
         """현재 언어 코드 반환"""
+        self._ensure_loaded()
         return self._current_language
 
     def t(self, key, **kwargs):
@@ -95,30 +177,63 @@ class I18n:
             **kwargs: 포맷팅 인자
 
         Returns:
-            번역된 텍스트
+            번역된 텍스트 (키를 찾을 수 없으면 키 자체)
         """
-        # 점 표기법으로 중첩된 딕셔너리 탐색
-        keys = key.split(".")
-        value = self._translations
-
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                # 키를 찾을 수 없으면 키 자체를 반환
-                self.logger.warning(f"번역 키를 찾을 수 없음: {key}")
-                return key
-
-        # 문자열이 아니면 키 반환
-        if not isinstance(value, str):
+        entry = self._catalog.get(key)
+        if entry is None:
+            if self._current_language is None:
+                self._ensure_loaded()
+                return self.t(key, **kwargs)
+            self._record_missing(key)
             return key
 
+        text, formatter = entry
+        if formatter is None:
+            return text
+
         # 포맷팅 적용
         try:
-            return value.format(**kwargs)
+            return formatter(**kwargs)
         except Exception as e:
             self.logger.error(f"번역 포맷팅 실패: {key}, {e}")
-            return value
+            return text
+
+    def _record_missing(self, key):
+        """찾을 수 없는 키를 언어별로 기록 (같은 키는 한 번만 경고)"""
+        with self._lock:
+            missing = self._missing.setdefault(self._current_language, set())
+            if key in missing:
+                return
+            missing.add(key)
+        self.logger.warning(f"번역 키를 찾을 수 없음: {key}")
+
+    def missing_report(self):
+        """
+        언어별 누락 키 보고서
+
+        Returns:
+            {언어 코드: 정렬된 키 리스트} - 사용 가능한 각 언어에서 기본 언어보다 빠진 키와
+            실행 중 어느 언어에서도 찾지 못한 키
+        """
+        with self._lock:
+            fallback = self._read_source(self.FALLBACK_LANGUAGE) or {}
+            report = {}
+            for lang_code in self.get_available_languages():
+                source = self._read_source(lang_code) or {}
+                keys = (set(fallback) - set(source)) | self._missing.get(lang_code, set())
+                if keys:
+                    report[lang_code] = sorted(keys)
+            for lang_code, keys in self._missing.items():
+                if keys and lang_code not in report:
+                    report[lang_code] = sorted(keys)
+        return report
+
+    def _log_missing_report(self):
+        """종료 시 실행 중 찾지 못한 키 요약 로그"""
+        for lang_code, keys in self._missing.items():
+            if keys:
+                self.logger.warning(f"찾을 수 없던 번역 키 ({lang_code}, {len(keys)}개): "
+                                    f"{', '.join(sorted(keys))}")
 
     def get_available_languages(self):
         """사용 가능한 언어 목록 반환"""
@@ -160,3 +275,8 @@ def get_language():
 def get_available_languages():
     """사용 가능한 언어 목록 반환"""
     return _i18n.get_available_languages()
+
+
+def get_missing_keys():
+    """언어별 누락 번역 키 보고서 반환 ({언어 코드: 키 리스트})"""
+    return _i18n.missing_report()
@@ -1,36 +1,71 @@
 """
 로깅 시스템 모듈
 """
-import logging
 import os
+import queue
+import atexit
+import logging
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from datetime import datetime
 from pathlib import Path
 
 
+class _EnqueueHandler(QueueHandler):
+    """레코드를 복사/포맷하지 않고 메시지만 확정해서 큐에 넣는 핸들러"""
+
+    def prepare(self, record):
+        """예외 정보가 없으면 메시지 문자열만 만들어 그대로 전달"""
+        if record.exc_info or record.stack_info:
+            return super().prepare(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
 class AppLogger:
-    """애플리케이션 로거 클래스"""
+    """
+    애플리케이션 로거 클래스
+
+    호출하는 스레드는 QueueHandler로 레코드를 큐에 넣기만 하고,
+    파일 쓰기는 QueueListener의 백그라운드 스레드가 담당합니다.
+    """
+
+    # 로그 파일 하나의 최대 크기와 보관할 이전 파일 수
+    MAX_BYTES = 10 * 1024 * 1024
+    BACKUP_COUNT = 5
+
+    # 로그 레벨 환경 변수 (config.json의 log_level보다 우선)
+    LEVEL_ENV_VAR = 'FFT_LOG_LEVEL'
+    DEFAULT_LEVEL = 'DEBUG'
 
-    def __init__(self, log_dir='logs'):
+    def __init__(self, log_dir='logs', level=None):
         """
         로거 초기화
 
         Args:
             log_dir: 로그 파일을 저장할 디렉토리 경로
+            level: 로그 레벨 (None이면 환경 변수 → DEFAULT_LEVEL 순,
+                   config.json의 log_level은 설정 관리자가 로드 후 set_level로 적용)
         """
         self.log_dir = Path(log_dir)
         self.log_dir.mkdir(exist_ok=True)
 
+        # 포맷에 쓰지 않는 호출 위치/프로세스 정보 수집 생략 (logging 문서의 최적화 항목)
+        logging._srcfile = None
+        logging.logProcesses = False
+        logging.logMultiprocessing = False
+
         self.logger = logging.getLogger('FFT_Tool')
-        self.logger.setLevel(logging.DEBUG)
+        self.logger.propagate = False
 
         # 기존 핸들러 제거 (중복 방지)
         if self.logger.handlers:
             self.logger.handlers.clear()
 
-        # 파일 핸들러
-        log_file = self.log_dir / f'app_{datetime.now().strftime("%Y%m%d")}.log'
-        fh = logging.FileHandler(log_file, encoding='utf-8')
-        fh.setLevel(logging.DEBUG)
+        # 파일 핸들러 (크기 기준 교체, 리스너 스레드에서만 사용)
+        self.log_file = self.log_dir / f'app_{datetime.now().strftime("%Y%m%d")}.log'
+        fh = RotatingFileHandler(self.log_file, maxBytes=self.MAX_BYTES,
+                                 backupCount=self.BACKUP_COUNT, encoding='utf-8')
 
         # 포맷터
         formatter = logging.Formatter(
@@ -39,7 +74,41 @@ class AppLogger:
         )
         fh.setFormatter(formatter)
 
-        self.logger.addHandler(fh)
+        # 호출 스레드는 큐에 넣기만 함
+        self.queue = queue.SimpleQueue()
+        self.logger.addHandler(_EnqueueHandler(self.queue))
+        self.listener = QueueListener(self.queue, fh, respect_handler_level=True)
+        self.listener.start()
+        atexit.register(self.shutdown)
+
+        self._apply_level(level or os.environ.get(self.LEVEL_ENV_VAR) or self.DEFAULT_LEVEL)
+
+    def set_level(self, level):
+        """
+        로그 레벨 변경 (레벨 미만의 호출은 큐에 넣기 전에 걸러짐)
+
+        환경 변수 LEVEL_ENV_VAR가 지정되어 있으면 그 값이 우선하므로 무시됩니다.
+
+        Args:
+            level: 레벨 이름 ('DEBUG', 'INFO' 등) 또는 logging 상수
+        """
+        if os.environ.get(self.LEVEL_ENV_VAR):
+            return
+        self._apply_level(level)
+
+    def _apply_level(self, level):
+        """레벨 이름/상수를 logging 레벨로 변환하여 적용 (알 수 없으면 DEFAULT_LEVEL)"""
+        if isinstance(level, str):
+            level = logging.getLevelName(level.strip().upper())
+        if not isinstance(level, int):
+            level = logging.getLevelName(self.DEFAULT_LEVEL)
+        self.logger.setLevel(level)
+
+    def shutdown(self):
+        """큐에 남은 로그를 모두 쓰고 리스너 종료"""
+        if self.listener is not None:
+            self.listener.stop()
+            self.listener = None
 
     def debug(self, msg):
         """디버그 로그"""
@@ -0,0 +1,266 @@
+"""
+시작 시간 프로파일러 모듈 (모듈 가져오기/초기화 단계별 소요 시간)
+
+초기화 단계(phase)는 항상 기록되어 summary()로 로그에 한 줄 요약이 남습니다.
+모듈 가져오기 측정과 보고서 저장은 환경 변수 FFT_PROFILE_STARTUP=1 또는
+main.py의 --profile-startup 옵션으로 켭니다. 결과는 logs 폴더에 정렬된 보고서(.txt)와 Chrome trace JSON(.json)으로 저장되며,
+JSON은 chrome://tracing 또는 https://ui.perfetto.dev 에서 열 수 있습니다.
+"""
+import os
+import sys
+import json
+import time
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+
+# 프로파일러 활성화 환경 변수 / 명령줄 옵션
+PROFILE_ENV_VAR = 'FFT_PROFILE_STARTUP'
+PROFILE_FLAG = '--profile-startup'
+
+
+class _ImportTimer:
+    """
+    sys.meta_path 맨 앞에 들어가는 finder
+
+    실제 검색은 뒤쪽 finder에 맡기고, 찾은 loader의 exec_module만 감싸서
+    모듈 실행(하위 import 포함) 시간을 기록합니다.
+    """
+
+    def __init__(self, profiler):
+        self.profiler = profiler
+
+    def find_spec(self, fullname, path=None, target=None):
+        """뒤쪽 finder로 모듈을 찾고 loader에 시간 측정 추가"""
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                self._wrap_loader(spec)
+                return spec
+        return None
+
+    def _wrap_loader(self, spec):
+        """loader 인스턴스의 exec_module을 시간 측정 함수로 교체 (loader 자체는 유지)"""
+        loader = spec.loader
+        # 내장/frozen 모듈 loader는 클래스 자체라 건드리지 않음
+        if loader is None or isinstance(loader, type) or not hasattr(loader, '__dict__'):
+            return
+        exec_module = getattr(loader, 'exec_module', None)
+        if exec_module is None or getattr(exec_module, '_profiled', False):
+            return
+
+        profiler = self.profiler
+        name = spec.name
+
+        def timed_exec_module(module):
+            profiler.begin(name, 'import')
+            try:
+                exec_module(module)
+            finally:
+                profiler.end()
+
+        timed_exec_module._profiled = True
+        loader.exec_module = timed_exec_module
+
+
+class StartupProfiler:
+    """
+    모듈 가져오기와 초기화 단계의 벽시계 시간 기록
+
+    스레드별 스택으로 중첩을 추적하여 각 항목의 전체 시간과 자기 시간(하위 항목 제외)을 계산합니다.
+    단계 기록은 항상 켜져 있고, import 측정과 보고서 저장은 start()를 호출했을 때만 동작합니다.
+    """
+
+    def __init__(self, origin=None):
+        """
+        프로파일러 초기화 (start를 호출해야 import 측정 시작)
+
+        Args:
+            origin: 시간 기준점 (perf_counter 값, None이면 지금)
+        """
+        self.origin = time.perf_counter() if origin is None else origin
+        self.events = []  # [(이름, 분류, 시작, 종료, 자기 시간, 스레드 ID)]
+        self.enabled = False
+        self._main_thread = threading.get_ident()
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._finder = None
+        self._file_stem = None
+
+    def start(self):
+        """import 측정 시작 (보고서 저장도 켜짐)"""
+        self.enabled = True
+        if self._finder is None:
+            self._finder = _ImportTimer(self)
+            sys.meta_path.insert(0, self._finder)
+
+    def stop(self):
+        """import 측정 중지"""
+        if self._finder is not None:
+            try:
+                sys.meta_path.remove(self._finder)
+            except ValueError:
+                pass
+            self._finder = None
+
+    def _stack(self):
+        """현재 스레드의 진행 중 항목 스택 [[이름, 분류, 시작, 하위 시간]]"""
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def begin(self, name, category):
+        """항목 시작"""
+        self._stack().append([name, category, time.perf_counter(), 0.0])
+
+    def end(self):
+        """가장 최근 항목 종료"""
+        stack = self._stack()
+        name, category, start, child_time = stack.pop()
+        finish = time.perf_counter()
+        elapsed = finish - start
+        if stack:
+            stack[-1][3] += elapsed
+        with self._lock:
+            self.events.append((name, category, start, finish, elapsed - child_time, threading.get_ident()))
+
+    @contextmanager
+    def phase(self, name):
+        """초기화 단계 측정 (with 블록)"""
+        self.begin(name, 'phase')
+        try:
+            yield
+        finally:
+            self.end()
+
+    def summary(self):
+        """
+        메인 스레드 최상위 단계의 한 줄 요약 (로그용)
+
+        Returns:
+            "시작 시간: 단계 Nms, ... (합계 Nms)" 문자열
+        """
+        with self._lock:
+            events = list(self.events)
+
+        phases = []
+        for event in sorted(events, key=lambda event: event[2]):
+            name, category, start, finish, _, tid = event
+            if category != 'phase' or tid != self._main_thread:
+                continue
+            # 다른 단계 안에 중첩된 단계는 제외
+            if phases and start < phases[-1][3]:
+                continue
+            phases.append(event)
+
+        total = (phases[-1][3] - self.origin) * 1000 if phases else 0.0
+        parts = ', '.join(f"{name} {(finish - start) * 1000:.0f}ms" for name, _, start, finish, _, _ in phases)
+        return f"시작 시간: {parts} (합계 {total:.0f}ms)"
+
+    def report(self):
+        """
+        정렬된 보고서 문자열 생성
+
+        Returns:
+            보고서 텍스트 (단계는 시작 순, import는 자기 시간 내림차순)
+        """
+        with self._lock:
+            events = list(self.events)
+
+        phases = sorted((event for event in events if event[1] == 'phase'), key=lambda event: event[2])
+        imports = sorted((event for event in events if event[1] == 'import'), key=lambda event: -event[4])
+        import_total = sum(event[4] for event in imports)
+
+        lines = [f"Startup profile ({datetime.now().isoformat(timespec='seconds')})", "",
+                 "[Phases]  start(ms)   total(ms)"]
+        for name, _, start, finish, _, _ in phases:
+            lines.append(f"  {(start - self.origin) * 1000:9.1f} {(finish - start) * 1000:11.1f}  {name}")
+
+        lines += ["", f"[Imports] {len(imports)} modules, {import_total * 1000:.1f}ms total (self time)",
+                  "   self(ms)  total(ms)  module"]
+        for name, _, start, finish, self_time, _ in imports:
+            lines.append(f"  {self_time * 1000:9.2f} {(finish - start) * 1000:10.2f}  {name}")
+
+        return '\n'.join(lines) + '\n'
+
+    def chrome_trace(self):
+        """Chrome trace 형식 딕셔너리 (complete 이벤트, 마이크로초 단위)"""
+        with self._lock:
+            events = list(self.events)
+
+        pid = os.getpid()
+        return {
+            'displayTimeUnit': 'ms',
+            'traceEvents': [
+                {'name': name, 'cat': category, 'ph': 'X', 'pid': pid, 'tid': tid,
+                 'ts': round((start - self.origin) * 1e6, 1), 'dur': round((finish - start) * 1e6, 1)}
+                for name, category, start, finish, _, tid in events
+            ]
+        }
+
+    def write(self, log_dir='logs'):
+        """
+        보고서와 Chrome trace 저장 (같은 실행에서 다시 호출하면 덮어씀)
+
+        Args:
+            log_dir: 저장 폴더
+
+        Returns:
+            (보고서 경로, trace 경로) (프로파일링이 꺼져 있으면 None)
+        """
+        if not self.enabled:
+            return None
+
+        log_path = Path(log_dir)
+        log_path.mkdir(exist_ok=True)
+        if self._file_stem is None:
+            self._file_stem = f"startup_profile_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+
+        report_file = log_path / f"{self._file_stem}.txt"
+        trace_file = log_path / f"{self._file_stem}.json"
+        with open(report_file, 'w', encoding='utf-8') as f:
+            f.write(self.report())
+        with open(trace_file, 'w', encoding='utf-8') as f:
+            json.dump(self.chrome_trace(), f)
+        return report_file, trace_file
+
+
+# 전역 인스턴스
+_global_profiler = StartupProfiler()
+
+
+def start_startup_profiler(argv=None, origin=None):
+    """
+    전역 프로파일러 준비 (환경 변수나 명령줄 옵션이 있으면 import 측정 시작)
+
+    명령줄 옵션(PROFILE_FLAG)은 argv에서 제거됩니다.
+
+    Args:
+        argv: 명령줄 인자 리스트 (기본값: sys.argv)
+        origin: 시간 기준점 (perf_counter 값, 프로세스 시작 직후 값을 넘기면 단계 요약의 합계에 포함)
+
+    Returns:
+        전역 프로파일러 (꺼져 있으면 단계만 기록)
+    """
+    argv = sys.argv if argv is None else argv
+    if origin is not None:
+        _global_profiler.origin = origin
+
+    enabled = os.environ.get(PROFILE_ENV_VAR, '').strip().lower() not in ('', '0', 'false', 'no')
+    if PROFILE_FLAG in argv:
+        argv.remove(PROFILE_FLAG)
+        enabled = True
+
+    if enabled:
+        _global_profiler.start()
+    return _global_profiler
+
+
+def get_profiler():
+    """전역 프로파일러 인스턴스 반환"""
+    return _global_profiler
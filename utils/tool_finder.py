@@ -2,6 +2,10 @@
 외부 도구 자동 탐지 모듈
 """
 import os
+import re
+import sys
+import json
+from collections import deque
 from pathlib import Path
 from utils.logger import get_logger
 
@@ -9,6 +13,20 @@ from utils.logger import get_logger
 class ToolFinder:
     """외부 도구를 자동으로 찾는 클래스"""
 
+    # 하위 폴더 탐색 최대 깊이 (base_dir = 0)
+    MAX_DEPTH = 3
+
+    # 탐색하지 않는 폴더 이름
+    SKIP_DIRS = {'.git', '__pycache__', 'logs', 'build', 'dist', 'venv', '.venv',
+                 'node_modules', 'languages', 'nxd', 'pzd', 'text', 'system'}
+
+    # 언팩된 게임 데이터 폴더 (get_output_folder_from_pac이 만드는 PAC 이름 폴더, 예: 0004.ja)
+    DATA_DIR_PATTERN = re.compile(r'^\d{4}(\.[A-Za-z_-]+)?$')
+
+    # 탐지 결과 캐시 파일 (base_dir에 저장)
+    CACHE_FILE = '.tool_cache.json'
+    CACHE_VERSION = 2
+
     def __init__(self):
         """도구 찾기 초기화"""
         self.logger = get_logger()
@@ -19,6 +37,7 @@ class ToolFinder:
         else:
             # 일반 Python 스크립트로 실행되는 경우
             self.base_dir = Path(__file__).parent.parent
+        self._cache = None
 
     def find_ff16tools(self):
         """
@@ -27,32 +46,18 @@ class ToolFinder:
         Returns:
             FF16Tools.CLI.exe 경로 (str) 또는 None
         """
-        # 1. ff16tools 폴더 내에서 찾기
-        ff16tools_folder = self.base_dir / 'ff16tools'
-        if ff16tools_folder.exists():
-            exe_path = ff16tools_folder / 'FF16Tools.CLI.exe'
-            if exe_path.exists():
-                self.logger.info(f"FF16Tools 찾음: {exe_path}")
-                return str(exe_path)
-
-        # 2. FF16Tools 폴더 (대문자) 확인
-        ff16tools_folder_upper = self.base_dir / 'FF16Tools'
-        if ff16tools_folder_upper.exists():
-            exe_path = ff16tools_folder_upper / 'FF16Tools.CLI.exe'
-            if exe_path.exists():
-                self.logger.info(f"FF16Tools 찾음: {exe_path}")
-                return str(exe_path)
-
-        # 3. 현재 디렉토리에서 직접 찾기
-        exe_path = self.base_dir / 'FF16Tools.CLI.exe'
-        if exe_path.exists():
-            self.logger.info(f"FF16Tools 찾음: {exe_path}")
-            return str(exe_path)
-
-        # 4. 하위 폴더 재귀 검색
-        for exe_path in self.base_dir.rglob('FF16Tools.CLI.exe'):
+        # 1. 알려진 위치 확인 (ff16tools, FF16Tools 폴더, 현재 디렉토리)
+        candidates = [
+            self.base_dir / 'ff16tools' / 'FF16Tools.CLI.exe',
+            self.base_dir / 'FF16Tools' / 'FF16Tools.CLI.exe',
+            self.base_dir / 'FF16Tools.CLI.exe',
+        ]
+
+        # 2. 하위 폴더 제한 검색 (캐시 사용)
+        exe_path = self._find_tool('ff16tools', candidates, ['FF16Tools.CLI.exe'])
+        if exe_path:
             self.logger.info(f"FF16Tools 찾음: {exe_path}")
-            return str(exe_path)
+            return exe_path
 
         self.logger.warning("FF16Tools.CLI.exe를 찾을 수 없음")
         return None
@@ -64,30 +69,145 @@ class ToolFinder:
         Returns:
             ffttic-nxdtext.exe 경로 (str) 또는 None
         """
-        # 1. 현재 디렉토리에서 찾기
-        exe_path = self.base_dir / 'ffttic-nxdtext.exe'
-        if exe_path.exists():
+        # 1. 현재 디렉토리 확인 (변형된 이름 포함)
+        candidates = [
+            self.base_dir / 'ffttic-nxdtext.exe',
+            self.base_dir / 'ffticcnxdtext.exe',
+        ]
+
+        # 2. 하위 폴더 제한 검색 (캐시 사용)
+        exe_path = self._find_tool('ffttic_nxdtext', candidates, ['ffttic-nxdtext.exe', 'ffticcnxdtext.exe'])
+        if exe_path:
             self.logger.info(f"ffttic-nxdtext 찾음: {exe_path}")
-            return str(exe_path)
+            return exe_path
 
-        # 2. 변형된 이름 확인 (하이픈 제거)
-        exe_path_alt = self.base_dir / 'ffticcnxdtext.exe'
-        if exe_path_alt.exists():
-            self.logger.info(f"ffttic-nxdtext 찾음: {exe_path_alt}")
-            return str(exe_path_alt)
+        self.logger.warning("ffttic-nxdtext.exe를 찾을 수 없음")
+        return None
 
-        # 3. 하위 폴더 재귀 검색
-        for exe_path in self.base_dir.rglob('ffttic-nxdtext.exe'):
-            self.logger.info(f"ffttic-nxdtext 찾음: {exe_path}")
-            return str(exe_path)
+    def _find_tool(self, key, candidates, names):
+        """
+        알려진 위치 → 캐시 → 제한 검색 순으로 도구 찾기
 
-        # 4. 변형된 이름으로 재귀 검색
-        for exe_path in self.base_dir.rglob('ffticcnxdtext.exe'):
-            self.logger.info(f"ffttic-nxdtext 찾음: {exe_path}")
-            return str(exe_path)
+        찾은 경로는 그대로, 찾지 못한 결과는 탐색한 폴더 상태와 함께 캐시합니다.
+        하위 폴더는 수정 시각으로, base_dir은 탐색 대상 하위 폴더 목록으로 비교합니다.
+        (base_dir에는 캐시/설정 파일이 저장되어 수정 시각이 계속 바뀌기 때문)
 
-        self.logger.warning("ffttic-nxdtext.exe를 찾을 수 없음")
-        return None
+        Args:
+            key: 캐시 키
+            candidates: 먼저 확인할 경로 리스트
+            names: 검색할 파일 이름 리스트 (앞쪽이 우선)
+
+        Returns:
+            경로 (str) 또는 None
+        """
+        for candidate in candidates:
+            if candidate.is_file():
+                return str(candidate)
+
+        cache = self._load_cache()
+        cached = cache.get(key)
+        if cached:
+            if cached.get('path'):
+                if Path(cached['path']).is_file():
+                    return cached['path']
+            elif self._fingerprint_matches(cached.get('fingerprint')):
+                self.logger.info(f"도구 탐지 캐시 사용 (없음): {', '.join(names)}")
+                return None
+
+        found, fingerprint = self._scan(names)
+        cache[key] = {'path': found, 'fingerprint': {} if found else fingerprint}
+        self._save_cache()
+        return found
+
+    def _scan(self, names):
+        """
+        base_dir 아래를 MAX_DEPTH까지 너비 우선 탐색 (데이터 폴더 제외)
+
+        Args:
+            names: 검색할 파일 이름 리스트 (앞쪽이 우선)
+
+        Returns:
+            (찾은 경로 또는 None, {'subdirs': base_dir의 탐색 대상 폴더 이름 목록,
+                                  'mtimes': {탐색한 하위 폴더: 수정 시각(ns)}})
+        """
+        targets = {name.lower(): rank for rank, name in enumerate(names)}
+        mtimes = {}
+        fingerprint = {'subdirs': self._base_subdirs(), 'mtimes': mtimes}
+        queue = deque([(str(self.base_dir), 0)])
+
+        while queue:
+            directory, depth = queue.popleft()
+            try:
+                if depth > 0:
+                    mtimes[directory] = os.stat(directory).st_mtime_ns
+                best = None
+                with os.scandir(directory) as iterator:
+                    for entry in iterator:
+                        name = entry.name
+                        if entry.is_dir(follow_symlinks=False):
+                            if depth < self.MAX_DEPTH and not self._is_skipped(name):
+                                queue.append((entry.path, depth + 1))
+                        else:
+                            rank = targets.get(name.lower())
+                            if rank is not None and (best is None or rank < best[0]):
+                                best = (rank, entry.path)
+                if best:
+                    return best[1], fingerprint
+            except OSError as e:
+                self.logger.warning(f"도구 탐색 중 폴더 접근 실패 ({directory}): {e}")
+
+        return None, fingerprint
+
+    def _is_skipped(self, name):
+        """탐색하지 않을 폴더인지 확인"""
+        return (name.startswith('.') or name.lower() in self.SKIP_DIRS
+                or self.DATA_DIR_PATTERN.match(name) is not None)
+
+    def _base_subdirs(self):
+        """base_dir 바로 아래의 탐색 대상 폴더 이름 목록 (정렬)"""
+        try:
+            with os.scandir(self.base_dir) as iterator:
+                return sorted(entry.name for entry in iterator
+                              if entry.is_dir(follow_symlinks=False) and not self._is_skipped(entry.name))
+        except OSError:
+            return None
+
+    def _fingerprint_matches(self, fingerprint):
+        """캐시된 base_dir 하위 폴더 목록과 하위 폴더 수정 시각이 모두 그대로인지 확인"""
+        if not fingerprint or fingerprint.get('subdirs') is None:
+            return False
+        if self._base_subdirs() != fingerprint['subdirs']:
+            return False
+        try:
+            return all(os.stat(directory).st_mtime_ns == mtime_ns
+                       for directory, mtime_ns in fingerprint.get('mtimes', {}).items())
+        except OSError:
+            return False
+
+    def _load_cache(self):
+        """탐지 결과 캐시 로드"""
+        if self._cache is not None:
+            return self._cache
+
+        self._cache = {}
+        cache_file = self.base_dir / self.CACHE_FILE
+        if cache_file.exists():
+            try:
+                with open(cache_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get('version') == self.CACHE_VERSION:
+                    self._cache = data.get('tools', {})
+            except Exception as e:
+                self.logger.warning(f"도구 탐지 캐시 로드 실패: {e}")
+        return self._cache
+
+    def _save_cache(self):
+        """탐지 결과 캐시 저장"""
+        try:
+            with open(self.base_dir / self.CACHE_FILE, 'w', encoding='utf-8') as f:
+                json.dump({'version': self.CACHE_VERSION, 'tools': self._cache}, f, ensure_ascii=False)
+        except Exception as e:
+            self.logger.warning(f"도구 탐지 캐시 저장 실패: {e}")
 
     def get_output_folder_from_pac(self, pac_file_path):
         """
@@ -111,10 +231,6 @@ class ToolFinder:
         return str(output_folder)
 
 
-# sys 모듈 import
-import sys
-
-
 # 전역 인스턴스
 _global_tool_finder = None
 